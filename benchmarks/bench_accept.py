@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+str/accept(...) with 10k entry accept lists, compared against
+a linear scan through the list (what accept used to do)
+
+run via `python benchmarks/bench_accept.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+
+import os
+import tempfile
+
+N_VALUES = 10000
+
+
+def main():
+    accept = [f"SKU-{i:06d}" for i in range(N_VALUES)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        accept_path = os.path.join(tmp_dir, "skus.txt")
+        with open(accept_path, "w") as accept_file:
+            accept_file.write("\n".join(accept))
+
+        inline_text = f"sku : str/accept({accept})"
+        file_text = f"sku : str/acceptfile(['{accept_path}'])"
+
+        seconds = best_of(lambda: ValueChecker(inline_text, use_cache=False), 10)
+        report(f"compile, {N_VALUES} values inline", seconds)
+        seconds = best_of(lambda: ValueChecker(file_text, use_cache=False), 10)
+        report(f"compile, {N_VALUES} values from a file", seconds)
+
+        interpreted = ValueChecker(file_text)
+        generated = ValueChecker(file_text, codegen=True)
+
+    last_value = {"sku": accept[-1]}
+    bad_value = {"sku": "SKU-nope"}
+
+    seconds = best_of(lambda: accept[-1] in accept, 1000)
+    report("list scan, last value", seconds)
+
+    for name, checker in [("interpreted", interpreted), ("generated", generated)]:
+        seconds = best_of(lambda: checker.check_for(last_value), 20000)
+        report(f"check_for, last value, {name}", seconds)
+        seconds = best_of(lambda: checker.check_for(bad_value), 20000)
+        report(f"check_for, invalid value, {name}", seconds)
+
+
+if __name__ == "__main__":
+    main()
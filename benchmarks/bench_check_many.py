@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+check_many(...) on a batch of records, compared against
+calling check_for(...) once per record
+
+run via `python benchmarks/bench_check_many.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+
+import random
+
+N_RECORDS = 10000
+
+checker = ValueChecker(
+    """
+    firstName : str/lenlim(5, 15)
+    email : str
+    age : int/lim(18, 99)
+    height : float/lim(1, inf)/optional
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+    """
+)
+
+
+def make_records():
+    rng = random.Random(0)
+    return [
+        {
+            "firstName": rng.choice(["Garyashver", "Gary", "Bobbington"]),
+            "email": "gary@bob.com",
+            "age": str(rng.randint(10, 110)),
+            "height": str(rng.uniform(0, 3)),
+            "team": rng.choice(["red", "blue", "purple"]),
+        }
+        for _ in range(N_RECORDS)
+    ]
+
+
+def main():
+    records = make_records()
+    columns = {key: [record[key] for record in records] for key in records[0]}
+
+    seconds = best_of(lambda: [checker.check_for(r) for r in records], 1)
+    report(f"check_for loop, {N_RECORDS} records", seconds / N_RECORDS, "record")
+    seconds = best_of(lambda: checker.check_many(records), 1)
+    report(f"check_many, {N_RECORDS} records", seconds / N_RECORDS, "record")
+    seconds = best_of(lambda: checker.check_many(columns), 1)
+    report(f"check_many, {N_RECORDS} records, columns", seconds / N_RECORDS, "record")
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    arrays = {
+        "firstName": numpy.array(columns["firstName"]),
+        "email": numpy.array(columns["email"]),
+        "age": numpy.array([int(age) for age in columns["age"]]),
+        "height": numpy.array([float(height) for height in columns["height"]]),
+        "team": numpy.array(columns["team"]),
+    }
+    seconds = best_of(lambda: checker.check_many(arrays), 1)
+    report(f"check_many, {N_RECORDS} records, numpy", seconds / N_RECORDS, "record")
+
+
+if __name__ == "__main__":
+    main()
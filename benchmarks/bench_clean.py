@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+checking a request and parsing its values again in the view, vs
+getting the cleaned values from the check (`Invigilator(clean=True)`)
+
+run via `python benchmarks/bench_clean.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import Invigilator
+from flask import Flask, g, request
+
+checker_text = """
+    firstName : str/lenlim(5, 15)
+    email : str
+    age : int/lim(18, 99)
+    height : float/lim(1, 3)
+    page : int/lim(1, inf)/default(1)
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+"""
+
+form = {
+    "firstName": "Garyashver",
+    "email": "gary@bob.com",
+    "age": "50",
+    "height": "1.8",
+    "team": "red",
+}
+
+
+def parsing_view():
+    # what views do without cleaned values
+    age = int(request.form["age"])
+    height = float(request.form["height"])
+    page = int(request.form.get("page", 1))
+    return age, height, page
+
+
+def clean_view():
+    cleaned = g.cleaned_values
+    return cleaned["age"], cleaned["height"], cleaned["page"]
+
+
+def main():
+    app = Flask(__name__)
+    checked = Invigilator().check("POST", checker_text)(parsing_view)
+    cleaned = Invigilator(clean=True).check("POST", checker_text)(clean_view)
+
+    with app.test_request_context("/", method="POST", data=form):
+        assert checked() == cleaned()
+
+        seconds = best_of(checked, 20000)
+        report("check, then parse in the view", seconds)
+
+        seconds = best_of(cleaned, 20000)
+        report("clean=True, cleaned values in the view", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+per request validation time, interpreted restrictions vs
+generated (codegen=True) checkers
+
+run via `python benchmarks/bench_codegen.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+from werkzeug.datastructures import MultiDict
+
+checker_text = """
+    firstName : str/lenlim(5, 15)
+    middleName : str/lenlim(5, inf)/optional
+    lastName : str/optional
+    email : str
+    password : str/lenlim(8, 15)
+    phone : str/lenlim(8, 15)
+    age : int/lim(18, 99)
+    height : float/lim(1, inf)/optional
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+    acceptTermsAndConditions : str/accept(['on'])/optional
+"""
+
+valid_form = MultiDict(
+    {
+        "firstName": "Garyashver",
+        "email": "GaryBob@Dan.com",
+        "password": "12345678",
+        "phone": "9120921022",
+        "age": "76",
+        "height": "1.8",
+        "team": "red",
+        "acceptTermsAndConditions": "on",
+    }
+)
+
+invalid_form = MultiDict(
+    {
+        "firstName": "Gary",
+        "password": "1234",
+        "phone": "9120921022",
+        "age": "seventy six",
+        "height": "-1",
+        "team": "purple",
+    }
+)
+
+
+def main():
+    interpreted = ValueChecker(checker_text)
+    generated = ValueChecker(checker_text, codegen=True)
+
+    forms = [
+        ("valid", valid_form),
+        ("invalid", invalid_form),
+        ("valid dict", dict(valid_form)),
+        ("invalid dict", dict(invalid_form)),
+    ]
+
+    for form_name, form in forms:
+        for name, checker in [("interpreted", interpreted), ("generated", generated)]:
+            seconds = best_of(lambda: checker.check_for(form), 20000)
+            report(f"check_for {form_name} form, {name}", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+worker startup, compiling the schemas of 2000 routes cold, vs
+loading them parsed from the disk cache (see `SchemaCache(directory=...)`)
+
+each timing starts from an empty SchemaCache, like a new worker does
+
+run via `python benchmarks/bench_disk_cache.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import SchemaCache
+
+import random
+import tempfile
+
+N_ROUTES = 2000
+
+LINE_TEMPLATES = [
+    "{0} : str/lenlim(5, 15)/optional # a comment",
+    "{0} : int/lim(-100, inf)",
+    "{0} : float/optional/lim(-inf, 0)",
+    "{0} : str/accept(['red', 'blue', \"yellow\", 'it\\'s green'])",
+    "{0} : str/lenlim(1, 255)",
+]
+
+FIELD_NAMES = [f"field_{i}" for i in range(300)]
+
+
+def generate_schemas(n_routes, seed=0):
+    """checker text for n_routes routes, of 5 to 15 fields each"""
+    rand = random.Random(seed)
+    schemas = []
+    for _ in range(n_routes):
+        names = rand.sample(FIELD_NAMES, rand.randint(5, 15))
+        lines = [rand.choice(LINE_TEMPLATES).format(name) for name in names]
+        schemas.append("\n".join("    " + line for line in lines))
+
+    return schemas
+
+
+def start_worker(schemas, directory=None):
+    cache = SchemaCache(maxsize=None, directory=directory)
+    for text in schemas:
+        cache.get(text)
+
+    return cache
+
+
+def main():
+    schemas = generate_schemas(N_ROUTES)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # the first worker fills the disk cache
+        start_worker(schemas, directory)
+
+        cold = best_of(lambda: start_worker(schemas), 1)
+        report(f"{N_ROUTES} schemas, compiled", cold, "startup")
+
+        warm = best_of(lambda: start_worker(schemas, directory), 1)
+        report(f"{N_ROUTES} schemas, from the disk cache", warm, "startup")
+        print(f"{'':<55} {cold / warm:>12.2f} x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+rejection cost of the default error handler, compared against
+building the nested dict and calling json.dumps on every rejection
+
+run via `python benchmarks/bench_error_handler.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+from flask_value_checker.error_handler import DefaultErrorHandler
+from flask import Flask, Response
+
+import json
+
+checker = ValueChecker(
+    """
+    firstName : str/lenlim(5, 15)
+    email : str
+    password : str/lenlim(8, 15)
+    age : int/lim(18, 99)
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+    """
+)
+
+
+def json_dumps_handler(errs):
+    error = {
+        "error": {
+            "code": "MALFORMED_OR_MISSING_PARAMETERS",
+            "message": "one or more fields we're either missing or malformed",
+            "fields": errs,
+        }
+    }
+    error = json.dumps(error)
+    return Response(error, status=400, mimetype="application/json")
+
+
+def main():
+    app = Flask(__name__)
+    errs = checker.check_for({})
+
+    handlers = [
+        ("json.dumps every time", json_dumps_handler),
+        ("DefaultErrorHandler, no cache", DefaultErrorHandler(cache_size=0)),
+        ("DefaultErrorHandler", DefaultErrorHandler()),
+    ]
+
+    with app.app_context():
+        for name, handler in handlers:
+            seconds = best_of(lambda: handler(errs), 20000)
+            report(f"all fields missing, {name}", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+compiling the schemas of 800 routes, which all use the same
+pagination, auth and address fields, copied into every schema, vs
+used as fragments (`include <name>`, see `register_fragment(...)`)
+
+each timing starts from an empty SchemaCache, like a new worker does,
+the memory is what the compiled schemas keep allocated
+
+run via `python benchmarks/bench_fragments.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import SchemaCache, register_fragment
+
+import gc
+import textwrap
+import tracemalloc
+
+N_ROUTES = 800
+
+FRAGMENTS = {
+    "pagination": """
+        page : int/lim(1, inf)/default(1)
+        per_page : int/lim(1, 100)/default(20)
+        sort : str/accept(['asc', 'desc'])/default('asc')
+    """,
+    "auth": """
+        token : str/lenlim(32, 64)
+        client_id : str/lenlim(1, 40)/optional
+    """,
+    "address": """
+        address.street : str/lenlim(1, 100)
+        address.city : str/lenlim(1, 50)
+        address.zip : str/lenlim(3, 10)
+        address.country : str/accept(['de', 'fr', 'uk', 'us'])
+        address.geo.lat : float/lim(-90, 90)/optional
+        address.geo.lng : float/lim(-180, 180)/optional
+    """,
+}
+
+
+def generate_schemas(use_fragments):
+    """checker text for N_ROUTES routes, of 3 own fields and every fragment"""
+    schemas = []
+    for i in range(N_ROUTES):
+        lines = [
+            f"name_{i} : str/lenlim(1, {i + 10})",
+            f"count_{i} : int/lim(0, {i + 100})",
+            f"ratio_{i} : float/lim(-{i}, {i})/optional",
+        ]
+        for name, text in FRAGMENTS.items():
+            if use_fragments:
+                lines.append(f"include {name}")
+            else:
+                lines.append(textwrap.dedent(text).strip())
+
+        schemas.append("\n".join(lines))
+
+    return schemas
+
+
+def start_worker(schemas):
+    cache = SchemaCache(maxsize=None)
+    for text in schemas:
+        cache.get(text)
+
+    return cache
+
+
+def memory_of(schemas):
+    gc.collect()
+    tracemalloc.start()
+    cache = start_worker(schemas)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return size
+
+
+def main():
+    for name, text in FRAGMENTS.items():
+        register_fragment(name, text)
+
+    copied = generate_schemas(use_fragments=False)
+    included = generate_schemas(use_fragments=True)
+
+    copied_time = best_of(lambda: start_worker(copied), 1)
+    report(f"{N_ROUTES} schemas, fragments copied", copied_time, "startup")
+    included_time = best_of(lambda: start_worker(included), 1)
+    report(f"{N_ROUTES} schemas, fragments included", included_time, "startup")
+    print(f"{'':<55} {copied_time / included_time:>12.2f} x faster")
+
+    for name, schemas in [("copied", copied), ("included", included)]:
+        size = memory_of(schemas)
+        print(f"{N_ROUTES} schemas, fragments {name:<33} {size / 1024:>12.2f} KB")
+
+
+if __name__ == "__main__":
+    main()
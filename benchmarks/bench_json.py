@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+json body validation (source="json") compared against
+hand written validation, on large json payloads
+
+run via `python benchmarks/bench_json.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+from flask import Flask
+
+
+def generate(n_fields):
+    """
+    generate checker text, a valid json payload for it
+    and a hand written validation function doing the same checks
+    """
+    lines = []
+    payload = {}
+    for i in range(n_fields):
+        kind = i % 3
+        if kind == 0:
+            lines.append(f"name_{i} : str/lenlim(1, 20)")
+            payload[f"name_{i}"] = "some name"
+        elif kind == 1:
+            lines.append(f"count_{i} : int/lim(0, 1000)")
+            payload[f"count_{i}"] = i
+        else:
+            lines.append(f"ratio_{i} : float/lim(0, 1)/optional")
+            payload[f"ratio_{i}"] = 0.5
+
+    def hand_written(body):
+        errs = {}
+        for i in range(n_fields):
+            kind = i % 3
+            if kind == 0:
+                value = body.get(f"name_{i}")
+                if value is None:
+                    errs[f"name_{i}"] = "value is required"
+                elif not isinstance(value, str) or not 1 <= len(value) <= 20:
+                    errs[f"name_{i}"] = "bad value"
+            elif kind == 1:
+                value = body.get(f"count_{i}")
+                if value is None:
+                    errs[f"count_{i}"] = "value is required"
+                elif type(value) is not int or not 0 <= value <= 1000:
+                    errs[f"count_{i}"] = "bad value"
+            else:
+                value = body.get(f"ratio_{i}")
+                if value is not None:
+                    if type(value) not in (int, float) or not 0 <= value <= 1:
+                        errs[f"ratio_{i}"] = "bad value"
+        return errs or None
+
+    return "\n".join(lines), payload, hand_written
+
+
+def main():
+    app = Flask(__name__)
+
+    for n_fields in [10, 100, 1000]:
+        text, payload, hand_written = generate(n_fields)
+        interpreted = ValueChecker(text)
+        generated = ValueChecker(text, codegen=True)
+        assert interpreted.check_for(payload) is None
+        assert generated.check_for(payload) is None
+        assert hand_written(payload) is None
+
+        number = max(10, 20000 // n_fields)
+        for name, check in [
+            ("hand written", hand_written),
+            ("ValueChecker", interpreted.check_for),
+            ("ValueChecker codegen", generated.check_for),
+        ]:
+            seconds = best_of(lambda: check(payload), number)
+            report(f"{n_fields} fields, {name}", seconds)
+
+        # through a request, flask parses the body once and caches it
+        with app.test_request_context(method="POST", json=payload):
+            seconds = best_of(lambda: generated.check(source="json"), number)
+            report(f"{n_fields} fields, ValueChecker codegen (request)", seconds)
+
+
+if __name__ == "__main__":
+    main()
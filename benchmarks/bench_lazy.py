@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+decorating many routes, with and without Invigilator(lazy=True),
+the schema cache is skipped so every route's text is compiled
+
+run via `python benchmarks/bench_lazy.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import Invigilator, schema_cache
+
+N_ROUTES = 200
+
+
+def make_texts():
+    return [
+        f"""
+        firstName{i} : str/lenlim(5, 15)
+        email : str
+        age : int/lim(18, 99)
+        height : float/lim(1, inf)/optional
+        team : str/accept(["red", "blue", "yellow", "green", "orange"])
+        """
+        for i in range(N_ROUTES)
+    ]
+
+
+def view():
+    return "hi"
+
+
+def decorate_all(lazy):
+    schema_cache.clear()
+    invigilator = Invigilator(lazy=lazy)
+    for text in make_texts():
+        invigilator.check("POST", text)(view)
+    return invigilator
+
+
+def main():
+    seconds = best_of(lambda: decorate_all(lazy=False), 1)
+    report(f"decorate {N_ROUTES} routes", seconds)
+    seconds = best_of(lambda: decorate_all(lazy=True), 1)
+    report(f"decorate {N_ROUTES} routes, lazy", seconds)
+    seconds = best_of(lambda: decorate_all(lazy=True).warmup(), 1)
+    report(f"decorate {N_ROUTES} routes, lazy, then warmup()", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+list fields and nested (dotted) fields, the cost of checking lists
+by their length, rejecting lists over their maximum count, and
+resolving nested json fields
+
+run via `python benchmarks/bench_lists.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+from werkzeug.datastructures import MultiDict
+
+list_text = """
+    tags : list of str/lenlim(1, 20)/count(0, 50)
+    scores : list of int/lim(0, 100)/optional
+"""
+
+nested_text = """
+    name : str/lenlim(1, 20)
+    address.city : str/lenlim(1, 20)
+    address.zip : str/lenlim(5, 5)
+    address.geo.lat : float/lim(-90, 90)
+    address.geo.lng : float/lim(-180, 180)
+"""
+
+flat_text = """
+    name : str/lenlim(1, 20)
+    city : str/lenlim(1, 20)
+    zip : str/lenlim(5, 5)
+    lat : float/lim(-90, 90)
+    lng : float/lim(-180, 180)
+"""
+
+
+def main():
+    checker = ValueChecker(list_text)
+
+    for n_items in [1, 10, 50]:
+        body = {"tags": ["tag"] * n_items, "scores": list(range(n_items))}
+        seconds = best_of(lambda: checker.check_for(body), 20000)
+        report(f"json lists of {n_items} items", seconds)
+
+        args = MultiDict([("tags", "tag")] * n_items)
+        seconds = best_of(lambda: checker.check_for(args), 20000)
+        report(f"repeated query parameter, {n_items} values", seconds)
+
+    # rejected by its count, before a single item is looked at
+    giant = {"tags": ["tag"] * 1000000}
+    seconds = best_of(lambda: checker.check_for(giant), 20000)
+    report("json list of 1000000 items, over count(0, 50)", seconds)
+
+    nested = ValueChecker(nested_text)
+    flat = ValueChecker(flat_text)
+    nested_body = {
+        "name": "bob",
+        "address": {"city": "paris", "zip": "75001", "geo": {"lat": 48.8, "lng": 2.3}},
+    }
+    flat_body = {"name": "bob", "city": "paris", "zip": "75001", "lat": 48.8, "lng": 2.3}
+
+    seconds = best_of(lambda: flat.check_for(flat_body), 20000)
+    report("flat json, 5 fields", seconds)
+    seconds = best_of(lambda: nested.check_for(nested_body), 20000)
+    report("nested json, 5 fields (4 dotted)", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+memory used by compiled checkers, 100 tenants' schemas of 100 fields
+each (10k fields), where most fields are the same between tenants
+
+run via `python benchmarks/bench_memory.py`
+"""
+import helper  # adds the package to sys.path
+
+from flask_value_checker import ValueChecker, schema_cache
+
+import gc
+import tracemalloc
+
+N_SCHEMAS = 100
+N_FIELDS = 100
+
+
+def make_texts():
+    texts = []
+    for schema in range(N_SCHEMAS):
+        lines = []
+        for field in range(N_FIELDS):
+            kind = field % 4
+            if kind == 0:
+                lines.append(f"name{field} : str/lenlim(1, {field + 10})")
+            elif kind == 1:
+                lines.append(f"count{field} : int/lim(0, {field * 10})/optional")
+            elif kind == 2:
+                lines.append(f"ratio{field} : float/lim(0, 1)")
+            else:
+                lines.append(f"team{field} : str/accept(['red', 'blue', 'green'])")
+        # one field differing between every tenant
+        lines.append(f"tenant : str/accept(['tenant{schema}'])")
+        texts.append("\n".join(lines))
+    return texts
+
+
+def measure(name, make_checkers):
+    """print out the memory kept by the checkers made"""
+    schema_cache.clear()
+    gc.collect()
+
+    tracemalloc.start()
+    checkers = make_checkers()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_fields = sum(len(checker.checkers) for checker in checkers)
+    n_restrictions = len(
+        {id(r) for checker in checkers for r in checker.checkers.values()}
+    )
+    print(f"{name}, {n_fields} fields, {n_restrictions} restrictions")
+    print(f"{'  retained memory':<55} {current / 1024:>12.1f} KiB")
+    print(f"{'  retained memory per field':<55} {current / n_fields:>12.1f} B")
+
+
+def main():
+    texts = make_texts()
+    measure(
+        f"{N_SCHEMAS} schemas",
+        lambda: [ValueChecker(text) for text in texts],
+    )
+    measure(
+        f"{N_SCHEMAS} schemas, use_cache=False",
+        lambda: [ValueChecker(text, use_cache=False) for text in texts],
+    )
+
+
+if __name__ == "__main__":
+    main()
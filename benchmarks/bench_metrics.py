@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+the cost of checking a request with and without metrics, calling
+the wrapped view directly, inside a request context
+
+run via `python benchmarks/bench_metrics.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import Invigilator, InMemoryMetrics
+from flask import Flask
+
+checker_text = """
+    firstName : str/lenlim(5, 15)
+    email : str
+    age : int/lim(18, 99)
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+"""
+
+form = {
+    "firstName": "Garyashver",
+    "email": "gary@bob.com",
+    "age": "50",
+    "team": "red",
+}
+
+
+def view():
+    return "hi"
+
+
+def main():
+    app = Flask(__name__)
+    invigilators = [
+        ("no metrics", Invigilator()),
+        ("InMemoryMetrics", Invigilator(metrics=InMemoryMetrics())),
+        (
+            "InMemoryMetrics, field_timings",
+            Invigilator(metrics=InMemoryMetrics(field_timings=True)),
+        ),
+    ]
+
+    with app.test_request_context("/", method="POST", data=form):
+        for name, invigilator in invigilators:
+            wrapped = invigilator.check("POST", checker_text)(view)
+            seconds = best_of(wrapped, 20000)
+            report(f"valid request, {name}", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+validate_csv(...) throughput and peak memory, the peak memory
+should be the same for any number of rows
+
+run via `python benchmarks/bench_offline.py`
+"""
+from helper import report
+
+from flask_value_checker import validate_csv
+
+import io
+import time
+import tracemalloc
+
+checker_text = """
+    firstName : str/lenlim(5, 15)
+    email : str
+    age : int/lim(18, 99)
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+"""
+
+
+def make_csv(n_rows):
+    rows = ["firstName,email,age,team"]
+    for i in range(n_rows):
+        rows.append(f"Garyashver,gary@bob.com,{i % 120},{'red' if i % 7 else 'pink'}")
+    return io.BytesIO("\n".join(rows).encode("utf-8"))
+
+
+def main():
+    for n_rows in [10000, 100000]:
+        file = make_csv(n_rows)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        n_errors = sum(1 for _ in validate_csv(checker_text, file))
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        name = f"validate_csv, {n_rows} rows ({n_errors} invalid)"
+        report(name, seconds / n_rows, "row")
+        print(f"{'  peak memory':<55} {peak / 1024:>12.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+check_many(...) on a large batch, in this process compared
+against worker processes
+
+run via `python benchmarks/bench_parallel.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker import ValueChecker
+
+import os
+import random
+
+N_RECORDS = 200000
+
+checker = ValueChecker(
+    """
+    firstName : str/lenlim(5, 15)
+    email : str
+    age : int/lim(18, 99)
+    height : float/lim(1, inf)/optional
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+    """
+)
+
+
+def make_records():
+    rng = random.Random(0)
+    return [
+        {
+            "firstName": rng.choice(["Garyashver", "Gary", "Bobbington"]),
+            "email": "gary@bob.com",
+            "age": str(rng.randint(10, 110)),
+            "height": str(rng.uniform(0, 3)),
+            "team": rng.choice(["red", "blue", "purple"]),
+        }
+        for _ in range(N_RECORDS)
+    ]
+
+
+def main():
+    records = make_records()
+
+    seconds = best_of(lambda: checker.check_many(records), 1, repeat=3)
+    report(f"check_many, {N_RECORDS} records", seconds / N_RECORDS, "record")
+
+    for processes in sorted({2, os.cpu_count() or 1}):
+        seconds = best_of(
+            lambda: checker.check_many(records, processes=processes), 1, repeat=3
+        )
+        name = f"check_many, {N_RECORDS} records, {processes} processes"
+        report(name, seconds / N_RECORDS, "record")
+
+
+if __name__ == "__main__":
+    main()
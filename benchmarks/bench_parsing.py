@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+parse throughput of RestrictionParser,
+compared against the original character by character parser
+
+run via `python benchmarks/bench_parsing.py`
+"""
+from helper import best_of, report
+
+from flask_value_checker.restrictions.parsing import RestrictionParser
+from tests.legacy_parsing import LegacyRestrictionParser
+
+import random
+
+LINE_TEMPLATES = [
+    "field_{0} : str/lenlim(5, 15)/optional # a comment",
+    "field_{0} : int/lim(-100, inf)",
+    "field_{0} : float/optional/lim(-inf, 0)",
+    "field_{0} : str/accept(['red', 'blue', \"yellow\", 'it\\'s green'])",
+    "field_{0} : file/optional",
+]
+
+
+def generate_schema(n_lines, seed=0):
+    """generate n_lines of checker text"""
+    rand = random.Random(seed)
+    return [
+        "    " + rand.choice(LINE_TEMPLATES).format(i) for i in range(n_lines)
+    ]
+
+
+def parse_all(Parser, lines):
+    for line in lines:
+        Parser(line)
+
+
+def main():
+    for n_lines in [10, 1000, 10000]:
+        lines = generate_schema(n_lines)
+        n_chars = sum(len(line) for line in lines)
+        number = max(1, 10000 // n_lines)
+
+        for Parser in [LegacyRestrictionParser, RestrictionParser]:
+            seconds = best_of(lambda: parse_all(Parser, lines), number)
+            report(f"{Parser.__name__} {n_lines} lines", seconds, "schema")
+            print(f"{'':<55} {n_chars / seconds / 1e6:>12.2f} Mchars/s")
+
+
+if __name__ == "__main__":
+    main()
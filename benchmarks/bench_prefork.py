@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+memory of a pre-fork worker (i.e. gunicorn), with the checkers of
+2000 routes compiled in every worker (lazy), compiled once before
+forking (`Invigilator.freeze()`), and compiled and gc frozen before
+forking (`Invigilator.freeze(gc_freeze=True)`)
+
+a worker's private dirty memory is what it doesn't share with the
+master, measured after a full garbage collection and some requests,
+which is what happens in a long lived worker
+
+linux only (it reads /proc/self/smaps_rollup), every mode runs in its
+own freshly forked master
+
+run via `python benchmarks/bench_prefork.py`
+"""
+import helper  # adds the package to sys.path
+
+from flask_value_checker import Invigilator
+from flask import Flask
+
+import gc
+import os
+import random
+
+N_ROUTES = 2000
+N_REQUESTS = 200
+
+LINE_TEMPLATES = [
+    "{0} : str/lenlim(5, 15)/optional",
+    "{0} : int/lim(-100, inf)",
+    "{0} : float/optional/lim(-inf, 0)",
+    "{0} : str/accept(['red', 'blue', \"yellow\", 'green'])",
+]
+
+
+def private_dirty_kb():
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1])
+
+
+def make_app(invigilator, seed=0):
+    """an app with N_ROUTES routes, of 5 to 15 (distinct) fields each"""
+    rand = random.Random(seed)
+    app = Flask(__name__)
+
+    for i in range(N_ROUTES):
+        lines = [
+            rand.choice(LINE_TEMPLATES).format(f"route_{i}_field_{j}")
+            for j in range(rand.randint(5, 15))
+        ]
+
+        def view():
+            return "hi"
+
+        view = invigilator.check("POST", "\n".join(lines))(view)
+        app.add_url_rule(f"/route_{i}", f"route_{i}", view, methods=["POST"])
+
+    return app
+
+
+def worker(invigilator, app):
+    """what a worker does, returns its private dirty memory"""
+    invigilator.warmup()
+    client = app.test_client()
+    for i in range(N_REQUESTS):
+        client.post(f"/route_{i * (N_ROUTES // N_REQUESTS)}", data={})
+
+    gc.collect()
+    return private_dirty_kb()
+
+
+def run_master(mode):
+    invigilator = Invigilator(lazy=mode == "lazy")
+    app = make_app(invigilator)
+    if mode == "freeze()":
+        invigilator.freeze()
+    elif mode == "freeze(gc_freeze=True)":
+        invigilator.freeze(gc_freeze=True)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, str(worker(invigilator, app)).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as result:
+        worker_kb = int(result.read())
+    os.waitpid(pid, 0)
+    return worker_kb
+
+
+def main():
+    for mode in ["lazy", "freeze()", "freeze(gc_freeze=True)"]:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # a fresh master for every mode
+            os.close(read_fd)
+            os.write(write_fd, str(run_master(mode)).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as result:
+            worker_kb = int(result.read())
+        os.waitpid(pid, 0)
+
+        print(f"{N_ROUTES} routes, {mode:<40} {worker_kb / 1024:>12.2f} MB/worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import os
+import sys
+import timeit
+
+bench_dir_path = os.path.dirname(os.path.realpath(__file__))
+main_dir = os.path.dirname(bench_dir_path)
+sys.path.append(main_dir)
+
+
+def best_of(func, number, repeat=5):
+    """
+    time a function,
+
+    Returns
+    -------
+    float
+        the best time (out of `repeat` runs) for a single call, in seconds
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(name, seconds, unit="call"):
+    """print out a timing"""
+    print(f"{name:<55} {seconds * 1e6:>12.2f} us/{unit}")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+the benchmark suite, times compiling checker text, checking payloads
+of different widths, and whole requests through the flask test client
+(form, json and multipart), and compares the timings against a saved
+baseline, so regressions are caught before a release
+
+    python benchmarks/run.py                             # run everything
+    python benchmarks/run.py -k check_for                # only matching benchmarks
+    python benchmarks/run.py --save baseline.json        # save a baseline
+    python benchmarks/run.py --compare baseline.json     # compare against it
+
+with --compare, the exit status is 1 if any benchmark got slower by
+more than --threshold (20% by default), compare baselines made on the
+same machine, timings from different machines aren't comparable
+"""
+from helper import best_of, report
+
+import flask_value_checker
+from flask_value_checker import Invigilator, ValueChecker
+from flask_value_checker.restrictions import make_restrictions
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+import argparse
+import io
+import json
+import platform
+import sys
+
+# one field of every kind, repeated to make wider schemas
+FIELD_TEMPLATES = [
+    ("field_{0} : str/lenlim(5, 15)", "abcdefgh", "abc"),
+    ("field_{0} : int/lim(18, 99)", "50", "fifty"),
+    ("field_{0} : float/lim(0, 10)/optional", "2.5", "-1"),
+    ("field_{0} : str/accept(['red', 'blue', 'green'])", "blue", "purple"),
+    ("field_{0} : str/optional", "anything", 5),
+]
+
+WIDTHS = [5, 50, 500]
+
+# a benchmark is (name, function, calls per timing, unit)
+benchmarks = []
+
+
+def benchmark(name, number, unit="call"):
+    """add a function to the suite"""
+
+    def decorator(func):
+        benchmarks.append((name, func, number, unit))
+        return func
+
+    return decorator
+
+
+def generate_schema(width):
+    """
+    Returns
+    -------
+    (str, dict, dict)
+        checker text with `width` fields, a valid payload and
+        a payload with every field invalid
+    """
+    lines = []
+    valid = {}
+    invalid = {}
+    for i in range(width):
+        line, valid_value, invalid_value = FIELD_TEMPLATES[i % len(FIELD_TEMPLATES)]
+        lines.append("    " + line.format(i))
+        valid[f"field_{i}"] = valid_value
+        invalid[f"field_{i}"] = invalid_value
+
+    return "\n".join(lines), valid, invalid
+
+
+def add_compile_benchmarks():
+    for width, number in [(10, 500), (1000, 5)]:
+        text, _, _ = generate_schema(width)
+        benchmark(f"make_restrictions {width} fields", number, "schema")(
+            lambda text=text: make_restrictions(text, share=False)
+        )
+
+
+def add_check_for_benchmarks():
+    for width in WIDTHS:
+        text, valid, invalid = generate_schema(width)
+        # form data only has strings
+        invalid = {key: str(value) for key, value in invalid.items()}
+        number = max(10, 20000 // width)
+
+        for codegen in [False, True]:
+            checker = ValueChecker(text, codegen=codegen)
+            kind = "generated" if codegen else "interpreted"
+            for payload_name, payload in [("valid", valid), ("invalid", invalid)]:
+                payload = MultiDict(payload)
+                benchmark(
+                    f"check_for {payload_name} {width} fields, {kind}", number
+                )(lambda checker=checker, payload=payload: checker.check_for(payload))
+
+
+def add_request_benchmarks():
+    app = Flask(__name__)
+    invigilator = Invigilator()
+    text, valid, invalid = generate_schema(10)
+    form_valid = {key: str(value) for key, value in valid.items()}
+    form_invalid = {key: str(value) for key, value in invalid.items()}
+
+    @app.route("/form", methods=["POST"])
+    @invigilator.check("POST", text)
+    def form_view():
+        return "hi"
+
+    @app.route("/json", methods=["POST"])
+    @invigilator.check("POST", text, source="json")
+    def json_view():
+        return "hi"
+
+    @app.route("/upload", methods=["POST"])
+    @invigilator.check("POST", text + "\n    upload : file", source="multipart")
+    def upload_view():
+        return "hi"
+
+    client = app.test_client()
+
+    def post_form(data):
+        return lambda: client.post("/form", data=data)
+
+    def post_json(data):
+        return lambda: client.post("/json", json=data)
+
+    def post_upload(data, file_size):
+        content = b"x" * file_size
+
+        def post():
+            files = dict(data, upload=(io.BytesIO(content), "upload.txt"))
+            return client.post("/upload", data=files)
+
+        return post
+
+    cases = [
+        ("form valid", post_form(form_valid)),
+        ("form invalid", post_form(form_invalid)),
+        ("json valid", post_json(valid)),
+        ("json invalid", post_json(invalid)),
+        ("multipart valid, 1KB file", post_upload(form_valid, 1024)),
+        ("multipart valid, 1MB file", post_upload(form_valid, 1024 * 1024)),
+        ("multipart invalid, 1MB file", post_upload(form_invalid, 1024 * 1024)),
+    ]
+    for name, func in cases:
+        number = 20 if "1MB" in name else 500
+        benchmark(f"request {name}, 10 fields", number, "request")(func)
+
+
+def run(selected, scale, repeat):
+    """
+    Returns
+    -------
+    dict
+        {benchmark name: seconds per call}
+    """
+    results = {}
+    for name, func, number, unit in selected:
+        # the first call fills caches (i.e. flask's first request setup)
+        func()
+        seconds = best_of(func, max(1, int(number * scale)), repeat=repeat)
+        report(name, seconds, unit)
+        results[name] = seconds
+
+    return results
+
+
+def save(path, results):
+    baseline = {
+        "version": flask_value_checker.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def compare(path, results, threshold):
+    """
+    print every timing against the baseline
+
+    Returns
+    -------
+    list of strs
+        the names of the benchmarks slower than the baseline by more
+        than the threshold
+    """
+    with open(path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+
+    print()
+    print(
+        f"compared to {path} (version {baseline['version']}, "
+        + f"python {baseline['python']})"
+    )
+
+    regressions = []
+    for name, seconds in results.items():
+        baseline_seconds = baseline["results"].get(name)
+        if baseline_seconds is None:
+            print(f"{name:<55} {'new':>12}")
+            continue
+
+        change = seconds / baseline_seconds - 1
+        marker = ""
+        if change > threshold:
+            marker = "  SLOWER"
+            regressions.append(name)
+        elif change < -threshold:
+            marker = "  faster"
+
+        print(f"{name:<55} {change:>+12.1%}{marker}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks named so")
+    parser.add_argument("--save", metavar="PATH", help="save timings as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the slowdown counted as a regression, 0.2 is 20%% (default)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the number of calls per timing, < 1 for a quick run",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark")
+    options = parser.parse_args(argv)
+
+    add_compile_benchmarks()
+    add_check_for_benchmarks()
+    add_request_benchmarks()
+
+    selected = [
+        (name, func, number, unit)
+        for name, func, number, unit in benchmarks
+        if not options.pattern or options.pattern in name
+    ]
+    results = run(selected, options.scale, options.repeat)
+
+    if options.save:
+        save(options.save, results)
+
+    if options.compare:
+        regressions = compare(options.compare, results, options.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
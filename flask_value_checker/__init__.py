@@ -2,6 +2,55 @@
 
 __version__ = "1.1"
 
-from .value_checker import ValueChecker
-from .invigilator import Invigilator
+from . import errors
 from .errors import *
+
+# also the name of its module, so it can't be imported lazily
+from .schema_cache import SchemaCache, schema_cache
+
+# everything else is only imported when it's first used, so importing
+# flask_value_checker doesn't import flask (or anything else) itself
+_lazy_attributes = {
+    "ValueChecker": ".value_checker",
+    "Invigilator": ".invigilator",
+    "validate_csv": ".offline",
+    "validate_ndjson": ".offline",
+    "register_restriction_type": ".restrictions",
+    "GenericRestriction": ".restrictions",
+    "register_fragment": ".fragments",
+    "MetricsSink": ".metrics",
+    "InMemoryMetrics": ".metrics",
+}
+
+# `from flask_value_checker import *` imports the lazy attributes too
+__all__ = [
+    "__version__",
+    "SchemaCache",
+    "schema_cache",
+    *(name for name in vars(errors) if not name.startswith("_")),
+    *_lazy_attributes,
+]
+
+
+def __getattr__(name):
+    import importlib
+
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        # a submodule, i.e. `flask_value_checker.restrictions`
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
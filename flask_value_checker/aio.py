@@ -0,0 +1,123 @@
+"""
+checking requests for async views, flask `async def` views, and
+quart (if installed), where the body has to be awaited
+
+flask reads the body synchronously (it's a WSGI app), so in flask
+the checks are the same as for other views, only quart's body is
+awaited, without blocking the event loop
+"""
+from werkzeug.datastructures import MultiDict
+import flask
+import inspect
+
+try:
+    import quart
+except ImportError:
+    quart = None
+
+
+def get_request():
+    """
+    get the current request, quart's if in a quart request, flask's otherwise
+    """
+    if quart is not None and quart.has_request_context():
+        return quart.request
+    return flask.request
+
+
+def get_g():
+    """
+    get the current app context globals, quart's if in a
+    quart app context, flask's otherwise
+    """
+    if quart is not None and quart.has_app_context():
+        return quart.g
+    return flask.g
+
+
+async def resolve(value):
+    """await a value, if it's awaitable (i.e. quart's `request.form`)"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class ValuesWithFiles(MultiDict):
+    """
+    submitted values, along with the uploaded files, for file
+    restrictions, which otherwise look in flask's `request.files`
+    """
+
+    def __init__(self, values, files):
+        super().__init__(values)
+        self.files = files
+
+
+async def check(checker, source=None):
+    """
+    `ValueChecker.check(...)`, for async views
+
+    Parameters
+    ----------
+    checker : ValueChecker
+
+    source : str or None
+        see `ValueChecker.check`, "multipart" is the same as "form"
+        in quart, quart parses the whole body itself
+
+    Returns
+    -------
+    dict or None
+        dict if there are errors, None if there are no errors
+    """
+    request = get_request()
+    if quart is None or request is flask.request:
+        return checker.check(source)
+
+    return checker.check_for(await get_values(request, checker, source))
+
+
+async def check_cleaned(checker, source=None):
+    """
+    `ValueChecker.check_cleaned(...)`, for async views, see `check(...)`
+
+    Returns
+    -------
+    (dict or None, dict or None)
+        the errors, and the cleaned values, see ValueChecker.clean_for
+    """
+    request = get_request()
+    if quart is None or request is flask.request:
+        return checker.check_cleaned(source)
+
+    return checker.clean_for(await get_values(request, checker, source))
+
+
+async def get_values(request, checker, source):
+    """
+    get the values of a quart request, awaiting the body
+
+    Returns
+    -------
+    MultiDict or dict
+    """
+    if source is None:
+        if request.method in ["POST", "PUT"]:
+            source = "form"
+        else:
+            source = "args"
+
+    if source in ("form", "multipart"):
+        values = await resolve(request.form)
+        if checker.has_files:
+            values = ValuesWithFiles(values, await resolve(request.files))
+    elif source == "args":
+        values = request.args
+    elif source == "json":
+        values = await resolve(request.get_json(silent=True))
+        if not isinstance(values, dict):
+            values = {}
+    else:
+        raise ValueError(f"unknown source {source!r}")
+
+    return values
@@ -0,0 +1,180 @@
+"""
+checking many records at once, see `ValueChecker.check_many(...)`
+
+records are checked column by column, every restriction checks all
+the values of its parameter in one `check_column(...)` call, instead
+of every restriction being called once per record,
+
+numpy arrays (in a dict of columns) of numbers and strings are
+checked with vectorized range/length checks, if numpy is installed
+"""
+from collections.abc import Mapping
+
+from .restrictions import (
+    FloatRestriction,
+    IntRestriction,
+    ListRestriction,
+    StringRestriction,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def to_columns(records, keys, list_keys=()):
+    """
+    get the columns of a batch of records
+
+    Parameters
+    ----------
+    records : list of dicts, or dict of lists
+        the records, i.e. [{"age": "5"}, {"age": "6"}], or the same
+        records as columns, i.e. {"age": ["5", "6"]}
+
+    keys : iterable of strs
+        the parameters to get the columns for
+
+    list_keys : collection of strs
+        the parameters of list fields, multidict records (i.e. the
+        form of a request) give every value of them, as
+        ListRestriction.get_values
+
+    Returns
+    -------
+    (dict, int)
+        the columns (missing values are None), and the number of records
+    """
+    if isinstance(records, Mapping):
+        lengths = {len(column) for column in records.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"every column should have the same length, got lengths {sorted(lengths)}"
+            )
+        size = lengths.pop() if lengths else 0
+
+        missing = [None] * size
+        columns = {key: records.get(key, missing) for key in keys}
+        return columns, size
+
+    records = list(records)
+    columns = {}
+    for key in keys:
+        if key in list_keys:
+            columns[key] = [get_list(record, key) for record in records]
+        else:
+            columns[key] = [record.get(key, None) for record in records]
+
+    return columns, len(records)
+
+
+def get_list(record, key):
+    """
+    get the value of a list field, every value of a multidict,
+    None if there are none, see ListRestriction.get_values
+    """
+    getlist = getattr(record, "getlist", None)
+    if getlist is not None:
+        return getlist(key) or None
+
+    return record.get(key, None)
+
+
+def check_many(checker, records):
+    """
+    check a batch of records
+
+    Parameters
+    ----------
+    checker : ValueChecker
+        the checker to check with
+
+    records : list of dicts, or dict of lists
+        see `to_columns(...)`
+
+    Returns
+    -------
+    list of (dict or None)
+        one item per record, dict if there are errors,
+        None if there are no errors, as `check_for(...)` returns
+    """
+    if checker.path_tree is not None and not isinstance(records, Mapping):
+        records = [checker.resolve_paths(record) for record in records]
+
+    list_keys = {
+        key
+        for key, restriction in checker.checkers.items()
+        if isinstance(restriction, ListRestriction)
+    }
+    columns, size = to_columns(records, checker.checkers.keys(), list_keys)
+    results = [None] * size
+
+    for key, restriction in checker.checkers.items():
+        for i, message in check_column(restriction, columns[key]):
+            errors = results[i]
+            if errors is None:
+                errors = results[i] = {}
+            errors[key] = message
+
+    return results
+
+
+def check_column(restriction, column):
+    """
+    check a column for a restriction, vectorized if it's a numpy
+    array the restriction knows how to check in bulk
+
+    Returns
+    -------
+    list of (int, str)
+        see GenericRestriction.check_column
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        kind = column.dtype.kind
+        if kind in "iuf" and isinstance(restriction, FloatRestriction):
+            return check_number_array(restriction, column)
+        if kind == "U" and isinstance(restriction, StringRestriction):
+            return check_string_array(restriction, column)
+
+        # anything else is checked value by value, as python objects
+        column = column.tolist()
+
+    return restriction.check_column(column)
+
+
+def check_number_array(restriction, array):
+    """
+    check a numpy array of numbers for a FloatRestriction (or
+    an IntRestriction), the same as `check_column(...)`
+    """
+    invalid = ~((array >= restriction.min) & (array <= restriction.max))
+    unparsable = None
+
+    if isinstance(restriction, IntRestriction) and array.dtype.kind == "f":
+        # as IntRestriction.to_number, only whole floats are ints
+        unparsable = ~numpy.isfinite(array) | (array != numpy.floor(array))
+        invalid |= unparsable
+
+    errors = []
+    for i in numpy.flatnonzero(invalid).tolist():
+        if unparsable is not None and unparsable[i]:
+            errors.append((i, restriction.parse_error(array[i].item())))
+        else:
+            errors.append((i, restriction.range_error))
+
+    return errors
+
+
+def check_string_array(restriction, array):
+    """
+    check a numpy array of strings for a StringRestriction,
+    the same as `check_column(...)`
+    """
+    if restriction.accept_set is not None:
+        # accept lists are checked value by value anyway
+        return restriction.check_column(array.tolist())
+
+    lengths = numpy.char.str_len(array)
+    invalid = (lengths < restriction.minlength) | (lengths > restriction.maxlength)
+    return [(i, restriction.length_error) for i in numpy.flatnonzero(invalid).tolist()]
@@ -0,0 +1,152 @@
+"""
+compile checkers into python source
+
+instead of looping through the restrictions and dispatching to
+each restriction's `check_for` on every request, a single function
+is generated for the whole checker text, with the restriction's
+values inlined and the branches which can never be taken dropped
+"""
+from contextlib import contextmanager
+import linecache
+import math
+
+
+class SourceBuilder:
+    """
+    builds the source of a generated function, restrictions
+    add their part of the function via `generate_check(...)`
+
+    generated code has the local variables,
+
+    checking_part
+        the multidict being checked
+    get
+        checking_part.get
+    err_fields
+        dict, the errors found are added in here
+    value, number
+        free to be used by any restriction
+    """
+
+    def __init__(self, fail_fast=False):
+        self.fail_fast = fail_fast
+        self.lines = []
+        self.namespace = {}
+        self._indent = 0
+
+    def line(self, text: str):
+        """add a line of code, at the current indentation"""
+        self.lines.append("    " * self._indent + text)
+
+    @contextmanager
+    def indent(self):
+        """indent every line added within the `with` block"""
+        self._indent += 1
+        try:
+            yield
+        finally:
+            self._indent -= 1
+
+    def const(self, value):
+        """
+        make a value available to the generated code
+
+        Returns
+        -------
+        str
+            the name the value is available under
+        """
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def literal(self, value):
+        """
+        get the source for a value, values which cannot
+        be written as python literals are passed in via `const(...)`
+
+        Returns
+        -------
+        str
+            python source evaluating to the value
+        """
+        value_type = type(value)
+        if value is None or value_type in (bool, str, int):
+            return repr(value)
+        if value_type is float and math.isfinite(value):
+            return repr(value)
+        # including subclasses of the types above, i.e. FieldErrors
+        return self.const(value)
+
+    def error(self, key, message):
+        """add a line, setting the error message for a field"""
+        self.error_expr(key, self.literal(message))
+
+    def error_expr(self, key, message_source):
+        """
+        add a line, setting the error message for a field to
+        the result of some python source
+        """
+        self.line(f"err_fields[{self.literal(key)}] = {message_source}")
+        if self.fail_fast:
+            self.line("return err_fields")
+
+    @property
+    def source(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def generate_check_for(checkers, name="check_for", fail_fast=False):
+    """
+    generate a function equivalent to `ValueChecker.check_for`
+    for some checkers
+
+    Parameters
+    ----------
+    checkers : dict
+        field name -> restriction
+
+    name : str
+        the name of the generated function
+
+    fail_fast : bool
+        return as soon as the first error is found
+
+    Returns
+    -------
+    function
+        taking in the multidict to check, returning a dict of errors
+        or None, the generated source is available as its
+        `__source__` attribute
+    """
+    builder = SourceBuilder(fail_fast=fail_fast)
+    builder.line(f"def {name}(checking_part):")
+
+    with builder.indent():
+        builder.line("err_fields = {}")
+        builder.line("get = checking_part.get")
+
+        for key, checker in checkers.items():
+            builder.line("# " + " ".join(checker.raw_line.split()))
+            checker.generate_check(key, builder)
+
+        builder.line("return err_fields or None")
+
+    source = builder.source
+    filename = f"<flask_value_checker generated {name} {id(builder):x}>"
+
+    # register the source, so tracebacks through the generated function
+    # show the generated lines
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(True),
+        filename,
+    )
+
+    namespace = builder.namespace
+    exec(compile(source, filename, "exec"), namespace)
+
+    function = namespace[name]
+    function.__source__ = source
+    return function
@@ -0,0 +1,172 @@
+"""
+on disk cache of parsed checker text, see `SchemaCache(directory=...)`
+
+parsing is most of the time taken to compile checker text, and every
+new worker process (i.e. gunicorn workers, autoscaled containers)
+parses every schema again, so the parsed text is written to disk, in
+the marshal format, one file per schema, and loaded by later processes
+
+the files are named after a hash of the (normalized) text, the
+version of flask_value_checker and the python version (the marshal
+format depends on it), so a new version never loads an old file
+
+only parsing is skipped, the parsed attributes are compiled when
+loaded, so anything compilation reads (i.e. `acceptfile` files,
+registered restriction types) is always up to date
+
+the cache files are trusted, like the code of the app itself, the
+directory must not be writable by other users, loaded files are only
+checked against the text they are for, to catch damaged files, not
+forged ones
+"""
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+
+from . import __version__
+from .fragments import DIRECTIVE_RE
+
+SUFFIX = ".fvc"
+
+
+def is_valid_parsed(text: str, parsed):
+    """
+    check that parsed checker text loaded from a cache file is
+    shaped like parsing.parse_restrictions' output, and matches the
+    (normalized) text, line by line, with the field name and the type
+    of every line, and no more attributes than the line has
+
+    Returns
+    -------
+    bool
+    """
+    lines = text.split("\n") if text else []
+    if not isinstance(parsed, list) or len(parsed) != len(lines):
+        return False
+
+    for entry, line in zip(parsed, lines):
+        if type(entry) is not tuple or len(entry) != 3 or entry[0] != line:
+            return False
+
+        _, field_name, attrs = entry
+        if field_name is None:
+            directive = DIRECTIVE_RE.match(line)
+            if directive is None or attrs != directive.group(1, 2):
+                return False
+            continue
+
+        name, _, rest = line.partition(":")
+        if name.strip() != field_name or type(attrs) is not list:
+            return False
+
+        if not attrs or len(attrs) > rest.count("/") + 1:
+            return False
+
+        for attr_name, params in attrs:
+            if type(attr_name) is not str or type(params) not in (list, tuple):
+                return False
+
+        type_name = attrs[0][0]
+        if type_name.split() != rest.partition("/")[0].split("#")[0].split():
+            return False
+
+    return True
+
+
+class DiskCache:
+    """
+    a directory of parsed checker texts
+
+    every write goes to a temporary file, which then replaces the
+    cache file, so processes sharing the directory never read a
+    partially written file
+    """
+
+    def __init__(self, directory):
+        """
+        Parameters
+        ----------
+        directory : str or os.PathLike
+            where the cache files are kept, created if required
+        """
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, text: str):
+        """
+        the cache key of some (normalized) checker text
+
+        Returns
+        -------
+        str
+            a hex digest
+        """
+        versions = f"{__version__}\0{sys.implementation.cache_tag}\0{marshal.version}"
+        return hashlib.sha256(f"{versions}\0{text}".encode("utf-8")).hexdigest()
+
+    def path(self, text: str):
+        """the path of the cache file of some (normalized) checker text"""
+        return os.path.join(self.directory, self.key(text) + SUFFIX)
+
+    def load(self, text: str):
+        """
+        load the parsed checker text, see parsing.parse_restrictions
+
+        Returns
+        -------
+        list or None
+            None if the text isn't cached, or the cache file
+            can't be read, or doesn't match the text, see
+            `is_valid_parsed(...)`
+        """
+        try:
+            with open(self.path(text), "rb") as cache_file:
+                parsed = marshal.loads(cache_file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        try:
+            if not is_valid_parsed(text, parsed):
+                return None
+        except Exception:
+            return None
+
+        return parsed
+
+    def save(self, text: str, parsed):
+        """
+        save the parsed checker text, failing to write the cache
+        (i.e. a read only directory) is silently ignored, it's
+        only a cache
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(marshal.dumps(parsed))
+            os.replace(temp_path, self.path(text))
+        except (OSError, ValueError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """remove every cache file (of any version) in the directory"""
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def __len__(self):
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(SUFFIX))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.directory!r}>"
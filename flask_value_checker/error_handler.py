@@ -0,0 +1,85 @@
+"""
+the default error handler, used by Invigilators without an err_handler
+"""
+from flask import Response
+from functools import lru_cache
+import json
+
+ERROR_CODE = "MALFORMED_OR_MISSING_PARAMETERS"
+ERROR_MESSAGE = "one or more fields we're either missing or malformed"
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class DefaultErrorHandler:
+    """
+    responds with a 400, and
+
+    {
+        "error": {
+            "code": "MALFORMED_OR_MISSING_PARAMETERS",
+            "message": "one or more fields we're either missing or malformed",
+            "fields": {...}
+        }
+    }
+
+    everything except the fields is encoded once, up front, and the
+    complete bodies for the most recent sets of errors are cached, so
+    repeated identical bad requests don't encode anything at all
+    """
+
+    def __init__(self, json_encoder=None, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Parameters
+        ----------
+        json_encoder : function or None
+            encodes the fields dict into json, returning a str or bytes,
+            defaults to `json.dumps`, any faster json library's
+            dumps(...) works here
+
+        cache_size : int or None
+            the number of response bodies to cache, 0 disables the
+            cache, None makes it unbounded
+        """
+        self.json_encoder = json.dumps if json_encoder is None else json_encoder
+
+        self.prefix = (
+            '{"error": {"code": '
+            + json.dumps(ERROR_CODE)
+            + ', "message": '
+            + json.dumps(ERROR_MESSAGE)
+            + ', "fields": '
+        ).encode()
+        self.suffix = b"}}"
+
+        if cache_size == 0:
+            self.get_body = self.make_body
+        else:
+            self.get_body = lru_cache(maxsize=cache_size)(self.make_body)
+
+    def make_body(self, error_items):
+        """
+        make the response body
+
+        Parameters
+        ----------
+        error_items : tuple
+            the (field, error) pairs
+
+        Returns
+        -------
+        bytes
+        """
+        fields = self.json_encoder(dict(error_items))
+        if isinstance(fields, str):
+            fields = fields.encode()
+        return self.prefix + fields + self.suffix
+
+    def __call__(self, errs):
+        error_items = tuple(errs.items())
+        try:
+            body = self.get_body(error_items)
+        except TypeError:
+            # unhashable errors (from custom restrictions) can't be cached
+            body = self.make_body(error_items)
+        return Response(body, status=400, mimetype="application/json")
@@ -1,3 +1,6 @@
+import weakref
+
+
 class FlaskValueCheckerError(Exception):
     """base flask value checker error"""
 
@@ -18,3 +21,59 @@ class FlaskValueCheckerValueError(ValueError):
     """
 
     pass
+
+
+class FieldError(str):
+    """
+    the error message for an invalid field,
+
+    a str, so it can be shown, compared and json encoded just like
+    the plain message, along with a machine readable form,
+    `code` (i.e. "OUT_OF_RANGE") and `params` (i.e. {"min": 1, "max": 5})
+
+    restrictions create their errors once, when compiled, see `field_error`
+    """
+
+    def __new__(cls, code, message, **params):
+        error = super().__new__(cls, message)
+        error.code = code
+        error.params = params
+        return error
+
+    def as_dict(self):
+        """
+        Returns
+        -------
+        dict
+            {"code": ..., "message": ..., "params": ...}
+        """
+        return {"code": self.code, "message": str(self), "params": self.params}
+
+    def __reduce__(self):
+        return (_make_field_error, (self.code, str(self), self.params))
+
+
+def _make_field_error(code, message, params):
+    return FieldError(code, message, **params)
+
+
+# the errors in use, see `field_error(...)`, only kept while a
+# restriction (or a response) is using them
+_interned_field_errors = weakref.WeakValueDictionary()
+
+
+def field_error(code, message, **params):
+    """
+    get a FieldError, errors with the same code, message and params
+    are only created once, and shared
+
+    Returns
+    -------
+    FieldError
+    """
+    key = (code, message, repr(sorted(params.items())))
+    error = _interned_field_errors.get(key)
+    if error is None:
+        error = FieldError(code, message, **params)
+        _interned_field_errors[key] = error
+    return error
@@ -0,0 +1,230 @@
+"""
+named, reusable pieces of checker text, i.e. pagination or address
+fields, used in checker text with `include <name>` or `extend <name>`
+
+a fragment is parsed once, when registered, and compiled once, the
+first time it's used, every schema using it then gets the very same
+compiled restrictions, flattened into its own `field name ->
+restriction` table when it's compiled, so checking a schema never
+looks at its fragments
+
+- `include <name>` adds the fields of the fragment, defining any of
+  them again is an error
+- `extend <name>` adds the fields of the fragment too, but the fields
+  defined by the schema itself replace them, the replacing field
+  keeps its place
+
+fragments can use other fragments, registering a fragment again (with
+`replace=True`) gives it a new version, the version of every fragment
+a schema uses is part of its `schema_cache` key
+"""
+import itertools
+import re
+import textwrap
+
+from . import errors
+
+# a whole (stripped) line of checker text, comments are allowed
+DIRECTIVE_RE = re.compile(r"^(include|extend) +([A-Za-z0-9_\-.]+) *(?:#.*)?$", re.M)
+
+# {name: Fragment}, see `register_fragment(...)`
+registered_fragments = {}
+_versions = itertools.count(1)
+
+
+class Fragment:
+    """a registered fragment, see `register_fragment(...)`"""
+
+    __slots__ = ("name", "text", "version", "parsed", "uses", "_compiled")
+
+    def __init__(self, name, text, parsed):
+        self.name = name
+        self.text = text
+        self.version = next(_versions)
+        self.parsed = parsed
+        # the names of the fragments this fragment uses
+        self.uses = tuple(
+            attrs[1] for _, field_name, attrs in parsed if field_name is None
+        )
+        # (versions key, {field name: restriction}), see `get_checkers(...)`
+        self._compiled = None
+
+    def get_checkers(self, share=True, using=()):
+        """
+        get the compiled fragment, compiled the first time it's used
+        (and again if a fragment it uses is registered again)
+
+        Parameters
+        ----------
+        share : bool
+            False compiles the fragment again, see
+            restrictions.make_restrictions
+
+        using : tuple of strs
+            the fragments being compiled, which use this one
+
+        Returns
+        -------
+        dict
+            {field name: restriction}
+        """
+        if self.name in using:
+            chain = " -> ".join(using + (self.name,))
+            raise errors.FlaskValueCheckerValueError(
+                f"the fragment {self.name} uses itself, {chain}"
+            )
+
+        from . import restrictions
+
+        if not share:
+            return restrictions.build_restrictions(
+                self.parsed, False, using + (self.name,)
+            )
+
+        key = versions_key(self.uses)
+        compiled = self._compiled
+        if compiled is None or compiled[0] != key:
+            checkers = restrictions.build_restrictions(
+                self.parsed, True, using + (self.name,)
+            )
+            compiled = self._compiled = (key, checkers)
+
+        return compiled[1]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name} v{self.version}>"
+
+
+def register_fragment(name: str, text: str, replace: bool = False):
+    """
+    register a fragment of checker text, so it can be used with
+    `include <name>` and `extend <name>` in checker text
+
+    register fragments before compiling any checker text using them,
+    the text is parsed right away, so syntax errors are raised here
+
+    Parameters
+    ----------
+    name : str
+        letters, digits, "_", "-" and "."
+
+    text : str
+        checker text, in the format accepted by `ValueChecker`
+
+    replace : bool
+        replace the fragment already registered with the name,
+        if any, instead of raising an error
+
+    Returns
+    -------
+    Fragment
+
+    Examples
+    --------
+    >>> register_fragment("pagination", '''
+    ...     page : int/lim(1, inf)/default(1)
+    ...     per_page : int/lim(1, 100)/default(20)
+    ... ''')
+    >>> checker = ValueChecker('''
+    ...     include pagination
+    ...     query : str/lenlim(1, 100)
+    ... ''')
+    """
+    if not DIRECTIVE_RE.match(f"include {name}"):
+        raise errors.FlaskValueCheckerValueError(
+            f"invalid fragment name {name!r}, "
+            + "use letters, digits, '_', '-' and '.'"
+        )
+
+    if name in registered_fragments and not replace:
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        the fragment {name} is already registered,
+        pass replace=True to replace it
+        """
+            )
+        )
+
+    from . import restrictions
+
+    fragment = Fragment(name, text, restrictions.parse_restrictions(text))
+    registered_fragments[name] = fragment
+    return fragment
+
+
+def get_fragment(name: str):
+    """
+    Returns
+    -------
+    Fragment
+        the registered fragment
+
+    Raises
+    ------
+    FlaskValueCheckerValueError
+        if there is no fragment with the name
+    """
+    fragment = registered_fragments.get(name)
+    if fragment is None:
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        unknown fragment {name},
+        please register it first, see `register_fragment(...)`,
+        the registered fragments are {list(registered_fragments)}
+        """
+            )
+        )
+
+    return fragment
+
+
+def versions_key(names):
+    """
+    the versions of some fragments, and of every fragment they use,
+    unregistered fragments are version 0
+
+    Returns
+    -------
+    str
+    """
+    versions = []
+    seen = set()
+    stack = list(names)
+
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+
+        fragment = registered_fragments.get(name)
+        if fragment is None:
+            versions.append(f"{name}=0")
+        else:
+            versions.append(f"{name}={fragment.version}")
+            stack.extend(fragment.uses)
+
+    return "\0".join(versions)
+
+
+def text_versions_key(text: str):
+    """
+    the versions of the fragments used by some (normalized) checker
+    text, see `versions_key(...)`
+
+    Returns
+    -------
+    str
+        empty if the text doesn't use fragments, starts with "\\0"
+        otherwise, so it can be appended to the text
+    """
+    if "include " not in text and "extend " not in text:
+        return ""
+
+    names = [match.group(2) for match in DIRECTIVE_RE.finditer(text)]
+    if not names:
+        return ""
+
+    return "\0" + versions_key(names)
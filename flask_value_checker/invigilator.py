@@ -1,10 +1,13 @@
 from functools import wraps
-from flask import jsonify, request, Response, g
-from .value_checker import ValueChecker
+from flask import request, g
+from .value_checker import ValueChecker, LazyValueChecker, SOURCES
+from .error_handler import DefaultErrorHandler
+from . import aio
+from .metrics import declared_errors
 
-import json
-from .restrictions import errors
-from . import restrictions
+from time import perf_counter
+import inspect
+import gc
 
 
 class Invigilator:
@@ -12,7 +15,15 @@ class Invigilator:
     lets check how your form/query parameters are, kay ?
     """
 
-    def __init__(self, err_handler=None):
+    def __init__(
+        self,
+        err_handler=None,
+        codegen=False,
+        json_encoder=None,
+        lazy=False,
+        metrics=None,
+        clean=False,
+    ):
         """
         create an Invigilator
 
@@ -24,26 +35,99 @@ class Invigilator:
 
             the return part of this function works similar
             to most flask routes
+
+        codegen : bool
+            compile every checker into a generated python function,
+            see `ValueChecker`
+
+        json_encoder : function or None
+            the json encoder used by the default err_handler, for
+            the fields part of the response, see `DefaultErrorHandler`
+
+        lazy : bool
+            compile every checker on the first request to its route,
+            instead of when the route is decorated, so routes which are
+            never requested are never compiled, see `warmup()`
+
+        metrics : metrics.MetricsSink or None
+            record how long checking every request takes, and which
+            fields are invalid, i.e. `metrics.InMemoryMetrics()`,
+            without metrics, the routes are wrapped without any timing
+
+        clean : bool
+            hand the cleaned values (numbers parsed, strings stripped,
+            defaults filled in) to the views, as `g.cleaned_values`,
+            see `ValueChecker.clean_for`, fields aren't timed for metrics,
+            cleaning always goes through the restrictions themselves
+            (`ValueChecker.check_cleaned`), so `codegen` has no effect
         """
         if err_handler is None:
-
-            def err_handler(errs):
-                """
-                default err handler
-                """
-                error = {
-                    "error": {
-                        "code": "MALFORMED_OR_MISSING_PARAMETERS",
-                        "message": "one or more fields we're either missing or malformed",
-                        "fields": errs,
-                    }
-                }
-                error = json.dumps(error)
-                return Response(error, status=400, mimetype="application/json")
+            err_handler = DefaultErrorHandler(json_encoder)
 
         self.err_handler = err_handler
+        self.codegen = codegen
+        self.lazy = lazy
+        self.metrics = metrics
+        self.clean = clean
+        # every checker (or LazyValueChecker) made by `check(...)`
+        self.checkers = []
+
+    def warmup(self):
+        """
+        compile every checker which hasn't been compiled yet, i.e.
+        at the start of a long lived worker, when `lazy` is set
 
-    def check(self, check_for_method, value):
+        Returns
+        -------
+        int
+            the number of checkers compiled
+        """
+        compiled = 0
+        for checker in self.checkers:
+            if isinstance(checker, LazyValueChecker) and not checker.compiled:
+                checker.get()
+                compiled += 1
+
+        return compiled
+
+    def freeze(self, gc_freeze=False):
+        """
+        compile every checker before a pre-fork server forks its
+        workers (i.e. in gunicorn's `on_starting` or `when_ready`
+        hooks, or at the end of the app factory with `preload_app`),
+        so every worker shares the compiled checkers, instead of
+        compiling its own copy
+
+        the compiled checkers are already laid out for sharing, the
+        restrictions have `__slots__` (no per object dicts), identical
+        fields share a restriction, and every checker keeps its fields
+        in one flat tuple, the pages holding them are still written to
+        by the garbage collector in every worker though, `gc_freeze`
+        moves everything allocated so far out of its reach
+
+        Parameters
+        ----------
+        gc_freeze : bool
+            collect garbage, then `gc.freeze()`, so the garbage collector
+            never touches (or frees) anything allocated before the fork,
+            only do this once the app is fully set up
+
+        Returns
+        -------
+        int
+            the number of checkers compiled
+        """
+        compiled = self.warmup()
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+
+        return compiled
+
+    def check(
+        self, check_for_method, value, fail_fast=False, source=None, multipart=None
+    ):
         '''
         check if values exist if the method is followed,
         NOTE: if any other method is followed, does not raise
@@ -58,6 +142,20 @@ class Invigilator:
         value : str
             check strings, must be in the format mentioned
 
+        fail_fast : bool
+            stop at the first invalid field, and only report that field,
+            cheaper for rejecting garbage requests
+
+        source : str or None
+            where the values are, "form", "args", "json" or "multipart",
+            by default "form" for POST and PUT requests, "args" otherwise,
+            "multipart" checks multipart/form-data uploads while they are
+            being read, and rejects the request at the first invalid part,
+            without reading the rest of the upload, see `ValueChecker.check`
+
+        multipart : dict or None
+            options of the "multipart" source, see `ValueChecker`
+
         HTTP-Returns
         ------------
         400
@@ -110,22 +208,167 @@ class Invigilator:
         if isinstance(check_for_method, str):
             check_for_method = [check_for_method]
 
-        checker = ValueChecker(value)
+        if source is not None and source not in SOURCES:
+            raise ValueError(f"unknown source {source!r}, should be one of {SOURCES}")
 
-        def decorator(f):
-            @wraps(f)
-            def wrapper(*args, **kwargs):
-                g.value_checker = checker
-                if not request.method in check_for_method:
-                    return f(*args, **kwargs)
+        if self.lazy:
+            lazy_checker = LazyValueChecker(
+                value, codegen=self.codegen, fail_fast=fail_fast, multipart=multipart
+            )
+            self.checkers.append(lazy_checker)
+            get_checker = lazy_checker.get
+        else:
+            checker = ValueChecker(
+                value, codegen=self.codegen, fail_fast=fail_fast, multipart=multipart
+            )
+            self.checkers.append(checker)
 
-                errors = checker.check()
+            def get_checker():
+                return checker
 
-                if errors:
-                    return self.err_handler(errors)
-                else:
-                    return f(*args, **kwargs)
+        def decorator(f):
+            if inspect.iscoroutinefunction(f):
+                return self.make_async_wrapper(f, get_checker, check_for_method, source)
 
-            return wrapper
+            return self.make_wrapper(f, get_checker, check_for_method, source)
 
         return decorator
+
+    def record_metrics(self, checker, route, duration, errors, field_durations=None):
+        """tell the metrics sink about a checked request"""
+        self.metrics.record(
+            route, duration, declared_errors(errors, checker.checkers), field_durations
+        )
+
+    def make_check_step(self, f, source):
+        """
+        how a wrapper (see `make_wrapper(...)`) checks a request,
+        cleaning the values with `clean`, timed when there are
+        metrics, so the wrapper itself is the same in every case
+
+        Returns
+        -------
+        function
+            checker -> errors (dict or None)
+        """
+        metrics = self.metrics
+
+        if self.clean:
+
+            def check(checker):
+                errors, g.cleaned_values = checker.check_cleaned(source)
+                return errors
+
+        else:
+
+            def check(checker):
+                return checker.check(source)
+
+        if metrics is None:
+            return check
+
+        untimed_check = check
+        field_timings = metrics.field_timings and not self.clean
+
+        def timed_check(checker):
+            field_durations = None
+            start = perf_counter()
+            if field_timings:
+                field_durations = {}
+                errors = checker.check_timed(source, field_durations)
+            else:
+                errors = untimed_check(checker)
+            duration = perf_counter() - start
+
+            route = request.endpoint or f.__name__
+            self.record_metrics(checker, route, duration, errors, field_durations)
+            return errors
+
+        return timed_check
+
+    def make_async_check_step(self, f, source):
+        """
+        the async version of `make_check_step(...)`, for
+        `make_async_wrapper(...)`, fields aren't timed in async views
+
+        Returns
+        -------
+        coroutine function
+            checker -> errors (dict or None)
+        """
+        metrics = self.metrics
+
+        if self.clean:
+
+            async def check(checker):
+                g = aio.get_g()
+                errors, g.cleaned_values = await checker.check_cleaned_async(source)
+                return errors
+
+        else:
+
+            async def check(checker):
+                return await checker.check_async(source)
+
+        if metrics is None:
+            return check
+
+        untimed_check = check
+
+        async def timed_check(checker):
+            start = perf_counter()
+            errors = await untimed_check(checker)
+            duration = perf_counter() - start
+
+            route = aio.get_request().endpoint or f.__name__
+            self.record_metrics(checker, route, duration, errors)
+            return errors
+
+        return timed_check
+
+    def make_wrapper(self, f, get_checker, check_for_method, source):
+        """
+        the wrapper for a view, see `check(...)`, and
+        `make_check_step(...)` for how requests are checked
+        """
+        check = self.make_check_step(f, source)
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            checker = get_checker()
+            g.value_checker = checker
+            if not request.method in check_for_method:
+                return f(*args, **kwargs)
+
+            errors = check(checker)
+
+            if errors:
+                return self.err_handler(errors)
+            else:
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    def make_async_wrapper(self, f, get_checker, check_for_method, source):
+        """
+        the wrapper for an `async def` view (in flask or quart), the
+        body is awaited (in quart), and the view and the err_handler
+        (if it's async) are awaited, see `check(...)`
+        """
+        check = self.make_async_check_step(f, source)
+
+        @wraps(f)
+        async def wrapper(*args, **kwargs):
+            checker = get_checker()
+            aio.get_g().value_checker = checker
+            if not aio.get_request().method in check_for_method:
+                return await f(*args, **kwargs)
+
+            errors = await check(checker)
+
+            if errors:
+                return await aio.resolve(self.err_handler(errors))
+            else:
+                return await f(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,298 @@
+"""
+validation metrics, see `Invigilator(metrics=...)`
+
+a metrics sink is told about every checked request: the route, the
+time taken, the errors (if any), and how long every field took (if
+the sink asks for field timings), `InMemoryMetrics` keeps histograms
+and counters of these, and renders them in the prometheus text format
+
+with no sink set, the invigilator's routes are wrapped the same way
+as before, so metrics cost nothing when they are off
+"""
+from bisect import bisect_left
+import threading
+
+# in seconds, validating a request takes microseconds, not milliseconds
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+
+PREFIX = "flask_value_checker"
+
+# the field errors of fields the checker doesn't declare (i.e.
+# undeclared multipart parts) are recorded under this field name,
+# so clients can't create new labels
+UNDECLARED_FIELD = "<undeclared>"
+
+
+class MetricsSink:
+    """
+    base class of metrics sinks, subclasses override `record(...)`
+    """
+
+    # should the invigilator time every field of every request ?
+    # it's only done for the "form", "args" and "json" sources,
+    # without fail_fast, see `ValueChecker.check_timed`
+    field_timings = False
+
+    def record(self, route, duration, errors, field_durations=None):
+        """
+        record a checked request
+
+        Parameters
+        ----------
+        route : str
+            the endpoint of the request, or the name of the view
+
+        duration : float
+            the time taken to check the request, in seconds
+
+        errors : dict or None
+            the errors, None if the request is valid, the errors of
+            fields the checker doesn't declare are all under
+            UNDECLARED_FIELD, see `declared_errors(...)`
+
+        field_durations : dict or None
+            {field name: seconds}, if fields are timed
+        """
+        raise NotImplementedError(
+            "this function should be overridden by subclassing class"
+        )
+
+
+def declared_errors(errors, checkers):
+    """
+    the errors to record, the errors of fields which aren't in
+    checkers are put under UNDECLARED_FIELD, as their names come
+    from the client
+
+    Parameters
+    ----------
+    errors : dict or None
+    checkers : mapping
+        field name -> restriction, see `ValueChecker.checkers`
+
+    Returns
+    -------
+    dict or None
+    """
+    if not errors:
+        return errors
+
+    for field in errors:
+        if field not in checkers:
+            break
+    else:
+        return errors
+
+    return {
+        field if field in checkers else UNDECLARED_FIELD: message
+        for field, message in errors.items()
+    }
+
+
+def get_error_code(message):
+    """
+    the reason an error is counted under, its code (see FieldError),
+    or the message itself for custom messages without a code
+    """
+    return getattr(message, "code", message)
+
+
+class Histogram:
+    """a (prometheus style) histogram of durations"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # the last count is for durations above every bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """
+        Returns
+        -------
+        list of (str, int)
+            the "le" label of every bucket (including "+Inf"), and
+            the number of values less than or equal to it
+        """
+        cumulative = []
+        total = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            total += count
+            cumulative.append((repr(bucket), total))
+
+        cumulative.append(("+Inf", self.count))
+        return cumulative
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    keeps metrics in memory, per route:
+
+    - a histogram of the time taken to check requests
+    - the number of valid and invalid requests
+
+    and per field:
+
+    - a histogram of the time taken to check the field (with `field_timings`)
+    - the number of errors, by their code (or message)
+
+    Examples
+    --------
+    >>> metrics = InMemoryMetrics()
+    >>> invigilator = Invigilator(metrics=metrics)
+    >>> @app.route("/metrics")
+    ... def show_metrics():
+    ...     return metrics.render_prometheus(), {"Content-Type": "text/plain"}
+    """
+
+    def __init__(self, field_timings=False, buckets=DEFAULT_BUCKETS):
+        """
+        Parameters
+        ----------
+        field_timings : bool
+            time every field, not just every request, this makes checking
+            slower, and always runs the restrictions one by one (not
+            through generated code)
+
+        buckets : tuple of floats
+            the upper bounds of the histogram buckets, in seconds
+        """
+        self.field_timings = field_timings
+        self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """forget every recorded metric"""
+        with self.lock:
+            # {route: Histogram}
+            self.route_durations = {}
+            # {(route, "passed" or "failed"): count}
+            self.route_results = {}
+            # {(route, field): Histogram}
+            self.field_durations = {}
+            # {(route, field, code): count}
+            self.field_errors = {}
+
+    def record(self, route, duration, errors, field_durations=None):
+        """see MetricsSink.record docs"""
+        with self.lock:
+            histogram = self.route_durations.get(route)
+            if histogram is None:
+                histogram = self.route_durations[route] = Histogram(self.buckets)
+            histogram.observe(duration)
+
+            results = self.route_results
+            result_key = (route, "failed" if errors else "passed")
+            results[result_key] = results.get(result_key, 0) + 1
+
+            if errors:
+                field_errors = self.field_errors
+                for field, message in errors.items():
+                    error_key = (route, field, get_error_code(message))
+                    field_errors[error_key] = field_errors.get(error_key, 0) + 1
+
+            if field_durations:
+                for field, field_duration in field_durations.items():
+                    histogram = self.field_durations.get((route, field))
+                    if histogram is None:
+                        histogram = Histogram(self.buckets)
+                        self.field_durations[(route, field)] = histogram
+                    histogram.observe(field_duration)
+
+    def render_prometheus(self):
+        """
+        render every metric in the prometheus text exposition format
+
+        Returns
+        -------
+        str
+        """
+        lines = []
+        with self.lock:
+            render_histograms(
+                lines,
+                f"{PREFIX}_request_duration_seconds",
+                "time taken to check requests",
+                {(route,): h for route, h in self.route_durations.items()},
+                ("route",),
+            )
+            render_counter(
+                lines,
+                f"{PREFIX}_requests_total",
+                "checked requests, by result",
+                self.route_results,
+                ("route", "result"),
+            )
+            render_histograms(
+                lines,
+                f"{PREFIX}_field_duration_seconds",
+                "time taken to check fields",
+                self.field_durations,
+                ("route", "field"),
+            )
+            render_counter(
+                lines,
+                f"{PREFIX}_field_errors_total",
+                "invalid fields, by error code",
+                self.field_errors,
+                ("route", "field", "code"),
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def escape_label_value(value):
+    """escape a label value for the prometheus text format"""
+    return (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def format_labels(names, values):
+    labels = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + labels + "}"
+
+
+def render_counter(lines, name, description, counts, label_names):
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} counter")
+    for label_values, count in sorted(counts.items()):
+        lines.append(f"{name}{format_labels(label_names, label_values)} {count}")
+
+
+def render_histograms(lines, name, description, histograms, label_names):
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} histogram")
+    for label_values, histogram in sorted(histograms.items()):
+        for le, count in histogram.cumulative_counts():
+            labels = format_labels(label_names + ("le",), label_values + (le,))
+            lines.append(f"{name}_bucket{labels} {count}")
+
+        labels = format_labels(label_names, label_values)
+        lines.append(f"{name}_sum{labels} {histogram.sum!r}")
+        lines.append(f"{name}_count{labels} {histogram.count}")
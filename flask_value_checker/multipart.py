@@ -0,0 +1,336 @@
+"""
+streaming validation of multipart/form-data requests
+
+accessing `request.form` or `request.files` makes werkzeug parse
+(and spool to temporary files) the whole body before a single field
+can be checked, here the body is parsed part by part instead, and
+the request is rejected as soon as a part is found to be invalid,
+without reading the rest of the body, files are checked (size, type)
+chunk by chunk as they are read
+"""
+from flask import request
+import codecs
+from werkzeug.datastructures import MultiDict, FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.formparser import default_stream_factory
+from werkzeug.http import parse_options_header
+
+from .restrictions import FileRestriction, ListRestriction
+from .errors import field_error
+
+try:
+    from werkzeug.sansio.multipart import (
+        MultipartDecoder,
+        Field,
+        File,
+        Data,
+        Epilogue,
+        NeedData,
+    )
+except ImportError:  # werkzeug < 2.0
+    MultipartDecoder = None
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_FIELD_SIZE = 500 * 1024
+# werkzeug's default `max_form_parts`
+DEFAULT_MAX_PARTS = 1000
+
+UNDECLARED_ERROR = field_error("UNDECLARED_PARAMETER", "undeclared parameter")
+TOO_LARGE_ERROR = field_error("VALUE_TOO_LARGE", "value is too large")
+
+
+class MultipartStreamValidator:
+    """
+    validates a multipart/form-data request while its body is
+    being read, for a ValueChecker
+
+    on success, `request.form` and `request.files` are filled in
+    from the parsed parts, so the route can use them as usual
+    """
+
+    def __init__(
+        self,
+        checker,
+        max_field_size=None,
+        allow_undeclared=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        max_parts=None,
+    ):
+        """
+        Parameters
+        ----------
+        checker : ValueChecker
+            the checker to validate with
+
+        max_field_size : int or None
+            the maximum size (in bytes) of a (non file) field,
+            defaults to `request.max_form_memory_size`, or 500KB
+            if that isn't set
+
+        allow_undeclared : bool
+            allow parts for fields not in the checker, by default
+            the request is rejected as soon as one shows up
+
+        chunk_size : int
+            the size of the chunks the body is read in
+
+        max_parts : int or None
+            the maximum number of parts (fields and files), like
+            werkzeug's form parser, more raise RequestEntityTooLarge
+            (a 413 response), defaults to `request.max_form_parts`,
+            or 1000 if that isn't set
+        """
+        self.checker = checker
+        self.max_field_size = max_field_size
+        self.allow_undeclared = allow_undeclared
+        self.chunk_size = chunk_size
+        self.max_parts = max_parts
+
+    def can_stream(self):
+        """
+        check if the current request can be validated while streaming,
+        it has to be multipart, with its form not already parsed
+
+        Returns
+        -------
+        bool
+        """
+        return (
+            MultipartDecoder is not None
+            and request.mimetype == "multipart/form-data"
+            and "boundary" in request.mimetype_params
+            and "form" not in request.__dict__
+        )
+
+    def validate(self):
+        """
+        validate the current request
+
+        Returns
+        -------
+        dict or None
+            dict if there are errors, None if there are no errors
+        """
+        if not self.can_stream():
+            return self.checker.check_for(request.form)
+
+        parsed = self.parse()
+        if isinstance(parsed, dict):
+            return parsed
+
+        form, files = parsed
+        # the same attributes werkzeug sets when it parses the form itself
+        request.__dict__["form"] = form
+        request.__dict__["files"] = files
+
+        # the per part checks can't see missing fields or files
+        return self.checker.check_for(form)
+
+    def parse(self):
+        """
+        parse the body of the current request, checking every part as
+        soon as it has been read
+
+        Returns
+        -------
+        (MultiDict, MultiDict) or dict
+            the form and files, or the errors found, if any
+        """
+        # the (spooled) files read so far, closed if the request
+        # is rejected, as the view never gets to see them
+        open_files = []
+        try:
+            parsed = self.read_parts(open_files)
+        except BaseException:
+            self.close_files(open_files)
+            raise
+
+        if isinstance(parsed, dict):
+            self.close_files(open_files)
+        return parsed
+
+    def read_parts(self, open_files):
+        """
+        see `parse(...)`, every file opened is added to open_files
+        """
+        checkers = self.checker.checkers
+        max_field_size = self.max_field_size
+        if max_field_size is None:
+            max_field_size = (
+                getattr(request, "max_form_memory_size", None)
+                or DEFAULT_MAX_FIELD_SIZE
+            )
+
+        max_parts = self.max_parts
+        if max_parts is None:
+            max_parts = getattr(request, "max_form_parts", None) or DEFAULT_MAX_PARTS
+
+        boundary = request.mimetype_params["boundary"].encode("latin-1")
+        decoder = MultipartDecoder(boundary)
+        stream = request.stream
+
+        fields = []
+        files = []
+
+        part = None
+        n_parts = 0
+        container = None
+        stream_check = None
+        size = 0
+        file_counts = {}
+        list_counts = {}
+
+        while True:
+            chunk = stream.read(self.chunk_size)
+            decoder.receive_data(chunk or None)
+
+            event = decoder.next_event()
+            while not isinstance(event, (Epilogue, NeedData)):
+                if isinstance(event, (Field, File)):
+                    part = event
+                    size = 0
+
+                    n_parts += 1
+                    if n_parts > max_parts:
+                        raise RequestEntityTooLarge()
+
+                    if part.name not in checkers and not self.allow_undeclared:
+                        return {part.name: UNDECLARED_ERROR}
+
+                    stream_check = None
+                    if isinstance(part, Field):
+                        container = []
+                    else:
+                        errors = self.check_file_count(part.name, file_counts)
+                        if errors:
+                            return errors
+
+                        restriction = checkers.get(part.name)
+                        if isinstance(restriction, FileRestriction):
+                            stream_check = restriction.start_stream()
+
+                        container = default_stream_factory(
+                            total_content_length=request.content_length,
+                            content_type=part.headers.get("content-type"),
+                            filename=part.filename,
+                        )
+                        open_files.append(container)
+
+                elif isinstance(event, Data):
+                    size += len(event.data)
+
+                    if isinstance(part, Field):
+                        if size > max_field_size:
+                            return {part.name: TOO_LARGE_ERROR}
+                        container.append(event.data)
+                    else:
+                        if stream_check is not None:
+                            message = stream_check.feed(event.data)
+                            if message is not None:
+                                return {part.name: message}
+                        container.write(event.data)
+
+                    if not event.more_data:
+                        if isinstance(part, Field):
+                            value = self.decode(part, b"".join(container))
+                            errors = self.check_field(part.name, value, list_counts)
+                            if errors:
+                                return errors
+                            fields.append((part.name, value))
+                        else:
+                            if stream_check is not None:
+                                message = stream_check.finish()
+                                if message is not None:
+                                    return {part.name: message}
+                            container.seek(0)
+                            files.append((part.name, self.make_file(part, container)))
+
+                event = decoder.next_event()
+
+            if isinstance(event, Epilogue) or not chunk:
+                break
+
+        return MultiDict(fields), MultiDict(files)
+
+    def check_field(self, name, value, list_counts=None):
+        """
+        check a (non file) field as soon as it has been read
+
+        Parameters
+        ----------
+        list_counts : dict or None
+            {field name: values read so far}, for list fields, every
+            value of a list field is an item of the list
+
+        Returns
+        -------
+        dict or None
+            the errors, if any
+        """
+        checker = self.checker.checkers.get(name)
+        # file restrictions look at request.files, which is only
+        # filled in once the whole body has been read
+        if checker is None or isinstance(checker, FileRestriction):
+            return None
+
+        if isinstance(checker, ListRestriction):
+            if list_counts is None:
+                list_counts = {}
+            index = list_counts.get(name, 0)
+            list_counts[name] = index + 1
+            is_valid, message = checker.check_item(index, value)
+        else:
+            is_valid, message = checker.check_for({name: value})
+        if not is_valid:
+            return {name: message}
+
+        return None
+
+    def check_file_count(self, name, file_counts):
+        """
+        count a file about to be read, checking the maximum number
+        of files for its field
+
+        Returns
+        -------
+        dict or None
+            the errors, if any
+        """
+        file_counts[name] = file_counts.get(name, 0) + 1
+
+        restriction = self.checker.checkers.get(name)
+        if isinstance(restriction, FileRestriction) and restriction.number is not None:
+            if file_counts[name] > restriction.number:
+                return {name: restriction.number_error}
+
+        return None
+
+    @staticmethod
+    def close_files(open_files):
+        for open_file in open_files:
+            try:
+                open_file.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def decode(part, data):
+        """
+        decode a field, in its charset (if any), unknown charsets
+        (sent by the client) are ignored, utf-8 is used instead
+        """
+        charset = "utf-8"
+        content_type = part.headers.get("content-type")
+        if content_type:
+            charset = parse_options_header(content_type)[1].get("charset", charset)
+            try:
+                codecs.lookup(charset)
+            except LookupError:
+                charset = "utf-8"
+
+        return data.decode(charset, "replace")
+
+    @staticmethod
+    def make_file(part, container):
+        """make the FileStorage for a fully read file"""
+        return FileStorage(container, part.filename, part.name, headers=part.headers)
@@ -0,0 +1,248 @@
+"""
+checking csv and ndjson (newline delimited json) files outside of
+a request, i.e. large uploaded files, or files in a nightly job
+
+files are read lazily, a chunk of rows at a time (checked with
+`ValueChecker.check_many(...)`), so the memory used stays the
+same whatever the size of the file, only invalid rows are yielded
+"""
+from contextlib import contextmanager
+from itertools import islice, tee
+import csv
+import io
+import json
+import os
+import textwrap
+
+from .value_checker import ValueChecker
+from .restrictions import FileRestriction
+from .errors import FlaskValueCheckerValueError, field_error
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# rows which aren't records at all are reported under this key
+ROW_KEY = "__row__"
+MALFORMED_ROW_ERROR = field_error("MALFORMED_ROW", "row is not a json object")
+
+
+def validate_csv(
+    checker,
+    file,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    encoding="utf-8",
+    processes=None,
+    **reader_options
+):
+    """
+    check every row of a csv file, the first row is the header,
+    with the field names
+
+    empty cells are empty strings, as empty form fields are, cells
+    missing at the end of a row are missing values
+
+    Parameters
+    ----------
+    checker : ValueChecker or str
+        the checker, or the checker text
+
+    file : str, path or file
+        the file, or its path, opened in text or binary mode
+
+    chunk_size : int
+        the number of rows checked at once
+
+    encoding : str
+        the encoding of the file, if it's a path or a binary file
+
+    processes : int or None
+        check the rows in this many worker processes, the file is still
+        read in this process, see parallel.iter_chunk_results
+
+    reader_options
+        passed on to `csv.DictReader(...)`, i.e. `delimiter=";"`
+
+    Yields
+    ------
+    (int, dict)
+        the row number (the header is row 1) and the errors,
+        for every invalid row
+    """
+    checker = get_offline_checker(checker)
+
+    with open_text(file, encoding) as text_file:
+        reader = csv.DictReader(text_file, **reader_options)
+        numbered_records = enumerate(reader, start=2)
+        yield from iter_errors(checker, numbered_records, chunk_size, processes)
+
+
+def validate_ndjson(
+    checker, file, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8", processes=None
+):
+    """
+    check every line of a newline delimited json file, every
+    (non blank) line should be a json object
+
+    Parameters
+    ----------
+    checker : ValueChecker or str
+        the checker, or the checker text
+
+    file : str, path or file
+        the file, or its path, opened in text or binary mode
+
+    chunk_size : int
+        the number of rows checked at once
+
+    encoding : str
+        the encoding of the file, if it's a path or a binary file
+
+    processes : int or None
+        check the rows in this many worker processes, the file is still
+        read in this process, see parallel.iter_chunk_results
+
+    Yields
+    ------
+    (int, dict)
+        the line number and the errors, for every invalid line, lines
+        which aren't json objects have the error under ROW_KEY
+    """
+    checker = get_offline_checker(checker)
+
+    with open_text(file, encoding) as text_file:
+        numbered_records = iter_json_lines(text_file)
+        yield from iter_errors(checker, numbered_records, chunk_size, processes)
+
+
+def iter_json_lines(text_file):
+    """
+    Yields
+    ------
+    (int, dict or None)
+        the line number and the json object, None if the
+        line isn't a json object, blank lines are skipped
+    """
+    for line_number, line in enumerate(text_file, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+
+        if not isinstance(record, dict):
+            record = None
+
+        yield line_number, record
+
+
+def iter_errors(
+    checker, numbered_records, chunk_size=DEFAULT_CHUNK_SIZE, processes=None
+):
+    """
+    check records a chunk at a time
+
+    Parameters
+    ----------
+    checker : ValueChecker
+
+    numbered_records : iterable of (int, dict or None)
+        the records and their row numbers, None for rows
+        which aren't records
+
+    chunk_size : int
+        the number of records checked at once
+
+    processes : int or None
+        check the chunks in this many worker processes,
+        see parallel.iter_chunk_results
+
+    Yields
+    ------
+    (int, dict)
+        the row number and the errors, for every invalid row
+    """
+    numbered_chunks, record_chunks = tee(iter_chunks(numbered_records, chunk_size))
+    record_chunks = (
+        [record or {} for record in records] for _, records in record_chunks
+    )
+
+    if processes is None:
+        chunk_results = map(checker.check_many, record_chunks)
+    else:
+        from . import parallel
+
+        chunk_results = parallel.iter_chunk_results(checker, record_chunks, processes)
+
+    for (row_numbers, records), results in zip(numbered_chunks, chunk_results):
+        for row_number, record, errors in zip(row_numbers, records, results):
+            if record is None:
+                yield row_number, {ROW_KEY: MALFORMED_ROW_ERROR}
+            elif errors is not None:
+                yield row_number, errors
+
+
+def iter_chunks(numbered_records, chunk_size):
+    """
+    Yields
+    ------
+    (list of ints, list of (dict or None))
+        the row numbers and records, `chunk_size` at a time
+    """
+    numbered_records = iter(numbered_records)
+    while True:
+        chunk = list(islice(numbered_records, chunk_size))
+        if not chunk:
+            return
+        row_numbers, records = zip(*chunk)
+        yield row_numbers, records
+
+
+def get_offline_checker(checker):
+    """
+    get the checker to use for files, making one from the
+    text if needed, files can't have file fields
+
+    Returns
+    -------
+    ValueChecker
+    """
+    if isinstance(checker, str):
+        checker = ValueChecker(checker)
+
+    for restriction in checker.checkers.values():
+        if isinstance(restriction, FileRestriction):
+            raise FlaskValueCheckerValueError(
+                textwrap.dedent(
+                    f"""\
+            file parameters can only be checked in a request,
+            not in a csv or ndjson file
+
+            error in line: {restriction.raw_line}
+            """
+                )
+            )
+
+    return checker
+
+
+@contextmanager
+def open_text(file, encoding):
+    """
+    open a path, or wrap a binary file, for reading text,
+    files passed in are left open
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, encoding=encoding, newline="") as text_file:
+            yield text_file
+
+    elif isinstance(file.read(0), bytes):
+        text_file = io.TextIOWrapper(file, encoding=encoding, newline="")
+        try:
+            yield text_file
+        finally:
+            # so the binary file isn't closed along with the wrapper
+            text_file.detach()
+
+    else:
+        yield file
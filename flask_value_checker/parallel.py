@@ -0,0 +1,125 @@
+"""
+checking records in worker processes, for large offline batches
+
+the checker is sent to every worker once, when the worker starts,
+as its flattened checkers, and compiled again there, so the workers
+don't need its fragments or restriction types registered (see
+`ValueChecker.__reduce__`), the records are then sent in chunks, and
+the results are put back together in the order of the records
+"""
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+
+from . import batch
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# the checker of the current worker process, see `init_worker(...)`
+_worker_checker = None
+
+
+def init_worker(checker):
+    global _worker_checker
+    _worker_checker = checker
+
+
+def check_chunk(records):
+    return batch.check_many(_worker_checker, records)
+
+
+def iter_chunk_results(checker, chunks, processes=None):
+    """
+    check chunks of records in worker processes, at most two chunks
+    per worker are sent ahead, so the chunks can be read lazily
+
+    Parameters
+    ----------
+    checker : ValueChecker
+
+    chunks : iterable
+        the chunks of records, each a list of dicts or a dict of lists
+
+    processes : int or None
+        the number of worker processes, `os.cpu_count()` if None
+
+    Yields
+    ------
+    list of (dict or None)
+        the results of `check_many(...)` for every chunk, in order
+    """
+    processes = processes or os.cpu_count() or 1
+    chunks = iter(chunks)
+
+    with ProcessPoolExecutor(
+        processes, initializer=init_worker, initargs=(checker,)
+    ) as executor:
+        pending = deque()
+        for chunk in islice(chunks, processes * 2):
+            pending.append(executor.submit(check_chunk, chunk))
+
+        while pending:
+            results = pending.popleft().result()
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(check_chunk, chunk))
+            yield results
+
+
+def split_records(records, chunk_size):
+    """
+    split records into chunks of `chunk_size` records
+
+    Yields
+    ------
+    list of dicts or dict of lists
+        the chunks, the same kind of batch as the records
+    """
+    if isinstance(records, Mapping):
+        size = max((len(column) for column in records.values()), default=0)
+        for start in range(0, size, chunk_size):
+            end = start + chunk_size
+            yield {key: column[start:end] for key, column in records.items()}
+        return
+
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check_many(checker, records, processes=None, chunk_size=None):
+    """
+    `ValueChecker.check_many(...)`, in worker processes
+
+    Parameters
+    ----------
+    checker : ValueChecker
+
+    records : list of dicts, or dict of lists
+        see batch.to_columns
+
+    processes : int or None
+        the number of worker processes, `os.cpu_count()` if None
+
+    chunk_size : int or None
+        the number of records sent to a worker at once
+
+    Returns
+    -------
+    list of (dict or None)
+        one item per record, dict if there are errors,
+        None if there are no errors
+    """
+    if isinstance(records, Mapping):
+        # every column should have the same length
+        batch.to_columns(records, ())
+
+    chunks = split_records(records, chunk_size or DEFAULT_CHUNK_SIZE)
+    results = []
+    for chunk_results in iter_chunk_results(checker, chunks, processes):
+        results.extend(chunk_results)
+    return results
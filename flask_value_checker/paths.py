@@ -0,0 +1,91 @@
+"""
+dotted field names, i.e. `address.city : str`, are paths into nested
+(json) objects
+
+the paths of a checker are compiled into a tree once, and the values
+are then resolved by walking the tree and the nested objects together,
+in a single pass, every object on the way is only looked at once, no
+matter how many paths go through it
+
+in form data and query parameters, dotted names are plain names
+"""
+
+
+def make_path_tree(field_names):
+    """
+    compile the dotted field names of a checker into a tree
+
+    Parameters
+    ----------
+    field_names : iterable of strs
+
+    Returns
+    -------
+    tuple or None
+        the nodes of the tree, (key, path, children) tuples, where
+        path is the dotted field name ending at the node (or None if
+        no field ends there), None if there are no dotted names
+    """
+    root = {}
+    for field_name in field_names:
+        if "." not in field_name:
+            continue
+
+        node = root
+        parts = field_name.split(".")
+        for i, part in enumerate(parts):
+            # [path, children] of every key
+            entry = node.setdefault(part, [None, {}])
+            if i == len(parts) - 1:
+                entry[0] = field_name
+            node = entry[1]
+
+    if not root:
+        return None
+
+    return freeze_nodes(root)
+
+
+def freeze_nodes(nodes):
+    return tuple(
+        (key, path, freeze_nodes(children))
+        for key, (path, children) in nodes.items()
+    )
+
+
+def resolve_paths(values, path_tree):
+    """
+    get the values of every dotted field name, as if they were
+    top level keys
+
+    Parameters
+    ----------
+    values : dict
+        i.e. the json body of a request
+
+    path_tree : tuple
+        see `make_path_tree(...)`
+
+    Returns
+    -------
+    dict
+        a copy of values, with the value of every (present) dotted
+        field name added, keys actually named with dots are kept
+    """
+    resolved = dict(values)
+    stack = [(values, path_tree)]
+
+    while stack:
+        value, nodes = stack.pop()
+        for key, path, children in nodes:
+            child = value.get(key)
+            if child is None:
+                continue
+
+            if path is not None and path not in resolved:
+                resolved[path] = child
+
+            if children and isinstance(child, dict):
+                stack.append((child, children))
+
+    return resolved
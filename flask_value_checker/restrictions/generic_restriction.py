@@ -1,5 +1,3 @@
-from flask import request
-
 from .. import errors
 import textwrap
 
@@ -11,20 +9,79 @@ class GenericRestriction:
     all restrictions must be a subclass of this
     """
 
-    def __init__(self, raw_line: str, parameter: str, raw_restrictions: str):
+    # subclasses list the attributes they set in their own __slots__
+    __slots__ = ("raw_line", "parameter", "raw_restrictions", "__weakref__")
+
+    # roughly how expensive `check_for(...)` is, fail fast checkers
+    # run the cheapest restrictions first
+    check_cost = 0
+
+    # attributes which read something besides the checker text (i.e.
+    # files), restrictions using them are never shared between
+    # schemas, see restrictions.make_shared_restriction
+    unshared_attributes = frozenset()
+
+    def __init__(self, raw_line: str, parameter: str, raw_restrictions: list):
         self.raw_line = raw_line
         self.parameter = parameter
+        # the parsed attributes, i.e. [("lenlim", (1.0, 5.0))]
         self.raw_restrictions = raw_restrictions
 
         self.__init_restriction__()
-        self.compile()
+        self.compile(raw_restrictions)
+
+    def __reduce__(self):
+        # pickled as its class and parsed attributes, and compiled again
+        # when unpickled, that's cheaper to send than the compiled state,
+        # and doesn't need the type keyword to be registered (i.e. in a
+        # worker process started with "spawn")
+        from .restrictions import make_shared_restriction
+
+        return (
+            make_shared_restriction,
+            (self.__class__, self.raw_line, self.parameter, self.raw_restrictions),
+        )
 
-    def compile(self):
-        for restriction in self.raw_restrictions:
+    def compile(self, raw_restrictions: list):
+        """
+        compile the parsed attributes, i.e. [("lenlim", (1.0, 5.0))]
+        """
+        for restriction in raw_restrictions:
             name, vals = restriction
             name, vals = self.check_and_nicefy_attribute(name, vals)
             self.compile_restriction(name, vals)
 
+        self.__finish_restriction__()
+
+        default = getattr(self, "default", None)
+        if default is not None:
+            self.check_default(default)
+
+    def check_default(self, default):
+        """
+        check that the default value (see `default(...)` attributes)
+        is itself a valid value
+        """
+        is_valid, message, _ = self.clean_value(default)
+        if not is_valid:
+            raise errors.FlaskValueCheckerValueError(
+                textwrap.dedent(
+                    f"""\
+            the default value {default!r} is invalid, ({message})
+
+            error in line: {self.raw_line}
+            """
+                )
+            )
+
+    def __finish_restriction__(self):
+        """
+        called once every attribute has been compiled, for work
+        needing all the attributes (i.e. precomputing values used
+        by `check_for(...)`)
+        """
+        pass
+
     def check_and_nicefy_attribute(self, name, params):
         """
         checks if an attribute has been written properly
@@ -123,6 +180,21 @@ class GenericRestriction:
                     )
                 )
 
+        elif para_type == "str" or para_type == str:
+            if isinstance(value, str):
+                return value
+            else:
+                raise errors.FlaskValueCheckerValueError(
+                    textwrap.dedent(
+                        f"""\
+                restriction "{parameter}" cannot have the value "{value}",
+                as it isn't a quoted string
+
+                error in line: {self.raw_line}
+                """
+                    )
+                )
+
         elif para_type.startswith("list of "):
             list_type_str = para_type[len("list of ") :]
             if not isinstance(value, list):
@@ -238,13 +310,121 @@ class GenericRestriction:
             "this function should be overridden by subclassing class"
         )
 
+    def is_present(self, checking_part):
+        """
+        check if a value has been submitted for the parameter at all
+
+        Parameters
+        ----------
+        checking_part
+            request.form/request.args/a multidict
+
+        Returns
+        -------
+        bool
+        """
+        return checking_part.get(self.parameter, None) is not None
+
+    def clean_for(self, checking_part):
+        """
+        `check_for(...)`, also getting the value handed to the view,
+        (see `ValueChecker.clean_for`), i.e. the parsed number, for
+        numbers, so it is only parsed once
+
+        by default, the value is the submitted value, or the `default`
+        attribute (if any) when it is missing, subclasses override this
+        to check and clean the value at once
+
+        Returns
+        -------
+        is_valid, message, value
+            see `check_for(...)`, value is None if the value is invalid
+        """
+        is_valid, message = self.check_for(checking_part)
+        if not is_valid:
+            return False, message, None
+
+        value = checking_part.get(self.parameter, None)
+        if value is None:
+            return True, None, getattr(self, "default", None)
+
+        return True, None, value
+
+    def clean_value(self, value):
+        """
+        check and clean a single (present) value, i.e. an item of a
+        list, or the default value, see `clean_for(...)`
+
+        Returns
+        -------
+        is_valid, message, value
+            see `clean_for(...)`
+        """
+        is_valid, message = self.check_for({self.parameter: value})
+        if not is_valid:
+            return False, message, None
+
+        return True, None, value
+
+    def check_column(self, values):
+        """
+        check the values of many records at once, for `check_many(...)`,
+
+        by default `check_for(...)` is called for every value,
+        subclasses override this with a loop keeping the restriction's
+        state in local variables
+
+        Parameters
+        ----------
+        values : list
+            the value of the parameter in every record, None where
+            it is missing
+
+        Returns
+        -------
+        list of (int, str)
+            the index and message of every invalid value
+        """
+        check_for = self.check_for
+        parameter = self.parameter
+        errors = []
+
+        for i, value in enumerate(values):
+            is_valid, message = check_for({parameter: value})
+            if not is_valid:
+                errors.append((i, message))
+
+        return errors
+
+    def generate_check(self, key, builder):
+        """
+        add python source equivalent to `check_for(...)` to a
+        generated function, see codegen.SourceBuilder for the
+        variables available to the source
+
+        by default, the generated source calls `check_for(...)`,
+        subclasses override this with specialized source
+
+        Parameters
+        ----------
+        key : str
+            the field name the errors are reported under
+
+        builder : codegen.SourceBuilder
+            the builder to add the source to
+        """
+        restriction = builder.const(self)
+        builder.line(f"is_valid, message = {restriction}.check_for(checking_part)")
+        builder.line("if not is_valid:")
+        with builder.indent():
+            builder.error_expr(key, "message")
+
     def __repr__(self):
         return textwrap.dedent(
             f"""\
         <{self.__class__.__name__}
          raw_code_line : '{self.raw_line}'
          parameter_name : '{self.parameter}'
-         raw_restrictions : '{self.raw_restrictions}'
-         required : {self.required}
+         optional : {getattr(self, 'optional', False)}
         >"""
         )
@@ -1,25 +1,206 @@
 import textwrap
 import string
+import re
 
 from . import restrictions
-from .. import errors
+from .. import errors, fragments
 
 NUMBER_VALID_VALS = string.digits + "-" + "inf"
+# float(...) only succeeds on words starting with one of these
+FLOAT_START_CHARS = string.digits + "-iInN"
+QUOTE_CHARS = ("'", '"')
+ESCAPABLE_CHARS = ("'", '"', "\\")
+
+# the scanner works on runs of characters matched by these
+# (precompiled) patterns, rather than one character at a time
+SPACES_RE = re.compile(r" *")
+WORD_RE = re.compile(r"[A-Za-z0-9_\-]*")
+STRING_BODY_RES = {
+    "'": re.compile(r"[^'\\]*"),
+    '"': re.compile(r'[^"\\]*'),
+}
+
+ATTR_END_ERROR = (
+    "attributes must end with a '/' or, "
+    + "in case they are the last character, spaces or nothing,"
+    + "or a '#' if its before a comment,"
+    + "they should not end with a {0}"
+)
+
+
+def make_restrictions(raw_lines: str, share: bool = True):
+    """
+    compile checker text
 
+    Parameters
+    ----------
+    raw_lines : str
+        check strings, must be in the format mentioned
 
-def make_restrictions(raw_lines: str):
-    raw_lines = raw_lines.split("\n")
-    checkers = {}
+    share : bool
+        reuse restrictions already compiled for the same field
+        (i.e. by other schemas), see restrictions.make_shared_restriction
+
+    Returns
+    -------
+    dict
+        {field name: restriction}
+    """
+    return build_restrictions(parse_restrictions(raw_lines), share)
+
+
+def parse_restrictions(raw_lines: str):
+    """
+    parse checker text, without compiling it, the parsed text only
+    holds lists, tuples, strs and floats, so it can be marshalled
+    (see disk_cache.DiskCache)
+
+    Returns
+    -------
+    list of (str, str, list) tuples
+        (raw line, field name, parsed attributes) for every line
+        which isn't empty or a comment, or (raw line, None,
+        (directive, fragment name)) for `include <name>` and
+        `extend <name>` lines, see fragments.py
+    """
+    parsed = []
+
+    for line in raw_lines.split("\n"):
+        directive = fragments.DIRECTIVE_RE.match(line.strip())
+        if directive is not None:
+            parsed.append((line, None, directive.group(1, 2)))
+            continue
 
-    for line in raw_lines:
         rest_parser = RestrictionParser(line)
         if not (rest_parser.is_comment_line or rest_parser.is_empty_line):
-            field_name, checker = rest_parser.get_appropriate_restriction()
-            checkers[field_name] = checker
+            parsed.append((line, rest_parser.field_name, rest_parser.attrs))
+
+    return parsed
+
+
+def build_restrictions(parsed, share: bool = True, using=()):
+    """
+    compile parsed checker text (see `parse_restrictions(...)`),
+    the fields of the fragments it uses are flattened into it,
+    see fragments.py
+
+    Parameters
+    ----------
+    using : tuple of strs
+        the fragments being compiled, which use this text
+
+    Returns
+    -------
+    dict
+        {field name: restriction}
+    """
+    checkers = {}
+    # {field name: (directive, fragment name)} of the fields
+    # from fragments, fields defined by the text itself aren't here
+    origins = {}
+
+    for raw_line, field_name, attrs in parsed:
+        if field_name is not None:
+            if field_name in origins:
+                directive, fragment_name = origins.pop(field_name)
+                if directive == "include":
+                    raise_redefined(field_name, fragment_name, raw_line)
+
+            checkers[field_name] = build_restriction(raw_line, field_name, attrs, share)
+            continue
+
+        directive, fragment_name = attrs
+        fragment = fragments.get_fragment(fragment_name)
+        for name, checker in fragment.get_checkers(share, using).items():
+            if name in checkers:
+                if name in origins:
+                    raise_redefined(name, origins[name][1], raw_line)
+                if directive == "include":
+                    raise_redefined(name, fragment_name, raw_line)
+                # extended, the field of the text itself is kept
+                continue
+
+            checkers[name] = checker
+            origins[name] = (directive, fragment_name)
 
     return checkers
 
 
+def raise_redefined(field_name, fragment_name, raw_line):
+    raise errors.FlaskValueCheckerValueError(
+        textwrap.dedent(
+            f"""\
+    the field {field_name} is defined more than once (with the fragment
+    {fragment_name}), only the fields of fragments used with `extend <name>`
+    can be defined again, by the checker text itself
+
+    Error in line:
+    {raw_line}
+    """
+        )
+    )
+
+
+def build_restriction(raw_line, field_name, attrs, share=True):
+    """
+    compile the parsed attributes of a line, the first attribute
+    is the value type, see `make_restrictions(...)` for `share`
+
+    Returns
+    -------
+    GenericRestriction
+    """
+    # ensure the first argument (i.e. type argument) has not parameters
+    type_str, type_attrs = attrs[0]
+
+    if type_attrs:
+        raise errors.FlaskValueCheckerSyntaxError(
+            textwrap.dedent(
+                f"""\
+                the type attribute should NOT have attributes,
+                (i.e. here, {type_str} should not have paranthesis, i.e.
+                the ({type_attrs}) part)
+                """
+            )
+        )
+
+    r_attrs = attrs[1:]
+
+    RClass = restrictions.get_restriction_type(type_str)
+
+    if RClass is None:
+        known_value_types = list(restrictions.restriction_types)
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        unknown value type {type_str},
+        please choose a value type out of {known_value_types}
+
+        Error in line:
+        {raw_line}
+        """
+            )
+        )
+
+    if share:
+        return restrictions.make_shared_restriction(
+            RClass, raw_line, field_name, r_attrs
+        )
+    else:
+        return RClass(raw_line, field_name, r_attrs)
+
+
+def make_restriction(raw_line: str):
+    """
+    compile a single (non empty, non comment) line of checker text
+
+    Returns
+    -------
+    GenericRestriction
+    """
+    return RestrictionParser(raw_line).get_appropriate_restriction()[1]
+
+
 class RestrictionParser:
     """
     parser to parse flask-value-checker
@@ -27,6 +208,10 @@ class RestrictionParser:
     format <StringRestrictionText>:
         <parameter_name> : <attr>/<attr>/<attr>
 
+    format <parameter_name>:
+        <name>
+        <name>.<name>.<name> (a path into nested json objects)
+
     format <attr>:
         <attr_name>
         <attr_name>()
@@ -34,6 +219,13 @@ class RestrictionParser:
 
     format <val>:
         str, list, or
+
+    the first attribute is the value type, `list of <type>` for lists
+
+    the line is scanned in a single pass, the scanner consumes whole
+    runs of characters (spaces, names, numbers, string contents) with
+    precompiled regexes, which are fed into a small recursive descent
+    parser (one method per item in the format above)
     """
 
     def __init__(self, raw_line):
@@ -51,151 +243,132 @@ class RestrictionParser:
         else:
             self.is_empty_line = True
 
-    def get_appropriate_restriction(self):
+    def get_appropriate_restriction(self, share=True):
         """
         get the appropriate restriction based on the
-        first attribute
+        first attribute, see `make_restrictions(...)` for `share`
         """
-        # ensure the first argument (i.e. type argument) has not parameters
-        type_str, type_attrs = self.attrs[0]
-
-        if type_attrs:
-            raise errors.FlaskValueCheckerSyntaxError(
-                textwrap.dedent(
-                    f"""\
-                    the type attribute should NOT have attributes,
-                    (i.e. here, {type_str} should not have paranthesis, i.e.
-                    the ({type_attrs}) part)
-                    """
-                )
-            )
-
-        r_attrs = self.attrs[1:]
-
-        restriction_classes = restrictions.get_restriction_classes()
-
-        for RClass in restriction_classes:
-            if RClass.type_keyword == type_str:
-                checker = RClass(self.raw_line, self.field_name, r_attrs)
-                break
-        else:
-            known_value_types = [r.type_keyword for r in restriction_classes]
-            raise errors.FlaskValueCheckerValueError(
-                textwrap.dedent(
-                    f"""\
-            unknown value type {type_str},
-            please choose a value type out of {known_value_types}
-
-            Error in line:
-            {self.raw_line}
-            """
-                )
-            )
-
+        checker = build_restriction(self.raw_line, self.field_name, self.attrs, share)
         return self.field_name, checker
 
     def parse(self):
-        self.minus_space_gulper()
-        if self.curr_char == "#":
+        self.gulp_spaces()
+        curr_char = self.curr_char
+        if curr_char == "#":
             self.is_comment_line = True
-        elif self.curr_char is None:
+        elif curr_char is None:
             self.is_empty_line = True
         else:
             self.set_field_name()
-            self.minus_space_gulper()
+            self.curr_pos += 1
+            self.gulp_spaces()
             self.parse_attrs()
 
     @property
     def curr_char(self):
-        try:
+        if self.curr_pos < len(self.raw_line):
             return self.raw_line[self.curr_pos]
-        except IndexError:
-            return None
+        return None
 
-    def gulp_char(self):
-        self.curr_pos += 1
+    def gulp_spaces(self):
+        self.curr_pos = SPACES_RE.match(self.raw_line, self.curr_pos).end()
 
-    def minus_space_gulper(self):
-        self.gulp_char()
-        while self.curr_char == " ":
-            self.gulp_char()
+    def gulp_word(self):
+        match = WORD_RE.match(self.raw_line, self.curr_pos)
+        self.curr_pos = match.end()
+        return match.group()
 
     def set_field_name(self):
-        self.field_name = self.parse_variable()
-        try:
-            self.curr_pos = self.raw_line.index(":")
-        except:
+        field_name = self.parse_variable()
+
+        # dotted names are paths into nested json objects, see paths.py
+        while self.curr_char == ".":
+            self.curr_pos += 1
+            part = self.gulp_word()
+            if not part:
+                self.raise_syntax_error("a dotted field name has an empty part")
+            field_name += "." + part
+
+        self.field_name = field_name
+        colon_pos = self.raw_line.find(":")
+        if colon_pos == -1:
             self.raise_syntax_error(
                 "there must be a `:`  to seperate the param and its attributes"
             )
+        self.curr_pos = colon_pos
 
     def parse_attrs(self):
-        attr_just_found = False
         while True:
-            if attr_just_found:
-                if self.curr_char == "/":
-                    attr_just_found = False
-                    self.minus_space_gulper()
-                elif self.curr_char is None or self.curr_char == "#":
-                    break
-                else:
-                    self.raise_syntax_error(
-                        f"attributes must end with a '/' or, \
-    in case they are the last character, spaces or nothing,\
-    or a '#' if its before a comment,\
-    they should not end with a {self.curr_char}"
-                    )
+            self.attrs.append(self.parse_attr())
 
+            # parse_attr(...) only returns on a "/", a "#" or the end of the line
+            if self.curr_char == "/":
+                self.curr_pos += 1
+                self.gulp_spaces()
             else:
-                attr = self.parse_attr()
-                self.attrs.append(attr)
-                attr_just_found = True
+                break
 
     def parse_attr(self):
-        name = ""
         params = []
 
-        if self.curr_char in string.ascii_lowercase:
-            name = self.parse_variable()
-        else:
+        curr_char = self.curr_char
+        if curr_char is None or curr_char not in string.ascii_lowercase:
             self.raise_syntax_error(
                 "invalid attribute name (attributes can only start with a lower case letter)"
             )
 
-        if self.curr_char == " ":
-            self.minus_space_gulper()
+        name = self.parse_variable()
+        self.gulp_spaces()
+
+        if name == "list" and not self.attrs:
+            name = self.parse_list_type()
 
         if self.curr_char == "(":
             params = self.parse_attr_params()
+            self.gulp_spaces()
 
-        if self.curr_char == " ":
-            self.minus_space_gulper()
-
-        if self.curr_char == "/" or self.curr_char == None or self.curr_char == "#":
+        curr_char = self.curr_char
+        if curr_char == "/" or curr_char is None or curr_char == "#":
             return name, params
         else:
+            self.raise_syntax_error(ATTR_END_ERROR.format(curr_char))
+
+    def parse_list_type(self):
+        """
+        parse the rest of a `list of <type>` value type, after the "list"
+
+        Returns
+        -------
+        str
+            the value type, i.e. "list of str"
+        """
+        if self.gulp_word() != "of":
             self.raise_syntax_error(
-                f"attributes must end with a '/' or, \
-in case they are the last character, spaces or nothing,\
-or a '#' if its before a comment,\
-they should not end with a {self.curr_char}"
+                "list types should be written as `list of <type>`, i.e. `list of str`"
             )
 
+        self.gulp_spaces()
+        item_type = self.parse_variable()
+        if not item_type:
+            self.raise_syntax_error("list types need an item type, i.e. `list of str`")
+
+        self.gulp_spaces()
+        return f"list of {item_type}"
+
     def parse_attr_params(self):
-        self.check_starting_character("(", "attribute parameter")
         # remove the first "("
-        self.gulp_char()
+        self.curr_pos += 1
 
-        first_param = self.parse_attr_param()
-        params = [first_param]
+        params = [self.parse_attr_param()]
 
         while True:
-            if self.curr_char == ",":
-                self.minus_space_gulper()
-                param = self.parse_attr_param()
-                params.append(param)
-            elif self.curr_char == ")":
-                self.gulp_char()
+            curr_char = self.curr_char
+            if curr_char == ",":
+                self.curr_pos += 1
+                self.gulp_spaces()
+                params.append(self.parse_attr_param())
+            elif curr_char == ")":
+                self.curr_pos += 1
                 break
             else:
                 self.raise_syntax_error("parser error, invalid character")
@@ -203,73 +376,51 @@ they should not end with a {self.curr_char}"
         return tuple(params)
 
     def parse_attr_param(self):
-        value_just_found = False
-        while True:
-            if value_just_found:
-                if self.curr_char == "," or self.curr_char == ")":
-                    break
-                else:
-                    self.raise_syntax_error(
-                        "parameters for attributes should be split with a `,` or end with a `)`"
-                    )
-            else:
-                if self.curr_char in NUMBER_VALID_VALS:
-                    val = self.parse_number()
-                elif self.curr_char == "[":
-                    val = self.parse_list()
-                else:
-                    self.raise_syntax_error(
-                        f"invalid value for parameter to start with `{self.curr_char}`"
-                    )
-                break
+        curr_char = self.curr_char
+        if curr_char is not None and curr_char in NUMBER_VALID_VALS:
+            val = self.parse_number()
+        elif curr_char == "[":
+            val = self.parse_list()
+        elif curr_char in QUOTE_CHARS:
+            val = self.parse_string()
+        else:
+            self.raise_syntax_error(
+                f"invalid value for parameter to start with `{curr_char}`"
+            )
 
-            self.gulp_char()
         return val
 
     def parse_list(self):
-        self.check_starting_character("[", "list")
         # remove the first `[`
-        self.gulp_char()
+        self.curr_pos += 1
 
         vals = []
-        element_just_found = False
         while True:
-            if element_just_found:
-                if self.curr_char == ",":
-                    self.minus_space_gulper()
-                    element_just_found = False
-                elif self.curr_char == "]":
-                    self.gulp_char()
-                    break
-                else:
-                    self.raise_syntax_error(
-                        "elements in list should be seperated by a comma"
-                    )
-
-            if self.curr_char == '"' or self.curr_char == "'":
-                val = self.parse_string()
-                vals.append(val)
-                element_just_found = True
-
-            elif self.curr_char in NUMBER_VALID_VALS:
-                val = self.parse_number()
-                vals.append(val)
-                element_just_found = True
+            curr_char = self.curr_char
+            if curr_char in QUOTE_CHARS:
+                vals.append(self.parse_string())
+            elif curr_char is not None and curr_char in NUMBER_VALID_VALS:
+                vals.append(self.parse_number())
             else:
                 self.raise_syntax_error("invalid character")
+
+            curr_char = self.curr_char
+            if curr_char == ",":
+                self.curr_pos += 1
+                self.gulp_spaces()
+            elif curr_char == "]":
+                self.curr_pos += 1
+                break
+            else:
+                self.raise_syntax_error("elements in list should be seperated by a comma")
+
         return vals
 
     def parse_variable_or_number(self):
-        var_name = ""
-        while True:
-            if self.curr_char is None:
-                break
+        var_name = self.gulp_word()
 
-            if self.curr_char in string.ascii_letters + string.digits + "_-":
-                var_name += self.curr_char
-            else:
-                break
-            self.gulp_char()
+        if not var_name or var_name[0] not in FLOAT_START_CHARS:
+            return var_name
 
         try:
             var = float(var_name)
@@ -285,47 +436,53 @@ they should not end with a {self.curr_char}"
             self.raise_syntax_error("value should be a variable and not a number")
 
     def parse_number(self):
+        start = self.curr_pos
         var = self.parse_variable_or_number()
+
+        # the fractional part of a decimal, i.e. `1.5`
+        if type(var) == float and self.curr_char == ".":
+            self.curr_pos += 1
+            self.gulp_word()
+            try:
+                var = float(self.raw_line[start : self.curr_pos])
+            except ValueError:
+                self.raise_syntax_error("invalid decimal number")
+
         if type(var) == float:
             return var
         else:
             self.raise_syntax_error("value should be a number and not a varible")
 
     def parse_string(self):
-        start_char = self.curr_char
-
-        self.check_starting_character(["'", '"'], "string")
+        raw_line = self.raw_line
+        start_char = raw_line[self.curr_pos]
+        body_re = STRING_BODY_RES[start_char]
         # remove the first `"` or `'`
-        self.gulp_char()
+        self.curr_pos += 1
 
-        val = ""
+        parts = []
 
         while True:
-            if self.curr_char == start_char:
-                self.gulp_char()
+            match = body_re.match(raw_line, self.curr_pos)
+            parts.append(match.group())
+            self.curr_pos = match.end()
+
+            curr_char = self.curr_char
+            if curr_char == start_char:
+                self.curr_pos += 1
                 break
-            elif self.curr_char == "\\":
-                self.gulp_char()
-                if self.curr_char in ["'", '"', "\\"]:
-                    val += self.curr_char
+            elif curr_char == "\\":
+                self.curr_pos += 1
+                escaped_char = self.curr_char
+                if escaped_char in ESCAPABLE_CHARS:
+                    parts.append(escaped_char)
+                    self.curr_pos += 1
                 else:
-                    self.raise_syntax_error(f"invalid character : \\{self.curr_char}")
-            elif self.curr_char is None:
-                self.raise_syntax_error("unterminated string")
+                    self.raise_syntax_error(f"invalid character : \\{escaped_char}")
             else:
-                val += self.curr_char
-
-            self.gulp_char()
-        return val
+                self.raise_syntax_error("unterminated string")
 
-    def check_starting_character(self, chars_to_check, item_type):
-        if not isinstance(chars_to_check, list):
-            chars_to_check = [chars_to_check]
-
-        if not self.curr_char in chars_to_check:
-            self.raise_internal_parser_error(
-                "the starting character should be  in {chars_to_check} for a(n) {item_type}"
-            )
+        return "".join(parts)
 
     def raise_syntax_error(self, error_details):
         raise errors.FlaskValueCheckerSyntaxError(
@@ -345,31 +502,11 @@ they should not end with a {self.curr_char}"
             )
         )
 
-    def raise_internal_parser_error(self, error_details):
-        raise errors.FlaskValueCheckerSyntaxError(
-            textwrap.dedent(
-                f"""\
-        {error_details}
-
-        Internal Parser Error
-        (this is NOT the fault of the programmer USING the library,
-         only the programmer who WROTE the library)
-        error character position : {self.curr_pos}
-
-        Error in line :
-        {self.raw_line}
-        {" "*self.curr_pos + "^"}
-
-        at character : `{self.curr_char}`
-        """
-            )
-        )
-
     def __repr__(self):
         if self.is_empty_line:
-            return "<{self.__class__.__name__} empty line>"
+            return f"<{self.__class__.__name__} empty line>"
         elif self.is_comment_line:
-            return "<{self.__class__.__name__} comment line>"
+            return f"<{self.__class__.__name__} comment line>"
         attrs_text = ""
 
         for attr in self.attrs:
@@ -2,20 +2,282 @@
 all the restrictions in flask-value-checker
 
 make sure to create a new restriction be subclassing GenericRestriction,
-make sure the subclass has a 'prefix' property
+make sure the subclass has a 'type_keyword' property
 
-then make sure to add it in the restrictions array in the make_restriction
-function
+then register it with `register_restriction_type(...)`, or, from
+another package, under the "flask_value_checker.restrictions"
+entry point group, which is only loaded when a type keyword isn't
+already registered
 """
 import textwrap
-import colorama
+import warnings
+import weakref
+
 from .rtypes._float import FloatRestriction
 from .rtypes._int import IntRestriction
 from .rtypes.string import StringRestriction
 from .rtypes.file import FileRestriction
+from .rtypes._list import ListRestriction
 
 from .generic_restriction import GenericRestriction
+from .. import errors
+
+ENTRY_POINT_GROUP = "flask_value_checker.restrictions"
+LIST_PREFIX = "list of "
+
+# {type keyword: restriction class}, see `register_restriction_type(...)`
+restriction_types = {}
+_entry_points_loaded = False
+# entry points loading (i.e. compiling checker text) can't load them again
+_entry_points_loading = False
+
+# compiled restrictions, shared by every schema with the same field,
+# see `make_shared_restriction(...)`
+_shared_restrictions = weakref.WeakValueDictionary()
+
+# {item restriction class: list restriction class}, see `get_list_class(...)`
+_list_classes = {}
+
+
+def register_restriction_type(restriction_class, replace=False):
+    """
+    register a restriction class, so its `type_keyword` can be used
+    in checker text, can be used as a class decorator
+
+    register new types before compiling any checker text using them,
+    compiled checker text is cached (see `schema_cache`)
+
+    Parameters
+    ----------
+    restriction_class : type
+        a subclass of GenericRestriction, with a `type_keyword`
+
+    replace : bool
+        replace the restriction class already registered for
+        the type keyword, if any, instead of raising an error
+
+    Returns
+    -------
+    type
+        the restriction class
+
+    Examples
+    --------
+    >>> @register_restriction_type
+    ... class UUIDRestriction(GenericRestriction):
+    ...     type_keyword = "uuid"
+    ...     ...
+    """
+    if not (
+        isinstance(restriction_class, type)
+        and issubclass(restriction_class, GenericRestriction)
+    ):
+        raise errors.FlaskValueCheckerValueError(
+            f"{restriction_class!r} should be a subclass of GenericRestriction"
+        )
+
+    type_keyword = getattr(restriction_class, "type_keyword", None)
+    if not isinstance(type_keyword, str):
+        raise errors.FlaskValueCheckerValueError(
+            f"{restriction_class.__name__} should have a `type_keyword` str"
+        )
+
+    registered_class = restriction_types.get(type_keyword)
+    if registered_class not in (None, restriction_class) and not replace:
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        the value type {type_keyword} is already registered,
+        for {registered_class.__name__}, pass replace=True to replace it
+        """
+            )
+        )
+
+    restriction_types[type_keyword] = restriction_class
+    return restriction_class
+
+
+def get_restriction_type(type_keyword: str):
+    """
+    get the restriction class for a type keyword, the entry points
+    are loaded the first time an unregistered keyword is looked up,
+    "list of <type>" classes are made (and registered) when first
+    looked up, see `make_list_restriction_type(...)`
+
+    Returns
+    -------
+    type or None
+        None if there is no restriction class for the keyword
+    """
+    restriction_class = restriction_types.get(type_keyword)
+    if restriction_class is None and type_keyword.startswith(LIST_PREFIX):
+        return make_list_restriction_type(type_keyword[len(LIST_PREFIX) :])
+
+    if restriction_class is None and not _entry_points_loaded:
+        load_entry_points()
+        restriction_class = restriction_types.get(type_keyword)
+
+    return restriction_class
+
+
+def make_list_restriction_type(item_type_keyword: str):
+    """
+    make and register the restriction class of lists of a type
+
+    Returns
+    -------
+    type or None
+        a subclass of ListRestriction, None if there is no
+        restriction class for the item type
+    """
+    item_class = get_restriction_type(item_type_keyword)
+    if item_class is None:
+        return None
+
+    if issubclass(item_class, (ListRestriction, FileRestriction)):
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        lists of {item_type_keyword} aren't supported, lists can't
+        be nested, and the number of files is set with `file/number(...)`
+        """
+            )
+        )
+
+    return register_restriction_type(get_list_class(item_class))
+
+
+def get_list_class(item_class):
+    """
+    get the subclass of ListRestriction for an item class, made the
+    first time, registered or not (i.e. when unpickled in a worker
+    process), see `make_list_restriction_type(...)`
+
+    Returns
+    -------
+    type
+    """
+    list_class = _list_classes.get(item_class)
+    if list_class is None:
+        list_class = _list_classes[item_class] = type(
+            f"ListOf{item_class.__name__}",
+            (ListRestriction,),
+            {
+                "__slots__": (),
+                "__module__": ListRestriction.__module__,
+                "type_keyword": LIST_PREFIX + item_class.type_keyword,
+                "item_class": item_class,
+                "unshared_attributes": item_class.unshared_attributes,
+            },
+        )
+
+    return list_class
+
+
+def load_entry_points():
+    """
+    register the restriction classes of every installed package,
+    from the "flask_value_checker.restrictions" entry point group,
+    only the first call loads them, entry points which fail to load
+    (or register) are skipped, with a warning
+    """
+    global _entry_points_loaded, _entry_points_loading
+    if _entry_points_loaded or _entry_points_loading:
+        return
+
+    _entry_points_loading = True
+    try:
+        for entry_point in iter_entry_points():
+            try:
+                register_restriction_type(entry_point.load())
+            except Exception as error:
+                warnings.warn(
+                    f"could not load the restriction type of {entry_point!r}, "
+                    + f"from the {ENTRY_POINT_GROUP} entry points: {error!r}",
+                    RuntimeWarning,
+                )
+    finally:
+        _entry_points_loading = False
+
+    _entry_points_loaded = True
+
+
+def iter_entry_points():
+    """
+    Returns
+    -------
+    iterable of importlib.metadata.EntryPoint
+        the entry points in ENTRY_POINT_GROUP
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # python 3.7
+        return []
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=ENTRY_POINT_GROUP)
+
+    # python < 3.10
+    return entry_points.get(ENTRY_POINT_GROUP, [])
+
+
+def make_shared_restriction(restriction_class, raw_line, parameter, raw_restrictions):
+    """
+    make a restriction, or get the one already made with the same
+    class, parameter and parsed attributes (i.e. by another schema),
+    restrictions aren't changed once they are compiled, so they can
+    be shared, they are only kept while a schema is using them,
+    restrictions with `unshared_attributes` (i.e. `acceptfile`, whose
+    file may have changed) are always made again
+
+    Returns
+    -------
+    GenericRestriction
+    """
+    unshared_attributes = restriction_class.unshared_attributes
+    if unshared_attributes and any(
+        name in unshared_attributes for name, _ in raw_restrictions
+    ):
+        return restriction_class(raw_line, parameter, raw_restrictions)
+
+    key = (restriction_class, parameter, repr(raw_restrictions))
+    restriction = _shared_restrictions.get(key)
+
+    if restriction is None:
+        restriction = restriction_class(raw_line, parameter, raw_restrictions)
+        _shared_restrictions[key] = restriction
+
+    return restriction
+
+
+def make_shared_list_restriction(item_class, raw_line, parameter, raw_restrictions):
+    """
+    make a list restriction, from its item class, see
+    `make_shared_restriction(...)` and `ListRestriction.__reduce__`
+
+    Returns
+    -------
+    ListRestriction
+    """
+    return make_shared_restriction(
+        get_list_class(item_class), raw_line, parameter, raw_restrictions
+    )
 
 
 def get_restriction_classes():
-    return [StringRestriction, FloatRestriction, IntRestriction, FileRestriction]
+    """
+    Returns
+    -------
+    list of types
+        every registered restriction class (including the ones from
+        entry points), kept for compatibility, see `restriction_types`
+    """
+    load_entry_points()
+    return list(restriction_types.values())
+
+
+register_restriction_type(StringRestriction)
+register_restriction_type(FloatRestriction)
+register_restriction_type(IntRestriction)
+register_restriction_type(FileRestriction)
@@ -1,17 +1,25 @@
 from ..generic_restriction import GenericRestriction
+from ... import errors
+from ...errors import FieldError, field_error
+import textwrap
 
 
 class FloatRestriction(GenericRestriction):
     type_keyword = "float"
+    number_type = float
+    check_cost = 2
+    __slots__ = ("optional", "min", "max", "default", "required_error", "range_error")
     attributes = {
         "optional": {},
         "lim": {"parameters": [{"type": float}, {"type": float}]},
+        "default": {"parameters": [{"type": float}]},
     }
 
     def __init_restriction__(self):
         self.optional = False
         self.min = -float("inf")
         self.max = float("inf")
+        self.default = None
 
     def compile_restriction(self, name: str, vals: list):
         """
@@ -21,6 +29,82 @@ class FloatRestriction(GenericRestriction):
             self.optional = True
         elif name == "lim":
             self.min, self.max = vals
+        elif name == "default":
+            # a field with a default is optional
+            self.optional = True
+            self.default = self.to_default(vals[0])
+
+    def to_default(self, value):
+        """
+        get the default value, from its parsed (float) value
+
+        Returns
+        -------
+        number_type
+        """
+        if self.number_type is int:
+            if not value.is_integer():
+                raise errors.FlaskValueCheckerValueError(
+                    textwrap.dedent(
+                        f"""\
+                the default value {value} isn't an integer
+
+                error in line: {self.raw_line}
+                """
+                    )
+                )
+            return int(value)
+
+        return value
+
+    def __finish_restriction__(self):
+        """see GenericRestriction.__finish_restriction__ docs"""
+        self.required_error = field_error("VALUE_REQUIRED", "value is required")
+        self.range_error = field_error(
+            "OUT_OF_RANGE",
+            f"value must be between {self.min} and {self.max}",
+            min=self.min,
+            max=self.max,
+        )
+
+    def parse_error(self, value):
+        """
+        the error for a value which cannot be parsed, it includes
+        the value, so it's the one error that can't be precomputed
+
+        Returns
+        -------
+        FieldError
+        """
+        type_name = self.number_type.__name__
+        return FieldError(
+            "NOT_A_NUMBER",
+            f"value {value} cannot be parsed into an {type_name}",
+            value=value,
+            type=type_name,
+        )
+
+    def to_number(self, value):
+        """
+        get the number a submitted value represents,
+        values are either strings (form data/query parameters) or
+        already typed numbers (json)
+
+        Returns
+        -------
+        number_type or None
+            None if the value cannot be parsed into a number_type
+        """
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+
+        return None
 
     def check_for(self, checking_part):
         """see GenericRestriction.check_for docs"""
@@ -30,19 +114,120 @@ class FloatRestriction(GenericRestriction):
             if self.optional:
                 return True, None
             else:
-                return False, "value is required"
+                return False, self.required_error
 
-        try:
-            value = float(value)
-        except ValueError:
-            return False, f"value {value} cannot be parsed into an float"
+        number = self.to_number(value)
+        if number is None:
+            return False, self.parse_error(value)
 
-        if not (value >= self.min and value <= self.max):
-            return False, f"value must be between {self.min} and {self.max}"
+        if not (number >= self.min and number <= self.max):
+            return False, self.range_error
 
         return True, None
 
+    def clean_for(self, checking_part):
+        """see GenericRestriction.clean_for docs"""
+        value = checking_part.get(self.parameter, None)
+
+        if value is None:
+            if self.optional:
+                return True, None, self.default
+            else:
+                return False, self.required_error, None
+
+        return self.clean_value(value)
+
+    def clean_value(self, value):
+        """see GenericRestriction.clean_value docs"""
+        number = self.to_number(value)
+        if number is None:
+            return False, self.parse_error(value), None
+
+        if not (number >= self.min and number <= self.max):
+            return False, self.range_error, None
+
+        return True, None, number
+
+    def check_column(self, values):
+        """see GenericRestriction.check_column docs"""
+        optional = self.optional
+        minimum = self.min
+        maximum = self.max
+        number_type = self.number_type
+        to_number = self.to_number
+        required_error = self.required_error
+        range_error = self.range_error
+        errors = []
+
+        for i, value in enumerate(values):
+            if value is None:
+                if not optional:
+                    errors.append((i, required_error))
+                continue
+
+            if value.__class__ is str:
+                try:
+                    number = number_type(value)
+                except ValueError:
+                    number = None
+            else:
+                number = to_number(value)
+
+            if number is None:
+                errors.append((i, self.parse_error(value)))
+            elif not (number >= minimum and number <= maximum):
+                errors.append((i, range_error))
+
+        return errors
+
+    def generate_check(self, key, builder):
+        """see GenericRestriction.generate_check docs"""
+        builder.line(f"value = get({builder.literal(self.parameter)}, None)")
+        builder.line("if value is None:")
+        with builder.indent():
+            if self.optional:
+                builder.line("pass")
+            else:
+                builder.error(key, self.required_error)
+
+        builder.line("else:")
+        with builder.indent():
+            # strings (i.e. form data) are parsed inline, anything else
+            # (i.e. typed json values) goes through to_number(...)
+            builder.line("if value.__class__ is str:")
+            with builder.indent():
+                builder.line("try:")
+                with builder.indent():
+                    builder.line(f"number = {builder.const(self.number_type)}(value)")
+                builder.line("except ValueError:")
+                with builder.indent():
+                    builder.line("number = None")
+            builder.line("else:")
+            with builder.indent():
+                builder.line(f"number = {builder.const(self.to_number)}(value)")
+
+            builder.line("if number is None:")
+            with builder.indent():
+                builder.error_expr(key, f"{builder.const(self.parse_error)}(value)")
+
+            conditions = []
+            if self.min != -float("inf"):
+                conditions.append(f"number >= {builder.literal(self.min)}")
+            if self.max != float("inf"):
+                conditions.append(f"number <= {builder.literal(self.max)}")
+            if not conditions and self.number_type is float:
+                # even without limits, "nan" is out of range
+                conditions.append("number == number")
+
+            if conditions:
+                builder.line(f"elif not ({' and '.join(conditions)}):")
+                with builder.indent():
+                    builder.error(key, self.range_error)
+
     def __repr__(self):
+        import colorama
+        from ..restrictions import get_restriction_classes
+
         Fore = colorama.Fore
         Back = colorama.Back
         Style = colorama.Style
@@ -3,23 +3,21 @@ from ._float import FloatRestriction
 
 class IntRestriction(FloatRestriction):
     type_keyword = "int"
+    number_type = int
+    __slots__ = ()
 
-    def check_for(self, checking_part):
-        """see GenericRestriction.check_for docs"""
-        value = checking_part.get(self.parameter, None)
+    def to_number(self, value):
+        """see FloatRestriction.to_number docs"""
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                return None
 
-        if value is None:
-            if self.optional:
-                return True, None
-            else:
-                return False, "value is required"
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
 
-        try:
-            value = int(value)
-        except ValueError:
-            return False, f"value {value} cannot be parsed into an int"
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
 
-        if not (value >= self.min and value <= self.max):
-            return False, f"value must be between {self.min} and {self.max}"
-
-        return True, None
+        return None
@@ -0,0 +1,205 @@
+from ..generic_restriction import GenericRestriction
+from ...errors import FieldError, field_error
+
+
+class ListRestriction(GenericRestriction):
+    """
+    a list of values, i.e. `tags : list of str/lenlim(1, 20)/count(0, 50)`,
+    repeated form fields or query parameters (`?tag=a&tag=b`), or a
+    json array
+
+    `optional` and `count` are the list's attributes, every other
+    attribute is the item type's, and is checked for every item
+
+    there is a subclass for every item type, see
+    restrictions.make_list_restriction_type, this class itself
+    isn't registered
+    """
+
+    # the restriction class of the items, set by subclasses
+    item_class = None
+    check_cost = 3
+    __slots__ = (
+        "item",
+        "optional",
+        "min_count",
+        "max_count",
+        "required_error",
+        "not_list_error",
+        "count_error",
+    )
+    attributes = {
+        "optional": {},
+        "count": {"parameters": [{"type": int}, {"type": int}]},
+    }
+
+    def __init_restriction__(self):
+        self.optional = False
+        self.min_count = 0
+        self.max_count = float("inf")
+
+    def __reduce__(self):
+        # the subclasses are made at runtime, so they are pickled
+        # as their item class, see GenericRestriction.__reduce__
+        from ..restrictions import make_shared_list_restriction
+
+        return (
+            make_shared_list_restriction,
+            (self.item_class, self.raw_line, self.parameter, self.raw_restrictions),
+        )
+
+    def compile(self, raw_restrictions: list):
+        """
+        compile the parsed attributes, the list's own attributes
+        here, and the rest into the item restriction
+        """
+        list_restrictions = []
+        item_restrictions = []
+        for name, vals in raw_restrictions:
+            if name in self.attributes:
+                list_restrictions.append((name, vals))
+            else:
+                item_restrictions.append((name, vals))
+
+        self.item = self.item_class(self.raw_line, self.parameter, item_restrictions)
+        super().compile(list_restrictions)
+
+    def compile_restriction(self, name: str, vals: list):
+        """see GenericRestriction.compile_restriction(...) docs"""
+        if name == "optional":
+            self.optional = True
+        elif name == "count":
+            self.min_count, self.max_count = vals
+
+    def __finish_restriction__(self):
+        """see GenericRestriction.__finish_restriction__ docs"""
+        self.required_error = field_error("VALUE_REQUIRED", "value is required")
+        self.not_list_error = field_error("NOT_A_LIST", "value must be a list")
+        self.count_error = field_error(
+            "COUNT_OUT_OF_RANGE",
+            f"the number of values must be between {self.min_count} "
+            + f"and {self.max_count}",
+            min=self.min_count,
+            max=self.max_count,
+        )
+
+    def item_error(self, index, message):
+        """
+        the error for an invalid item, it includes the index
+
+        Returns
+        -------
+        FieldError
+        """
+        return FieldError(
+            "INVALID_ITEM",
+            f"item {index}: {message}",
+            index=index,
+            item_code=getattr(message, "code", None),
+        )
+
+    def get_values(self, checking_part):
+        """
+        get the submitted values, every value of a multidict (i.e.
+        repeated query parameters), or the value in a dict (i.e. json)
+
+        Returns
+        -------
+        list, any other json value, or None
+            None if there are no values
+        """
+        getlist = getattr(checking_part, "getlist", None)
+        if getlist is not None:
+            return getlist(self.parameter) or None
+
+        return checking_part.get(self.parameter, None)
+
+    def check_for(self, checking_part):
+        """see GenericRestriction.check_for docs"""
+        values = self.get_values(checking_part)
+
+        if values is None:
+            if self.optional:
+                return True, None
+            else:
+                return False, self.required_error
+
+        if not isinstance(values, list):
+            return False, self.not_list_error
+
+        return self.check_values(values)
+
+    def check_values(self, values):
+        """
+        check a list of values, the count is checked first, so
+        lists longer than the maximum count are rejected without
+        looking at a single item, the items are then checked in
+        one pass, by the item restriction's `check_column(...)`
+
+        Returns
+        -------
+        is_valid, message
+            see `check_for(...)`, the message is about the first
+            invalid item
+        """
+        if not (len(values) >= self.min_count and len(values) <= self.max_count):
+            return False, self.count_error
+
+        item_errors = self.item.check_column(values)
+        if item_errors:
+            index, message = item_errors[0]
+            return False, self.item_error(index, message)
+
+        return True, None
+
+    def clean_for(self, checking_part):
+        """
+        see GenericRestriction.clean_for docs, the value is the list
+        of cleaned items, or an empty list if it's optional and missing
+        """
+        values = self.get_values(checking_part)
+
+        if values is None:
+            if self.optional:
+                return True, None, []
+            else:
+                return False, self.required_error, None
+
+        if not isinstance(values, list):
+            return False, self.not_list_error, None
+
+        if not (len(values) >= self.min_count and len(values) <= self.max_count):
+            return False, self.count_error, None
+
+        item = self.item
+        cleaned = []
+        for index, value in enumerate(values):
+            if value is None:
+                is_valid, message, value = item.clean_for({})
+            else:
+                is_valid, message, value = item.clean_value(value)
+
+            if not is_valid:
+                return False, self.item_error(index, message), None
+            cleaned.append(value)
+
+        return True, None, cleaned
+
+    def check_item(self, index, value):
+        """
+        check a single item, i.e. a repeated multipart field, as
+        soon as it has been read
+
+        Returns
+        -------
+        is_valid, message
+            see `check_for(...)`
+        """
+        if index >= self.max_count:
+            return False, self.count_error
+
+        item_errors = self.item.check_column((value,))
+        if item_errors:
+            return False, self.item_error(index, item_errors[0][1])
+
+        return True, None
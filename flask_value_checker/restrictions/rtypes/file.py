@@ -1,24 +1,294 @@
 from ..generic_restriction import GenericRestriction
+from ... import errors
+from ...errors import field_error
 from flask import request
+import textwrap
+
+# (((offset, magic number), ...), mimetype), a file is of the type if
+# every magic number is at its offset, see `sniff_mimetype`
+MAGIC_NUMBERS = [
+    (((0, b"\x89PNG\r\n\x1a\n"),), "image/png"),
+    (((0, b"\xff\xd8\xff"),), "image/jpeg"),
+    (((0, b"GIF87a"),), "image/gif"),
+    (((0, b"GIF89a"),), "image/gif"),
+    (((0, b"II*\x00"),), "image/tiff"),
+    (((0, b"MM\x00*"),), "image/tiff"),
+    (((0, b"RIFF"), (8, b"WEBP")), "image/webp"),
+    (((0, b"%PDF-"),), "application/pdf"),
+    (((0, b"PK\x03\x04"),), "application/zip"),
+    (((0, b"\x1f\x8b"),), "application/gzip"),
+    (((0, b"ID3"),), "audio/mpeg"),
+    (((0, b"OggS"),), "audio/ogg"),
+    (((0, b"fLaC"),), "audio/flac"),
+    (((0, b"RIFF"), (8, b"WAVE")), "audio/wav"),
+    (((4, b"ftyp"),), "video/mp4"),
+    (((0, b"\x1aE\xdf\xa3"),), "video/webm"),
+]
+# "BM", followed by the size of one of the known DIB headers at offset 14
+# (after the 14 byte file header), "BM" alone starts plenty of text files
+for dib_header_size in (12, 40, 52, 56, 64, 108, 124):
+    MAGIC_NUMBERS.append(
+        (((0, b"BM"), (14, dib_header_size.to_bytes(4, "little"))), "image/bmp")
+    )
+
+KNOWN_MIMETYPES = {mimetype for _, mimetype in MAGIC_NUMBERS}
+
+# the number of bytes at the start of a file needed to sniff its type
+SNIFF_SIZE = max(
+    offset + len(magic)
+    for signature, _ in MAGIC_NUMBERS
+    for offset, magic in signature
+)
+
+
+def sniff_mimetype(head: bytes):
+    """
+    get the mimetype of a file from its magic number
+
+    Parameters
+    ----------
+    head : bytes
+        the first (at least SNIFF_SIZE) bytes of the file
+
+    Returns
+    -------
+    str or None
+        the mimetype, None if unknown
+    """
+    for signature, mimetype in MAGIC_NUMBERS:
+        if all(head.startswith(magic, offset) for offset, magic in signature):
+            return mimetype
+    return None
+
+
+def get_files(checking_part):
+    """
+    get the uploaded files to check, `checking_part.files` if the
+    values come along with their files (i.e. in an async view,
+    see aio.ValuesWithFiles), `request.files` otherwise
+
+    Returns
+    -------
+    MultiDict
+    """
+    files = getattr(checking_part, "files", None)
+    if files is None:
+        return request.files
+    return files
+
+
+class FileStreamCheck:
+    """
+    checks a single file for a FileRestriction chunk by chunk,
+    while it is being uploaded (or read), with a byte counter and
+    by sniffing the magic number in the first chunk(s)
+    """
+
+    def __init__(self, restriction):
+        self.restriction = restriction
+        self.size = 0
+        self.head = b""
+        self.sniffed = restriction.types is None
+
+    def feed(self, data: bytes):
+        """
+        check the next chunk of the file
+
+        Returns
+        -------
+        str or None
+            the error message, if the file is invalid
+        """
+        restriction = self.restriction
+        self.size += len(data)
+
+        if restriction.maxsize is not None and self.size > restriction.maxsize:
+            return restriction.maxsize_error
+
+        if not self.sniffed:
+            self.head += data[: SNIFF_SIZE - len(self.head)]
+            if len(self.head) >= SNIFF_SIZE:
+                return self.sniff()
+
+        return None
+
+    def finish(self):
+        """
+        finish checking, once the whole file has been fed in
+
+        Returns
+        -------
+        str or None
+            the error message, if the file is invalid
+        """
+        if not self.sniffed:
+            return self.sniff()
+        return None
+
+    def sniff(self):
+        self.sniffed = True
+        if sniff_mimetype(self.head) not in self.restriction.types:
+            return self.restriction.types_error
+        return None
 
 
 class FileRestriction(GenericRestriction):
     type_keyword = "file"
+    check_cost = 3
+    __slots__ = (
+        "optional",
+        "number",
+        "maxsize",
+        "types",
+        "missing_error",
+        "number_error",
+        "maxsize_error",
+        "types_error",
+    )
     attributes = {
         "optional": {},
         "number": {"parameters": [{"type": int}]},
+        "maxsize": {"parameters": [{"type": int}]},
+        "types": {"parameters": [{"type": "list of strs"}]},
     }
 
     def __init_restriction__(self):
         self.optional = False
+        self.number = None
+        self.maxsize = None
+        self.types = None
 
     def compile_restriction(self, name: str, vals: list):
         if name == "optional":
             self.optional = True
 
-    def check_for(self, _):
-        if not self.optional:
-            if not self.parameter in request.files:
-                return False, f"file '{self.parameter}' is missing !"
+        elif name == "number":
+            self.number = vals[0]
+
+        elif name == "maxsize":
+            self.maxsize = vals[0]
+
+        elif name == "types":
+            unknown_types = [t for t in vals[0] if t not in KNOWN_MIMETYPES]
+            if unknown_types:
+                raise errors.FlaskValueCheckerValueError(
+                    textwrap.dedent(
+                        f"""\
+                unknown file type(s) {unknown_types},
+                please choose file types out of {sorted(KNOWN_MIMETYPES)}
+
+                error in line: {self.raw_line}
+                """
+                    )
+                )
+
+            self.types = vals[0]
+
+    def __finish_restriction__(self):
+        """see GenericRestriction.__finish_restriction__ docs"""
+        self.missing_error = field_error(
+            "FILE_MISSING", f"file '{self.parameter}' is missing !"
+        )
+        self.number_error = field_error(
+            "TOO_MANY_FILES",
+            f"at most {self.number} file(s) can be uploaded for '{self.parameter}'",
+            number=self.number,
+        )
+        self.maxsize_error = field_error(
+            "FILE_TOO_LARGE",
+            f"file '{self.parameter}' must be at most {self.maxsize} bytes",
+            maxsize=self.maxsize,
+        )
+        self.types_error = field_error(
+            "FILE_TYPE_NOT_ACCEPTED",
+            f"file '{self.parameter}' must be one of the types {self.types}",
+            types=self.types,
+        )
+
+    def start_stream(self):
+        """
+        start checking a file while it is being uploaded
+
+        Returns
+        -------
+        FileStreamCheck
+        """
+        return FileStreamCheck(self)
+
+    def is_present(self, checking_part):
+        """see GenericRestriction.is_present docs"""
+        return self.parameter in get_files(checking_part)
+
+    def check_for(self, checking_part):
+        """
+        see GenericRestriction.check_for docs, the files are
+        looked for in `checking_part.files` (see `get_files`)
+        """
+        files = get_files(checking_part).getlist(self.parameter)
+
+        if not files:
+            if self.optional:
+                return True, None
+            return False, self.missing_error
+
+        if self.number is not None and len(files) > self.number:
+            return False, self.number_error
+
+        if self.maxsize is not None or self.types is not None:
+            for file in files:
+                message = self.check_file(file)
+                if message is not None:
+                    return False, message
 
         return True, None
+
+    def clean_for(self, checking_part):
+        """
+        see GenericRestriction.clean_for docs, the value is the
+        (first) uploaded file, as `request.files.get(...)`
+        """
+        is_valid, message = self.check_for(checking_part)
+        if not is_valid:
+            return False, message, None
+
+        return True, None, get_files(checking_part).get(self.parameter)
+
+    def check_column(self, values):
+        """files are only ever in request.files, not in records"""
+        raise errors.FlaskValueCheckerValueError(
+            textwrap.dedent(
+                f"""\
+        file parameters can only be checked in a request,
+        not in a batch of records
+
+        error in line: {self.raw_line}
+        """
+            )
+        )
+
+    def check_file(self, file):
+        """
+        check an already uploaded file (a werkzeug FileStorage), only the
+        first few bytes are read, the size is found by seeking to the end
+
+        Returns
+        -------
+        str or None
+            the error message, if the file is invalid
+        """
+        stream = file.stream
+        start = stream.tell()
+
+        try:
+            if self.types is not None:
+                if sniff_mimetype(stream.read(SNIFF_SIZE)) not in self.types:
+                    return self.types_error
+
+            if self.maxsize is not None:
+                stream.seek(0, 2)
+                if stream.tell() - start > self.maxsize:
+                    return self.maxsize_error
+        finally:
+            stream.seek(start)
+
+        return None
@@ -1,12 +1,52 @@
 from ..generic_restriction import GenericRestriction
+from ... import errors
+from ...errors import field_error
+import textwrap
+
+# accept lists longer than this are cut short in error messages
+MAX_SHOWN_ACCEPT_VALUES = 20
+
+
+def format_accept_list(accept):
+    """
+    format an accept list for error messages, long
+    lists are cut short after MAX_SHOWN_ACCEPT_VALUES values
+    """
+    if len(accept) <= MAX_SHOWN_ACCEPT_VALUES:
+        return str(accept)
+
+    shown = str(accept[:MAX_SHOWN_ACCEPT_VALUES])[:-1]
+    return f"{shown}, ... ({len(accept) - MAX_SHOWN_ACCEPT_VALUES} more)]"
 
 
 class StringRestriction(GenericRestriction):
     type_keyword = "str"
+    check_cost = 1
+    __slots__ = (
+        "optional",
+        "minlength",
+        "maxlength",
+        "accept",
+        "accept_set",
+        "ignorecase",
+        "strip",
+        "default",
+        "required_error",
+        "not_string_error",
+        "length_error",
+        "missing_accept_error",
+        "invalid_accept_error",
+    )
+    # the file is read again by every schema using it
+    unshared_attributes = frozenset(["acceptfile"])
     attributes = {
         "optional": {},
         "lenlim": {"parameters": [{"type": int}, {"type": int}]},
         "accept": {"parameters": [{"type": "list of strs"}]},
+        "acceptfile": {"parameters": [{"type": "list of strs"}]},
+        "ignorecase": {},
+        "strip": {},
+        "default": {"parameters": [{"type": str}]},
     }
 
     def __init_restriction__(self):
@@ -14,6 +54,12 @@ class StringRestriction(GenericRestriction):
         self.minlength = 0
         self.maxlength = float("inf")
         self.accept = None
+        self.accept_set = None
+        self.ignorecase = False
+        self.strip = False
+        self.default = None
+        self.missing_accept_error = None
+        self.invalid_accept_error = None
 
     def compile_restriction(self, name: str, vals: list):
         """see GenericRestriction.compile_restriction(...) docs"""
@@ -25,62 +71,237 @@ class StringRestriction(GenericRestriction):
             self.maxlength = vals[1]
 
         elif name == "accept":
-            self.accept = vals[0]
+            self.accept = (self.accept or []) + vals[0]
+
+        elif name == "acceptfile":
+            self.accept = self.accept or []
+            for path in vals[0]:
+                self.accept += self.load_accept_file(path)
+
+        elif name == "ignorecase":
+            self.ignorecase = True
+
+        elif name == "strip":
+            self.strip = True
+
+        elif name == "default":
+            # a field with a default is optional
+            self.optional = True
+            self.default = vals[0]
+
+    def __finish_restriction__(self):
+        """see GenericRestriction.__finish_restriction__ docs"""
+        self.required_error = field_error("VALUE_REQUIRED", "value is required")
+        self.not_string_error = field_error("NOT_A_STRING", "value must be a string")
+        self.length_error = field_error(
+            "LENGTH_OUT_OF_RANGE",
+            f"string length must be between {self.minlength} and {self.maxlength}",
+            min=self.minlength,
+            max=self.maxlength,
+        )
+
+        if self.accept is None:
+            return
+
+        if self.ignorecase:
+            self.accept_set = frozenset(value.casefold() for value in self.accept)
+        else:
+            self.accept_set = frozenset(self.accept)
+
+        shown_accept = self.accept[:MAX_SHOWN_ACCEPT_VALUES]
+        if len(self.accept) == 1:
+            self.missing_accept_error = field_error(
+                "VALUE_NOT_ACCEPTED",
+                f"value should be '{self.accept[0]}'",
+                accepted=shown_accept,
+            )
+            if self.optional:
+                self.invalid_accept_error = field_error(
+                    "VALUE_NOT_ACCEPTED",
+                    f"value should be '{self.accept[0]}', "
+                    + "or the field should not be submitted",
+                    accepted=shown_accept,
+                )
+            else:
+                self.invalid_accept_error = self.missing_accept_error
+        else:
+            self.missing_accept_error = field_error(
+                "VALUE_NOT_ACCEPTED",
+                f"value must be one from the list {format_accept_list(self.accept)}",
+                accepted=shown_accept,
+            )
+            self.invalid_accept_error = self.missing_accept_error
+
+    def load_accept_file(self, path):
+        """
+        load accepted values from a file, one value per line,
+        blank lines and lines starting with a "#" are skipped
+
+        Returns
+        -------
+        list of strs
+        """
+        try:
+            with open(path, encoding="utf-8") as accept_file:
+                lines = [line.strip() for line in accept_file]
+        except OSError as e:
+            raise errors.FlaskValueCheckerValueError(
+                textwrap.dedent(
+                    f"""\
+            could not read the accept file "{path}", ({e})
+
+            error in line: {self.raw_line}
+            """
+                )
+            )
+
+        return [line for line in lines if line and not line.startswith("#")]
 
     def check_for(self, checking_part):
         """see GenericRestriction.check_for docs"""
         value = checking_part.get(self.parameter, None)
 
-        if self.accept is not None:
-            if value is None:
-                if self.optional:
-                    return True, None
-                elif len(self.accept) == 1:
-                    return (
-                        False,
-                        f"value should be '{self.accept[0]}'",
-                    )
-                else:
-                    return (False, f"value must be one from the list {self.accept}")
-
-            if not (len(value) >= self.minlength and len(value) <= self.maxlength):
-                return (
-                    False,
-                    f"string length must be between {self.minlength} and {self.maxlength}",
-                )
-
-            if value in self.accept:
+        if value is None:
+            if self.optional:
                 return True, None
+            elif self.accept is not None:
+                return False, self.missing_accept_error
             else:
-                if len(self.accept) == 1:
-                    if self.optional:
-                        return (
-                            False,
-                            f"value should be '{self.accept[0]}', or the field should not be submitted",
-                        )
-                    else:
-                        return (
-                            False,
-                            f"value should be '{self.accept[0]}'",
-                        )
-                else:
-                    return (False, f"value must be one from the list {self.accept}")
+                return False, self.required_error
+
+        if not isinstance(value, str):
+            return False, self.not_string_error
+
+        if self.strip:
+            value = value.strip()
+
+        if not (len(value) >= self.minlength and len(value) <= self.maxlength):
+            return False, self.length_error
+
+        if self.accept_set is not None:
+            if self.ignorecase:
+                value = value.casefold()
+
+            if value not in self.accept_set:
+                return False, self.invalid_accept_error
+
+        return True, None
+
+    def clean_for(self, checking_part):
+        """see GenericRestriction.clean_for docs"""
+        value = checking_part.get(self.parameter, None)
+
+        if value is None:
+            if self.optional:
+                return True, None, self.default
+            elif self.accept is not None:
+                return False, self.missing_accept_error, None
+            else:
+                return False, self.required_error, None
+
+        return self.clean_value(value)
+
+    def clean_value(self, value):
+        """see GenericRestriction.clean_value docs"""
+        if not isinstance(value, str):
+            return False, self.not_string_error, None
+
+        if self.strip:
+            value = value.strip()
+
+        if not (len(value) >= self.minlength and len(value) <= self.maxlength):
+            return False, self.length_error, None
+
+        if self.accept_set is not None:
+            accept_value = value.casefold() if self.ignorecase else value
+            if accept_value not in self.accept_set:
+                return False, self.invalid_accept_error, None
+
+        return True, None, value
+
+    def check_column(self, values):
+        """see GenericRestriction.check_column docs"""
+        optional = self.optional
+        minlength = self.minlength
+        maxlength = self.maxlength
+        accept_set = self.accept_set
+        ignorecase = self.ignorecase
+        strip = self.strip
+        not_string_error = self.not_string_error
+        length_error = self.length_error
+        invalid_accept_error = self.invalid_accept_error
+        if self.accept is None:
+            missing_error = self.required_error
         else:
+            missing_error = self.missing_accept_error
+        errors = []
+
+        for i, value in enumerate(values):
             if value is None:
-                if self.optional:
-                    return True, None
+                if not optional:
+                    errors.append((i, missing_error))
+                continue
 
-                return False, "value is required"
+            if not isinstance(value, str):
+                errors.append((i, not_string_error))
+                continue
 
-            if not (len(value) >= self.minlength and len(value) <= self.maxlength):
-                return (
-                    False,
-                    f"string length must be between {self.minlength} and {self.maxlength}",
-                )
+            if strip:
+                value = value.strip()
 
-        return True, None
+            if not (len(value) >= minlength and len(value) <= maxlength):
+                errors.append((i, length_error))
+            elif accept_set is not None:
+                if ignorecase:
+                    value = value.casefold()
+                if value not in accept_set:
+                    errors.append((i, invalid_accept_error))
+
+        return errors
+
+    def generate_check(self, key, builder):
+        """see GenericRestriction.generate_check docs"""
+        if self.strip:
+            # stripping doesn't fit in the branches below
+            return super().generate_check(key, builder)
+
+        builder.line(f"value = get({builder.literal(self.parameter)}, None)")
+        builder.line("if value is None:")
+        with builder.indent():
+            if self.optional:
+                builder.line("pass")
+            elif self.accept is None:
+                builder.error(key, self.required_error)
+            else:
+                builder.error(key, self.missing_accept_error)
+
+        # typed (json) values
+        builder.line("elif not isinstance(value, str):")
+        with builder.indent():
+            builder.error(key, self.not_string_error)
+
+        conditions = []
+        if self.minlength > 0:
+            conditions.append(f"len(value) >= {builder.literal(self.minlength)}")
+        if self.maxlength != float("inf"):
+            conditions.append(f"len(value) <= {builder.literal(self.maxlength)}")
+
+        if conditions:
+            builder.line(f"elif not ({' and '.join(conditions)}):")
+            with builder.indent():
+                builder.error(key, self.length_error)
+
+        if self.accept_set is not None:
+            value_source = "value.casefold()" if self.ignorecase else "value"
+            accept_set = builder.const(self.accept_set)
+            builder.line(f"elif {value_source} not in {accept_set}:")
+            with builder.indent():
+                builder.error(key, self.invalid_accept_error)
 
     def __repr__(self):
+        import colorama
+        from ..restrictions import get_restriction_classes
+
         Fore = colorama.Fore
         Back = colorama.Back
         Style = colorama.Style
@@ -102,7 +323,7 @@ class StringRestriction(GenericRestriction):
                 Fore.RED
                 + "accepts("
                 + Fore.GREEN
-                + f"{self.accept}"
+                + format_accept_list(self.accept)
                 + f"{Fore.RED}){Style.RESET_ALL}"
             )
             return (
@@ -0,0 +1,213 @@
+"""
+process wide cache of compiled checker text
+
+compiling checker text (i.e. running it through
+restrictions.make_restrictions) is fairly slow, and the same
+text tends to be used again and again (multiple routes sharing
+a schema, apps being created repeatedly in tests, etc.),
+so the compiled restrictions are interned here
+
+with a directory (see `SchemaCache.set_directory(...)`), the parsed
+text is also kept on disk, for the next process, see disk_cache.py
+"""
+from collections import OrderedDict
+from types import MappingProxyType
+import threading
+
+from . import fragments
+
+DEFAULT_MAXSIZE = 512
+
+
+def normalize_text(text: str):
+    """
+    normalize checker text, so that texts which only differ in
+    indentation, blank lines or full line comments share a cache entry
+
+    Parameters
+    ----------
+    text : str
+        checker text, in the format accepted by `ValueChecker`
+
+    Returns
+    -------
+    str
+        the normalized text
+    """
+    lines = []
+    for line in text.split("\n"):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            lines.append(line)
+
+    return "\n".join(lines)
+
+
+class SchemaCache:
+    """
+    a size bound, least recently used cache of compiled checkers
+
+    the compiled checkers are read only mappings of
+    `field name -> restriction`, and are shared between
+    every `ValueChecker` created with the same (normalized) text
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, directory=None):
+        """
+        Parameters
+        ----------
+        maxsize : int or None
+            the maximum number of compiled checkers to keep,
+            None means the cache is unbounded
+
+        directory : str, os.PathLike or None
+            keep the parsed checker text in this directory too,
+            see `set_directory(...)`
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+        self.disk_cache = None
+        self.set_directory(directory)
+
+    def set_directory(self, directory):
+        """
+        keep the parsed checker text on disk, in a directory shared
+        by every process (i.e. every worker of a server), so only
+        the first process to see some checker text parses it,
+        call this before creating any `ValueChecker`
+
+        Parameters
+        ----------
+        directory : str, os.PathLike or None
+            None to stop using the disk
+
+        Examples
+        --------
+        >>> from flask_value_checker import schema_cache
+        >>> schema_cache.set_directory("/tmp/flask_value_checker")
+        """
+        if directory is None:
+            self.disk_cache = None
+        else:
+            from .disk_cache import DiskCache
+
+            self.disk_cache = DiskCache(directory)
+
+    def get(self, text: str):
+        """
+        get the compiled checkers for some checker text,
+        compiling (and caching) them if required
+
+        Parameters
+        ----------
+        text : str
+            checker text, in the format accepted by `ValueChecker`
+
+        Returns
+        -------
+        MappingProxyType
+            field name -> restriction
+        """
+        key = normalize_text(text)
+        # the compiled text includes the fragments it uses
+        entry_key = key + fragments.text_versions_key(key)
+
+        with self._lock:
+            checkers = self._entries.get(entry_key)
+            if checkers is not None:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return checkers
+
+        # imported here, so importing the cache doesn't import flask
+        from . import restrictions
+
+        # compile outside the lock, compiling the same text twice
+        # in a race is harmless, blocking every other route isn't
+        disk_cache = self.disk_cache
+        parsed = None if disk_cache is None else disk_cache.load(key)
+        from_disk = parsed is not None
+
+        checkers = None
+        if from_disk:
+            try:
+                checkers = restrictions.build_restrictions(parsed)
+            except Exception:
+                # a damaged cache file, parsed again and overwritten
+                from_disk = False
+
+        if checkers is None:
+            parsed = restrictions.parse_restrictions(key)
+            checkers = restrictions.build_restrictions(parsed)
+
+        checkers = MappingProxyType(checkers)
+
+        # only saved once it compiles, so invalid text is never cached
+        if disk_cache is not None and not from_disk:
+            disk_cache.save(key, parsed)
+
+        with self._lock:
+            self.misses += 1
+            self.disk_hits += from_disk
+            self._entries[entry_key] = checkers
+            self._entries.move_to_end(entry_key)
+
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return checkers
+
+    def clear(self):
+        """
+        remove all the cached checkers, and reset the counters,
+        the files on disk are kept, see `disk_cache.clear()`
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.disk_hits = 0
+
+    def stats(self):
+        """
+        get the cache counters
+
+        Returns
+        -------
+        dict
+            with the keys "hits", "misses", "evictions", "disk_hits"
+            (misses loaded from the disk), "size" and "maxsize"
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        stats = self.stats()
+        return (
+            f"<{self.__class__.__name__} hits={stats['hits']} "
+            + f"misses={stats['misses']} evictions={stats['evictions']} "
+            + f"size={stats['size']}/{stats['maxsize']}>"
+        )
+
+
+schema_cache = SchemaCache()
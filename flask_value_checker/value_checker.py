@@ -1,15 +1,167 @@
 from . import restrictions
+from .schema_cache import schema_cache
+from .codegen import generate_check_for
+from .multipart import MultipartStreamValidator
+from . import batch, aio, paths
 from flask import request
+from time import perf_counter
+from types import MappingProxyType
 import textwrap
-import colorama
+import threading
+
+
+SOURCES = ("form", "args", "json", "multipart")
+
+
+def get_json_body():
+    """
+    get the json body of the current request
+
+    flask caches the parsed body, so `request.get_json()`
+    in the view does not parse it again
+
+    Returns
+    -------
+    dict
+        the body, or an empty dict if the body is missing, isn't
+        json, or isn't a json object
+    """
+    body = request.get_json(silent=True)
+    if isinstance(body, dict):
+        return body
+    return {}
+
+
+def get_source(source):
+    """
+    get where the values of the current request are, see
+    `ValueChecker.check`, None is "form" for POST and PUT
+    requests, "args" otherwise
+
+    Returns
+    -------
+    str
+    """
+    if source is None:
+        if request.method in ["POST", "PUT"]:
+            return "form"
+        return "args"
+
+    return source
+
+
+def get_values(source):
+    """
+    get the values of the current request, for a
+    (non "multipart") source, see `ValueChecker.check`
+
+    Returns
+    -------
+    MultiDict or dict
+    """
+    if source == "form":
+        return request.form
+    elif source == "args":
+        return request.args
+    elif source == "json":
+        return get_json_body()
+    else:
+        raise ValueError(f"unknown source {source!r}, should be one of {SOURCES}")
 
 
 class ValueChecker:
-    def __init__(self, text: str):
+    def __init__(
+        self,
+        text: str,
+        use_cache: bool = True,
+        codegen: bool = False,
+        fail_fast: bool = False,
+        multipart: dict = None,
+    ):
         """
         create value checkers from text
+
+        Parameters
+        ----------
+        text : str
+            check strings, must be in the format mentioned
+
+        use_cache : bool
+            share the compiled checkers with every other `ValueChecker`
+            created from the same text, via `schema_cache`, and the
+            restrictions with the same fields in other texts
+
+        codegen : bool
+            compile the checkers into a single generated python function
+            (see codegen.generate_check_for), instead of calling each
+            restriction's `check_for(...)`, set this to False to debug
+            the restrictions themselves
+
+        fail_fast : bool
+            stop checking at the first error, and only return that
+            error, see `check_for_fail_fast(...)`
+
+        multipart : dict or None
+            options of the "multipart" source, passed on to
+            `multipart.MultipartStreamValidator(...)`, "max_field_size",
+            "max_parts", "allow_undeclared" and "chunk_size"
         """
-        self.checkers = restrictions.make_restrictions(text)
+        self.multipart = dict(multipart or {})
+        self.text = text
+        self.use_cache = use_cache
+
+        if use_cache:
+            checkers = schema_cache.get(text)
+        else:
+            checkers = MappingProxyType(
+                restrictions.make_restrictions(text, share=False)
+            )
+
+        self.set_checkers(checkers, codegen, fail_fast)
+
+    def set_checkers(self, checkers, codegen, fail_fast):
+        """
+        set the compiled checkers, and everything checking uses,
+        see `__init__(...)` for `codegen` and `fail_fast`
+
+        Parameters
+        ----------
+        checkers : MappingProxyType
+            {field name: restriction}
+        """
+        self.checkers = checkers
+
+        # what check_for(...) runs through, a flat tuple of
+        # (field name, restriction), see `Invigilator.freeze()`
+        self.checker_items = tuple(self.checkers.items())
+        # dotted field names (paths into nested json), see paths.py
+        self.path_tree = paths.make_path_tree(self.checkers)
+
+        self.has_files = any(
+            isinstance(checker, restrictions.FileRestriction)
+            for checker in self.checkers.values()
+        )
+
+        self.fail_fast = fail_fast
+        if fail_fast:
+            # cheapest restrictions first, sorted(...) keeps the
+            # original order between restrictions of the same cost
+            ordered = sorted(self.checker_items, key=lambda item: item[1].check_cost)
+            self.ordered_checkers = dict(ordered)
+            self.ordered_items = tuple(ordered)
+            self.required_checkers = tuple(
+                (key, checker)
+                for key, checker in ordered
+                if not getattr(checker, "optional", False)
+            )
+
+        if codegen:
+            self.generated_check_for = generate_check_for(
+                self.ordered_checkers if fail_fast else self.checkers,
+                fail_fast=fail_fast,
+            )
+        else:
+            self.generated_check_for = None
 
     def check_for(self, multidict):
         """
@@ -20,10 +172,19 @@ class ValueChecker:
         dict or None
             dict or None : dict if there are errors, None if there are no errors
         """
+        if self.fail_fast:
+            return self.check_for_fail_fast(multidict)
+
+        if self.path_tree is not None:
+            multidict = self.resolve_paths(multidict)
+
+        if self.generated_check_for is not None:
+            return self.generated_check_for(multidict)
+
         err_fields = {}
         has_errors = False
 
-        for key, checker in self.checkers.items():
+        for key, checker in self.checker_items:
             is_valid, message = checker.check_for(multidict)
 
             if not is_valid:
@@ -35,14 +196,273 @@ class ValueChecker:
         else:
             return None
 
-    def check(self):
+    def check_for_fail_fast(self, multidict):
+        """
+        like `check_for(...)`, but stops at the first error found,
+
+        every required field is checked for presence first, then
+        the restrictions are run, cheapest first (strings, then
+        numbers, then files)
+
+        Returns
+        -------
+        dict or None
+            dict with only the first error found, None if there are no errors
+        """
+        if self.path_tree is not None:
+            multidict = self.resolve_paths(multidict)
+
+        for key, checker in self.required_checkers:
+            if not checker.is_present(multidict):
+                is_valid, message = checker.check_for(multidict)
+                if not is_valid:
+                    return {key: message}
+
+        if self.generated_check_for is not None:
+            return self.generated_check_for(multidict)
+
+        for key, checker in self.ordered_items:
+            is_valid, message = checker.check_for(multidict)
+            if not is_valid:
+                return {key: message}
+
+        return None
+
+    def clean_for(self, multidict):
+        """
+        check the values, like `check_for(...)`, and get them cleaned
+        for the view, numbers parsed into ints and floats, strings
+        stripped (with `strip`), and missing optional fields set
+        to their `default(...)` (or None), so views don't parse the
+        values again
+
+        Returns
+        -------
+        (dict or None, dict or None)
+            the errors, None if there are no errors, and the cleaned
+            values, {field name: value}, None if there are errors
+        """
+        if self.path_tree is not None:
+            multidict = self.resolve_paths(multidict)
+
+        err_fields = {}
+        cleaned = {}
+
+        if self.fail_fast:
+            for key, checker in self.ordered_items:
+                is_valid, message, value = checker.clean_for(multidict)
+                if not is_valid:
+                    return {key: message}, None
+                cleaned[key] = value
+
+            # in the order of the checker text
+            return None, {key: cleaned[key] for key in self.checkers}
+
+        for key, checker in self.checker_items:
+            is_valid, message, value = checker.clean_for(multidict)
+            if is_valid:
+                cleaned[key] = value
+            else:
+                err_fields[key] = message
+
+        if err_fields:
+            return err_fields, None
+
+        return None, cleaned
+
+    def resolve_paths(self, values):
+        """
+        add the values of the dotted field names to (json) dicts,
+        in multidicts (form data, query parameters), dotted names
+        are plain names, see paths.py
+
+        Returns
+        -------
+        MultiDict or dict
+        """
+        if self.path_tree is None or hasattr(values, "getlist"):
+            return values
+
+        return paths.resolve_paths(values, self.path_tree)
+
+    def check_many(self, records, processes=None, chunk_size=None):
+        """
+        check a batch of records at once, i.e. rows of a bulk import,
+        column by column, see batch.check_many
+
+        every error of every record is returned, even if the checker
+        is `fail_fast`
+
+        Parameters
+        ----------
+        records : list of dicts, or dict of lists
+            the records, i.e. [{"age": "5"}, {"age": "6"}], or the
+            records as columns, i.e. {"age": ["5", "6"]}, columns can
+            be numpy arrays
+
+        processes : int or None
+            check the records in this many worker processes, in
+            chunks of `chunk_size` records, see parallel.check_many
+
+        chunk_size : int or None
+            the number of records sent to a worker at once,
+            only used with `processes`
+
+        Returns
+        -------
+        list of (dict or None)
+            one item per record, dict if there are errors,
+            None if there are no errors
+        """
+        if processes is not None:
+            from . import parallel
+
+            return parallel.check_many(self, records, processes, chunk_size)
+
+        return batch.check_many(self, records)
+
+    def check(self, source=None):
         """
         check if it the parameter has been written correctly or not
+
+        Parameters
+        ----------
+        source : str or None
+            where the values are checked in,
+
+            "form"
+                request.form
+            "args"
+                request.args (the query parameters)
+            "json"
+                the json body of the request, json values keep their
+                types, i.e. numbers do not go through `str`
+            "multipart"
+                a multipart/form-data body, checked while it's being
+                read, the request is rejected at the first invalid,
+                too large or undeclared part, without reading (and
+                spooling to disk) the rest of the body, requests of
+                more than `request.max_form_parts` parts raise a
+                RequestEntityTooLarge (413), request.form and
+                request.files work as usual afterwards, see the
+                `multipart` options and multipart.MultipartStreamValidator
+            None
+                "form" for POST and PUT requests, "args" otherwise
+
+        Returns
+        -------
+        dict or None
+            dict or None : dict if there are errors, None if there are no errors
         """
-        if request.method in ["POST", "PUT"]:
-            return self.check_for(request.form)
-        else:
-            return self.check_for(request.args)
+        source = get_source(source)
+
+        if source == "multipart":
+            return MultipartStreamValidator(self, **self.multipart).validate()
+
+        return self.check_for(get_values(source))
+
+    def check_cleaned(self, source=None):
+        """
+        `check(...)`, also getting the cleaned values, see `clean_for(...)`
+
+        Parameters
+        ----------
+        source : str or None
+            see `check(...)`
+
+        Returns
+        -------
+        (dict or None, dict or None)
+            the errors, and the cleaned values, see `clean_for(...)`
+        """
+        source = get_source(source)
+
+        if source == "multipart":
+            errors = MultipartStreamValidator(self, **self.multipart).validate()
+            if errors:
+                return errors, None
+            # the validator has filled in request.form and request.files
+            return self.clean_for(request.form)
+
+        return self.clean_for(get_values(source))
+
+    def check_timed(self, source, field_durations):
+        """
+        `check(...)`, timing the restriction of every field, for metrics,
+        fields are only timed for the "form", "args" and "json" sources,
+        without `fail_fast`, otherwise this is just `check(...)`
+
+        Parameters
+        ----------
+        source : str or None
+            see `check(...)`
+
+        field_durations : dict
+            filled in with {field name: seconds taken}
+
+        Returns
+        -------
+        dict or None
+            dict or None : dict if there are errors, None if there are no errors
+        """
+        source = get_source(source)
+
+        if source == "multipart" or self.fail_fast:
+            return self.check(source)
+
+        values = self.resolve_paths(get_values(source))
+        err_fields = {}
+
+        for key, checker in self.checker_items:
+            start = perf_counter()
+            is_valid, message = checker.check_for(values)
+            field_durations[key] = perf_counter() - start
+
+            if not is_valid:
+                err_fields[key] = message
+
+        return err_fields or None
+
+    async def check_async(self, source=None):
+        """
+        `check(...)` for async views, in quart, the body is
+        awaited, see aio.check
+
+        Returns
+        -------
+        dict or None
+            dict or None : dict if there are errors, None if there are no errors
+        """
+        return await aio.check(self, source)
+
+    async def check_cleaned_async(self, source=None):
+        """
+        `check_cleaned(...)` for async views, see aio.check_cleaned
+
+        Returns
+        -------
+        (dict or None, dict or None)
+            the errors, and the cleaned values, see `clean_for(...)`
+        """
+        return await aio.check_cleaned(self, source)
+
+    def __reduce__(self):
+        # pickled as the flattened checkers (i.e. fragments included),
+        # not the text, the workers may not have the fragments or
+        # restriction types (i.e. started with "spawn"), the
+        # restrictions are compiled again when unpickled
+        codegen = self.generated_check_for is not None
+        return (
+            unpickle_value_checker,
+            (
+                self.text,
+                dict(self.checkers),
+                self.use_cache,
+                codegen,
+                self.fail_fast,
+                self.multipart,
+            ),
+        )
 
     def __repr__(self):
         checkers_text = ""
@@ -52,6 +472,8 @@ class ValueChecker:
                 checkers_text += "            "
             checkers_text += repr(checker)
 
+        import colorama
+
         Fore = colorama.Fore
         Back = colorama.Back
         Style = colorama.Style
@@ -65,3 +487,64 @@ class ValueChecker:
         {Fore.GREEN}>{Style.RESET_ALL}
         """
         )
+
+
+class LazyValueChecker:
+    """
+    a ValueChecker which is only compiled when it is first used,
+    once, even if it is first used by many threads at the same time
+    """
+
+    def __init__(self, text: str, **options):
+        """
+        Parameters
+        ----------
+        text : str
+            check strings, must be in the format mentioned
+
+        options
+            passed on to `ValueChecker(...)`
+        """
+        self.text = text
+        self.options = options
+        self.checker = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        """
+        get the ValueChecker, compiling it if it hasn't been yet
+
+        Returns
+        -------
+        ValueChecker
+        """
+        checker = self.checker
+        if checker is None:
+            with self.lock:
+                if self.checker is None:
+                    self.checker = ValueChecker(self.text, **self.options)
+                checker = self.checker
+
+        return checker
+
+    @property
+    def compiled(self):
+        """has the ValueChecker been compiled yet ?"""
+        return self.checker is not None
+
+
+def unpickle_value_checker(text, checkers, use_cache, codegen, fail_fast, multipart):
+    """
+    make a ValueChecker from its compiled checkers, see
+    `ValueChecker.__reduce__`
+
+    Returns
+    -------
+    ValueChecker
+    """
+    checker = ValueChecker.__new__(ValueChecker)
+    checker.multipart = multipart
+    checker.text = text
+    checker.use_cache = use_cache
+    checker.set_checkers(MappingProxyType(checkers), codegen, fail_fast)
+    return checker
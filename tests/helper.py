@@ -10,4 +10,8 @@ from flask_value_checker import (
     FlaskValueCheckerSyntaxError,
     FlaskValueCheckerValueError,
     Invigilator,
+    SchemaCache,
+    schema_cache,
+    validate_csv,
+    validate_ndjson,
 )
@@ -8,7 +8,10 @@ from helper import (
     FlaskValueCheckerSyntaxError,
     FlaskValueCheckerValueError,
 )
+from flask_value_checker import errors
+from flask_value_checker.errors import field_error
 
+import gc
 import random
 import string
 import pytest
@@ -377,3 +380,120 @@ def test_bad_syntax():
     """
     with pytest.raises(FlaskValueCheckerValueError):
         checker = ValueChecker(bad_syntax_8)
+
+
+def test_fail_fast():
+    for codegen in [False, True]:
+        fail_fast_checker = ValueChecker(
+            test_restriction_code, codegen=codegen, fail_fast=True
+        )
+        assert fail_fast_checker.check_for(sample_test_dict) is None
+
+        # missing fields are found before any other error
+        test_dict = create_sample_dict(
+            {"firstName": "Gary", "age": "7", "email": None, "team": None}
+        )
+        errs = fail_fast_checker.check_for(test_dict)
+        assert errs == {"email": "value is required"}
+
+        # then the cheaper string restrictions, then the numbers
+        test_dict = create_sample_dict({"age": "7", "firstName": "Gary"})
+        errs = fail_fast_checker.check_for(test_dict)
+        assert errs == {"firstName": "string length must be between 5 and 15"}
+
+        test_dict = create_sample_dict({"age": "7"})
+        errs = fail_fast_checker.check_for(test_dict)
+        assert errs == {"age": "value must be between 18.0 and 99.0"}
+
+
+def test_accept_ignorecase():
+    for codegen in [False, True]:
+        ignorecase_checker = ValueChecker(
+            "team : str/accept(['Red', 'blue'])/ignorecase", codegen=codegen
+        )
+        assert ignorecase_checker.check_for({"team": "RED"}) is None
+        assert ignorecase_checker.check_for({"team": "Blue"}) is None
+        assert ignorecase_checker.check_for({"team": "green"}) == {
+            "team": "value must be one from the list ['Red', 'blue']"
+        }
+
+
+def test_accept_file(tmp_path):
+    accept_path = tmp_path / "countries.txt"
+    accept_path.write_text("# country codes\nIN\n\nUS\nDE\n")
+
+    file_checker = ValueChecker(
+        f"country : str/accept(['FR'])/acceptfile(['{accept_path}'])"
+    )
+    assert file_checker.check_for({"country": "IN"}) is None
+    assert file_checker.check_for({"country": "FR"}) is None
+    assert file_checker.check_for({"country": "UK"}) == {
+        "country": "value must be one from the list ['FR', 'IN', 'US', 'DE']"
+    }
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker(f"country : str/acceptfile(['{tmp_path / 'missing.txt'}'])")
+
+
+def test_long_accept_list_message():
+    accept = [f"value_{i}" for i in range(1000)]
+    long_checker = ValueChecker(f"choice : str/accept({accept})")
+
+    errs = long_checker.check_for({"choice": "nope"})
+    shown = str(accept[:20])[:-1]
+    assert errs == {
+        "choice": f"value must be one from the list {shown}, ... (980 more)]"
+    }
+
+
+def test_structured_errors():
+    test_dict = create_sample_dict(
+        {"age": "7", "email": None, "firstName": "Gary", "team": "purple"}
+    )
+    errs = checker.check_for(test_dict)
+
+    assert errs["age"].code == "OUT_OF_RANGE"
+    assert errs["age"].params == {"min": 18, "max": 99}
+    assert errs["email"].as_dict() == {
+        "code": "VALUE_REQUIRED",
+        "message": "value is required",
+        "params": {},
+    }
+    assert errs["firstName"].code == "LENGTH_OUT_OF_RANGE"
+    assert errs["team"].code == "VALUE_NOT_ACCEPTED"
+
+    errs = checker.check_for(create_sample_dict({"age": "old"}))
+    assert errs["age"].code == "NOT_A_NUMBER"
+    assert errs["age"].params == {"value": "old", "type": "int"}
+
+
+def test_errors_are_shared():
+    other_checker = ValueChecker(
+        """
+        someOtherField : str
+        age : int/lim(18, 99)
+        """,
+        use_cache=False,
+    )
+    test_dict = create_sample_dict({"age": "7", "email": None})
+
+    errs = checker.check_for(test_dict)
+    other_errs = other_checker.check_for(test_dict)
+    assert errs["age"] is other_errs["age"]
+    assert errs["email"] is other_errs["someOtherField"]
+
+
+def test_interned_errors():
+    first = field_error("OUT_OF_RANGE", "value is out of range", min=1, max=5)
+    same = field_error("OUT_OF_RANGE", "value is out of range", max=5, min=1)
+    other = field_error("OUT_OF_RANGE", "value is out of range", min=1, max=6)
+    assert first is same
+    assert other is not first
+    assert other.params == {"min": 1, "max": 6}
+
+    # errors no restriction uses are freed
+    key = ("OUT_OF_RANGE", "value is out of range", repr([("max", 5), ("min", 1)]))
+    assert errors._interned_field_errors[key] is first
+    del first, same
+    gc.collect()
+    assert key not in errors._interned_field_errors
@@ -0,0 +1,102 @@
+from flask import Flask, g
+from helper import Invigilator, ValueChecker
+
+import asyncio
+import io
+import inspect
+import pytest
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator()
+
+checker_text = """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)/optional
+"""
+
+
+@invigilator.check("POST", checker_text)
+async def async_view():
+    await asyncio.sleep(0)
+    return f"hi {g.value_checker.checkers['name'].parameter}"
+
+
+async def async_err_handler(errors):
+    await asyncio.sleep(0)
+    return sorted(errors)
+
+
+@Invigilator(err_handler=async_err_handler).check("POST", checker_text)
+async def async_err_handler_view():
+    return "valid"
+
+
+def test_async_wrapper():
+    assert inspect.iscoroutinefunction(async_view)
+    assert async_view.__name__ == "async_view"
+
+
+def test_async_view():
+    with app.test_request_context("/", method="POST", data={"name": "popo"}):
+        assert asyncio.run(async_view()) == "hi name"
+
+    with app.test_request_context("/", method="POST", data={"name": "popopo"}):
+        rv = asyncio.run(async_view())
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {
+            "name": "string length must be between 1 and 5"
+        }
+
+    # other methods aren't checked
+    with app.test_request_context("/", method="GET"):
+        assert asyncio.run(async_view()) == "hi name"
+
+
+def test_async_err_handler():
+    with app.test_request_context("/", method="POST", data={"age": "5"}):
+        assert asyncio.run(async_err_handler_view()) == ["age", "name"]
+
+    with app.test_request_context("/", method="POST", data={"name": "popo"}):
+        assert asyncio.run(async_err_handler_view()) == "valid"
+
+
+@Invigilator(clean=True).check("POST", checker_text)
+async def async_clean_view():
+    return g.cleaned_values
+
+
+def test_async_clean():
+    data = {"name": "popo", "age": "20"}
+    with app.test_request_context("/", method="POST", data=data):
+        assert asyncio.run(async_clean_view()) == {"name": "popo", "age": 20}
+
+
+def test_check_async():
+    checker = ValueChecker(checker_text)
+    with app.test_request_context("/?name=popopo", method="GET"):
+        assert asyncio.run(checker.check_async()) == checker.check()
+
+
+def test_quart():
+    quart = pytest.importorskip("quart")
+
+    quart_app = quart.Quart(__name__)
+
+    @quart_app.route("/upload", methods=["POST"])
+    @invigilator.check("POST", checker_text + "avatar : file")
+    async def upload():
+        form = await quart.request.form
+        return f"hi {form['name']}"
+
+    async def post(data):
+        client = quart_app.test_client()
+        avatar = quart.datastructures.FileStorage(io.BytesIO(b"a"), "a.txt")
+        return await client.post("/upload", form=data, files={"avatar": avatar})
+
+    rv = asyncio.run(post({"name": "popo"}))
+    assert rv.status_code == 200
+
+    rv = asyncio.run(post({"name": "popopo"}))
+    assert rv.status_code == 400
@@ -0,0 +1,86 @@
+from helper import ValueChecker, FlaskValueCheckerValueError
+
+import random
+import pytest
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    lastName : str/optional
+    age : int/lim(18, 99)
+    height : float/lim(1, inf)/optional
+    team : str/accept(["red", "blue", "yellow"])/ignorecase
+"""
+
+checker = ValueChecker(test_restriction_code)
+
+records = [
+    {"firstName": "Garyashver", "age": "76", "team": "Red"},
+    {"firstName": "Gary", "age": "76", "team": "red"},
+    {"firstName": "Garyashver", "age": "7.5", "height": "0.5"},
+    {},
+    {"firstName": "Garyashver", "age": 30, "team": "blue", "height": 1.5},
+    {"firstName": 5, "age": True, "team": "green", "height": "nan"},
+]
+
+
+def test_records():
+    assert checker.check_many(records) == [checker.check_for(r) for r in records]
+    assert checker.check_many(records)[0] is None
+
+
+def test_columns():
+    columns = {
+        key: [record.get(key) for record in records]
+        for key in ["firstName", "age", "team", "height"]
+    }
+    assert checker.check_many(columns) == [checker.check_for(r) for r in records]
+
+
+def test_column_lengths():
+    with pytest.raises(ValueError):
+        checker.check_many({"firstName": ["Garyashver"], "age": []})
+
+    assert checker.check_many({}) == []
+    assert checker.check_many([]) == []
+
+
+def test_random_records():
+    values = [None, "", "a", "Garyashver", "RED", "5", "18", "99", "100", "-1.5"]
+    values += ["inf", "nan", "x", 18, 18.0, 18.5, 1e300, False, ["red"]]
+    keys = ["firstName", "lastName", "age", "height", "team"]
+
+    rng = random.Random(0)
+    batch = [
+        {key: rng.choice(values) for key in keys if rng.random() < 0.8}
+        for _ in range(500)
+    ]
+    assert checker.check_many(batch) == [checker.check_for(r) for r in batch]
+
+
+def test_file_fields():
+    file_checker = ValueChecker("avatar : file/optional")
+    with pytest.raises(FlaskValueCheckerValueError):
+        file_checker.check_many([{}])
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+
+    columns = {
+        "firstName": numpy.array(["Garyashver", "Gary", "Garyashver"]),
+        "age": numpy.array([76.0, 17.0, 20.5]),
+        "height": numpy.array([1.5, float("nan"), 0.5]),
+        "team": numpy.array(["red", "RED", "green"]),
+    }
+    as_records = [
+        {key: column[i].item() for key, column in columns.items()} for i in range(3)
+    ]
+    assert checker.check_many(columns) == [checker.check_for(r) for r in as_records]
+
+    int_columns = {"firstName": ["Garyashver"] * 3, "team": ["red"] * 3}
+    int_columns["age"] = numpy.array([18, 100, 50], dtype=numpy.int64)
+    assert checker.check_many(int_columns) == [
+        None,
+        {"age": "value must be between 18.0 and 99.0"},
+        None,
+    ]
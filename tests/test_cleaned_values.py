@@ -0,0 +1,141 @@
+from flask import Flask, g
+from helper import Invigilator, ValueChecker, FlaskValueCheckerValueError
+from werkzeug.datastructures import MultiDict
+
+import io
+import pytest
+
+checker_text = """
+    name : str/lenlim(1, 5)/strip
+    age : int/lim(18, 99)
+    height : float/lim(0, 3)/optional
+    team : str/accept(['red', 'blue'])/default('red')
+    page : int/lim(1, inf)/default(1)
+    tags : list of int/lim(0, 9)/optional
+"""
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator(clean=True)
+
+
+@app.route("/form", methods=["POST"])
+@invigilator.check("POST", checker_text)
+def form_view():
+    return repr(sorted(g.cleaned_values.items()))
+
+
+@app.route("/json", methods=["POST"])
+@invigilator.check("POST", checker_text, source="json")
+def json_view():
+    return repr(sorted(g.cleaned_values.items()))
+
+
+@app.route("/upload", methods=["POST"])
+@invigilator.check("POST", "name : str/strip\nupload : file", source="multipart")
+def upload_view():
+    cleaned = g.cleaned_values
+    return f"{cleaned['name']} {cleaned['upload'].read().decode()}"
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_clean_for(fail_fast):
+    checker = ValueChecker(checker_text, fail_fast=fail_fast)
+
+    errors, cleaned = checker.clean_for(
+        MultiDict([("name", "  bob "), ("age", "20"), ("tags", "1"), ("tags", "2")])
+    )
+    assert errors is None
+    assert cleaned == {
+        "name": "bob",
+        "age": 20,
+        "height": None,
+        "team": "red",
+        "page": 1,
+        "tags": [1, 2],
+    }
+    assert type(cleaned["age"]) is int
+    assert list(cleaned) == ["name", "age", "height", "team", "page", "tags"]
+
+    errors, cleaned = checker.clean_for({"name": "bob", "age": 20.0, "height": 2})
+    assert errors is None
+    assert type(cleaned["age"]) is int
+    assert type(cleaned["height"]) is float
+    assert cleaned["tags"] == []
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_clean_for_errors(fail_fast):
+    checker = ValueChecker(checker_text, fail_fast=fail_fast)
+    values = MultiDict({"name": "bob", "age": "12"})
+
+    errors, cleaned = checker.clean_for(values)
+    assert cleaned is None
+    assert errors == checker.check_for(values)
+
+
+def test_strip():
+    for codegen in [False, True]:
+        checker = ValueChecker("name : str/lenlim(1, 3)/strip", codegen=codegen)
+        assert checker.check_for({"name": "  bob  "}) is None
+        assert checker.check_for({"name": "   "}) == {
+            "name": "string length must be between 1 and 3"
+        }
+
+    results = checker.check_many([{"name": " bob "}, {"name": "  "}])
+    assert results[0] is None
+    assert results[1] is not None
+
+
+def test_invalid_defaults():
+    for text in [
+        "page : int/lim(1, 10)/default(11)",
+        "page : int/default(inf)",
+        "page : int/default(1.5)",
+        "team : str/accept(['red'])/default('blue')",
+        "team : str/default(1)",
+    ]:
+        with pytest.raises(FlaskValueCheckerValueError):
+            ValueChecker(text, use_cache=False)
+
+
+def test_form():
+    with app.test_client() as client:
+        rv = client.post("/form", data={"name": " bob ", "age": "20", "height": "1.5"})
+        assert rv.status_code == 200, rv.data
+        assert rv.data.decode() == repr(
+            [
+                ("age", 20),
+                ("height", 1.5),
+                ("name", "bob"),
+                ("page", 1),
+                ("tags", []),
+                ("team", "red"),
+            ]
+        )
+
+        rv = client.post("/form", data={"name": "bob", "age": "old"})
+        assert rv.status_code == 400
+
+
+def test_json():
+    with app.test_client() as client:
+        rv = client.post("/json", json={"name": "bob", "age": 20, "tags": [1, 2]})
+        assert rv.status_code == 200, rv.data
+        assert "('tags', [1, 2])" in rv.data.decode()
+
+
+def test_multipart():
+    with app.test_client() as client:
+        rv = client.post(
+            "/upload",
+            data={"name": " bob ", "upload": (io.BytesIO(b"hi"), "hi.txt")},
+        )
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"bob hi"
+
+
+def test_decimal_defaults():
+    checker = ValueChecker("ratio : float/lim(0, 1)/default(0.25)", use_cache=False)
+    assert checker.clean_for({}) == (None, {"ratio": 0.25})
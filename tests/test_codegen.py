@@ -0,0 +1,71 @@
+from helper import ValueChecker
+
+import random
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    middleName : str/lenlim(5, inf)/optional
+    lastName : str/optional
+    nickName : str/lenlim(-inf, 3)
+    age : int/lim(18, 99)
+    height : float/lim(1, inf)/optional
+    someNegativeFloat : float/optional/lim(-inf, 0)
+    anyNumber : float
+    team : str/accept(["red", "blue", "yellow", "green", "orange"])
+    teamColor : str/lenlim(3, 4)/accept(["red", "blue", "yellow"])/optional
+    acceptTermsAndConditions : str/accept(['on'])/optional
+    someEdgeCase : str/accept(['on'])
+    anyCaseTeam : str/accept(["Red", "blue"])/ignorecase/optional
+"""
+
+interpreted_checker = ValueChecker(test_restriction_code)
+generated_checker = ValueChecker(test_restriction_code, codegen=True)
+
+test_values = [
+    None,
+    "",
+    "on",
+    "red",
+    "blue",
+    "yellow",
+    "Green",
+    "RED",
+    "abc",
+    "abcdefgh",
+    "abcdefghijklmnopqrstuvwxyz",
+    "0",
+    "17",
+    "18",
+    "99",
+    "100",
+    "-1",
+    "-0.5",
+    "1.5",
+    "inf",
+    "nan",
+    "1e3",
+    " 42 ",
+]
+
+
+def test_generated_source():
+    source = generated_checker.generated_check_for.__source__
+    # branches that can never be taken aren't generated
+    assert "len(value) >= 0" not in source
+    assert "value >= -inf" not in source
+    assert "value <= inf" not in source
+
+
+def test_same_as_interpreted():
+    rand = random.Random(0)
+    fields = list(interpreted_checker.checkers)
+
+    for _ in range(2000):
+        test_dict = {}
+        for field in fields:
+            value = rand.choice(test_values)
+            if value is not None:
+                test_dict[field] = value
+
+        expected = interpreted_checker.check_for(test_dict)
+        assert generated_checker.check_for(test_dict) == expected, test_dict
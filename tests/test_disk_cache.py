@@ -0,0 +1,120 @@
+from helper import ValueChecker, SchemaCache, FlaskValueCheckerValueError
+from flask_value_checker import disk_cache as disk_cache_module, value_checker
+from flask_value_checker.disk_cache import DiskCache
+from werkzeug.datastructures import MultiDict
+
+import marshal
+import pytest
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    age : int/lim(18, 99)/optional
+    team : str/accept(["red", "blue"])
+"""
+
+
+def test_second_process_loads_from_disk(tmp_path):
+    # a new SchemaCache is what a new worker process starts with
+    first = SchemaCache(directory=tmp_path)
+    first_checkers = first.get(test_restriction_code)
+    assert first.stats()["disk_hits"] == 0
+    assert len(first.disk_cache) == 1
+
+    second = SchemaCache(directory=tmp_path)
+    second_checkers = second.get(test_restriction_code)
+    assert second.stats()["disk_hits"] == 1
+    assert list(second_checkers) == list(first_checkers)
+
+    for key, checker in second_checkers.items():
+        assert type(checker) is type(first_checkers[key])
+        assert checker.raw_line == first_checkers[key].raw_line
+
+
+def test_loaded_checkers_check_the_same(tmp_path, monkeypatch):
+    SchemaCache(directory=tmp_path).get(test_restriction_code)
+    cache = SchemaCache(directory=tmp_path)
+    monkeypatch.setattr(value_checker, "schema_cache", cache)
+    checker = ValueChecker(test_restriction_code)
+    assert cache.stats()["disk_hits"] == 1
+
+    valid = MultiDict({"firstName": "Garyashver", "team": "red"})
+    assert checker.check_for(valid) is None
+    errors = checker.check_for(MultiDict({"firstName": "Gary", "team": "green"}))
+    assert errors == {
+        "firstName": "string length must be between 5 and 15",
+        "team": "value must be one from the list ['red', 'blue']",
+    }
+
+
+def test_version_change_invalidates(tmp_path, monkeypatch):
+    SchemaCache(directory=tmp_path).get(test_restriction_code)
+
+    monkeypatch.setattr(disk_cache_module, "__version__", "0.0.0")
+    cache = SchemaCache(directory=tmp_path)
+    cache.get(test_restriction_code)
+    assert cache.stats()["disk_hits"] == 0
+    assert len(cache.disk_cache) == 2
+
+
+def test_corrupt_file_is_parsed_again(tmp_path):
+    disk_cache = DiskCache(tmp_path)
+    with open(disk_cache.path("firstName : str"), "wb") as cache_file:
+        cache_file.write(b"not marshal data")
+
+    cache = SchemaCache(directory=tmp_path)
+    assert list(cache.get("firstName : str")) == ["firstName"]
+    assert cache.stats()["disk_hits"] == 0
+
+    # and the file is fixed
+    assert SchemaCache(directory=tmp_path).get("firstName : str")
+    assert disk_cache.load("firstName : str") is not None
+
+
+@pytest.mark.parametrize(
+    "parsed",
+    [
+        [1],
+        [("a : int", "a")],
+        [("a : str", "a", [("str", [])])],
+        [("a : int", "b", [("int", [])])],
+        [("a : int", "a", [("str", []), ("optional", [])])],
+        [("a : int", "a", [("int", [])]), ("b : int", "b", [("int", [])])],
+        [("a : int", "a", [("int", 5)])],
+        [("a : int", None, ("include", "a"))],
+    ],
+)
+def test_mismatched_file_is_parsed_again(tmp_path, parsed):
+    disk_cache = DiskCache(tmp_path)
+    with open(disk_cache.path("a : int"), "wb") as cache_file:
+        cache_file.write(marshal.dumps(parsed))
+
+    cache = SchemaCache(directory=tmp_path)
+    checkers = cache.get("a : int")
+    assert cache.stats()["disk_hits"] == 0
+    assert checkers["a"].check_for({}) == (False, "value is required")
+
+    # and the file is overwritten
+    assert disk_cache.load("a : int") == [("a : int", "a", [("int", [])])]
+
+
+def test_invalid_text_is_not_saved(tmp_path):
+    cache = SchemaCache(directory=tmp_path)
+    with pytest.raises(FlaskValueCheckerValueError):
+        cache.get("firstName : unknowntype")
+
+    assert len(cache.disk_cache) == 0
+
+
+def test_set_directory(tmp_path):
+    cache = SchemaCache()
+    assert cache.disk_cache is None
+
+    cache.set_directory(tmp_path / "nested")
+    cache.get(test_restriction_code)
+    assert len(cache.disk_cache) == 1
+
+    cache.disk_cache.clear()
+    assert len(cache.disk_cache) == 0
+
+    cache.set_directory(None)
+    assert cache.disk_cache is None
@@ -0,0 +1,61 @@
+from helper import ValueChecker
+from flask_value_checker.error_handler import DefaultErrorHandler
+from flask import Flask
+
+import json
+
+app = Flask(__name__)
+
+checker = ValueChecker(
+    """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)
+    """
+)
+
+
+def test_same_body_as_json_dumps():
+    handler = DefaultErrorHandler()
+    errs = checker.check_for({"name": "a name too long", "age": "old ☃"})
+
+    expected = json.dumps(
+        {
+            "error": {
+                "code": "MALFORMED_OR_MISSING_PARAMETERS",
+                "message": "one or more fields we're either missing or malformed",
+                "fields": errs,
+            }
+        }
+    )
+
+    with app.app_context():
+        rv = handler(errs)
+    assert rv.status_code == 400
+    assert rv.mimetype == "application/json"
+    assert rv.get_data() == expected.encode()
+
+
+def test_repeated_errors_are_cached():
+    handler = DefaultErrorHandler()
+    errs = checker.check_for({})
+
+    with app.app_context():
+        for _ in range(3):
+            handler(errs)
+
+    cache_info = handler.get_body.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+
+
+def test_custom_json_encoder():
+    handler = DefaultErrorHandler(
+        json_encoder=lambda fields: json.dumps(fields, separators=(",", ":")).encode(),
+        cache_size=0,
+    )
+    errs = checker.check_for({"age": "20"})
+
+    with app.app_context():
+        rv = handler(errs)
+    assert rv.get_data().endswith(b'"fields": {"name":"value is required"}}}')
+    assert rv.json["error"]["fields"] == {"name": "value is required"}
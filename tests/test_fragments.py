@@ -0,0 +1,144 @@
+from helper import (
+    ValueChecker,
+    FlaskValueCheckerSyntaxError,
+    FlaskValueCheckerValueError,
+    SchemaCache,
+    restrictions,
+)
+from flask_value_checker import register_fragment, fragments
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def registered():
+    register_fragment(
+        "pagination",
+        """
+        page : int/lim(1, inf)/default(1)
+        per_page : int/lim(1, 100)/default(20)
+        """,
+    )
+    register_fragment(
+        "listing",
+        """
+        include pagination  # a comment
+        sort : str/accept(['asc', 'desc'])/optional
+        """,
+    )
+    yield
+    fragments.registered_fragments.clear()
+
+
+def test_include():
+    checker = ValueChecker(
+        """
+        query : str/lenlim(1, 10)
+        include listing
+        deleted : str/accept(['yes', 'no'])/optional
+        """
+    )
+    assert list(checker.checkers) == ["query", "page", "per_page", "sort", "deleted"]
+    assert checker.check_for({"query": "a"}) is None
+    assert checker.check_for({"query": "a", "per_page": "101"}) == {
+        "per_page": "value must be between 1.0 and 100.0"
+    }
+    assert checker.clean_for({"query": "a"}) == (
+        None,
+        {"query": "a", "page": 1, "per_page": 20, "sort": None, "deleted": None},
+    )
+
+
+def test_shared_restrictions():
+    compiled = fragments.get_fragment("pagination").get_checkers()
+    first = ValueChecker("include listing\nquery : str")
+    second = ValueChecker("include pagination", use_cache=False)
+    third = ValueChecker("include pagination", codegen=True, fail_fast=True)
+
+    assert first.checkers["page"] is compiled["page"]
+    assert third.checkers["per_page"] is compiled["per_page"]
+    assert second.checkers["page"] is not compiled["page"]
+    assert third.check_for({"page": "0"}) == {
+        "page": "value must be between 1.0 and inf"
+    }
+
+
+def test_include_redefined():
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("include pagination\npage : int", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("page : int\ninclude pagination", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("include listing\ninclude pagination", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("extend listing\nextend pagination", use_cache=False)
+
+
+def test_extend():
+    checker = ValueChecker(
+        """
+        per_page : int/lim(1, 10)
+        extend listing
+        sort : str/accept(['asc'])
+        """
+    )
+    assert list(checker.checkers) == ["per_page", "page", "sort"]
+    assert checker.check_for({"per_page": "11", "sort": "desc"}) == {
+        "per_page": "value must be between 1.0 and 10.0",
+        "sort": "value should be 'asc'",
+    }
+    assert checker.check_for({"sort": "asc"}) == {"per_page": "value is required"}
+
+
+def test_errors():
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("include nope", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        register_fragment("pagination", "page : int")
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        register_fragment("not a name", "page : int")
+
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        register_fragment("broken", "page : int/lim(1")
+
+    # "include" is still a valid field name
+    assert list(ValueChecker("include : str", use_cache=False).checkers) == [
+        "include"
+    ]
+
+
+def test_cycles():
+    register_fragment("a", "a : str\ninclude b")
+    register_fragment("b", "b : str\ninclude c")
+    register_fragment("c", "include a")
+
+    with pytest.raises(FlaskValueCheckerValueError, match="a -> b -> c -> a"):
+        ValueChecker("include a", use_cache=False)
+
+
+def test_replace():
+    cache = SchemaCache()
+    text = "include listing"
+
+    first = cache.get(text)
+    assert cache.get(text) is first
+    assert fragments.text_versions_key("page : int") == ""
+
+    # a fragment used by a fragment
+    register_fragment("pagination", "page : int/lim(1, 10)", replace=True)
+    second = cache.get(text)
+    assert second is not first
+    assert list(second) == ["page", "sort"]
+    assert cache.get(text) is second
+    assert cache.stats()["misses"] == 2
+
+
+def test_parsed():
+    parsed = restrictions.parse_restrictions("  extend listing # hi\nname : str")
+    assert parsed[0] == ("  extend listing # hi", None, ("extend", "listing"))
+    assert parsed[1][1] == "name"
@@ -0,0 +1,70 @@
+from flask import Flask
+from helper import Invigilator, ValueChecker
+
+import gc
+import pytest
+
+checker_text = """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)/optional
+"""
+
+
+def make_app(invigilator):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+
+    @app.route("/hi", methods=["POST"])
+    @invigilator.check("POST", checker_text)
+    def hi():
+        return "hi"
+
+    @app.route("/bye", methods=["POST"])
+    @invigilator.check("POST", checker_text, fail_fast=True)
+    def bye():
+        return "bye"
+
+    return app
+
+
+def test_freeze_compiles_lazy_checkers():
+    invigilator = Invigilator(lazy=True)
+    app = make_app(invigilator)
+    assert not any(checker.compiled for checker in invigilator.checkers)
+
+    assert invigilator.freeze() == 2
+    assert all(checker.compiled for checker in invigilator.checkers)
+    assert invigilator.freeze() == 0
+
+    with app.test_client() as client:
+        assert client.post("/hi", data={"name": "popo"}).status_code == 200
+        assert client.post("/bye", data={"name": "popopo"}).status_code == 400
+
+
+def test_freeze_eager():
+    invigilator = Invigilator()
+    make_app(invigilator)
+    assert invigilator.freeze() == 0
+
+
+def test_gc_freeze():
+    invigilator = Invigilator(lazy=True)
+    make_app(invigilator)
+    try:
+        invigilator.freeze(gc_freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_flat_layout():
+    checker = ValueChecker(checker_text, fail_fast=True)
+    assert isinstance(checker.checker_items, tuple)
+    assert checker.checker_items == tuple(checker.checkers.items())
+    assert isinstance(checker.ordered_items, tuple)
+    assert isinstance(checker.required_checkers, tuple)
+    assert [key for key, _ in checker.required_checkers] == ["name"]
+
+    uncached = ValueChecker(checker_text, use_cache=False)
+    with pytest.raises(TypeError):
+        uncached.checkers["name"] = None
@@ -0,0 +1,72 @@
+"""
+guards against import time regressions, `import flask_value_checker`
+should only import the package itself (and the standard library)
+"""
+from helper import main_dir
+
+import subprocess
+import sys
+
+
+def get_imported_modules(code):
+    """
+    run code in a new interpreter, with `-X importtime`
+
+    Returns
+    -------
+    dict
+        {module name: cumulative import time (in us)}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=main_dir,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+def test_import_is_light():
+    modules = get_imported_modules("import flask_value_checker")
+
+    assert "flask_value_checker" in modules
+    for heavy_module in ["flask", "werkzeug", "colorama", "jinja2"]:
+        assert heavy_module not in modules
+
+
+def test_lazy_attributes():
+    code = (
+        "import sys, flask_value_checker as fvc; fvc.ValueChecker;"
+        "print(' '.join(sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=main_dir,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    modules = result.stdout.split()
+
+    assert "flask_value_checker.value_checker" in modules
+    assert "colorama" not in modules
+
+
+def test_star_import_and_submodules():
+    code = (
+        "from flask_value_checker import *; ValueChecker; Invigilator;"
+        "FlaskValueCheckerValueError; register_fragment;"
+        "import flask_value_checker as fvc; fvc.restrictions.make_restrictions;"
+        "assert not hasattr(fvc, 'not_a_module')"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=main_dir, check=True)
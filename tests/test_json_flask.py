@@ -0,0 +1,83 @@
+from flask import Flask, request
+from helper import Invigilator
+
+import pytest
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator()
+codegen_invigilator = Invigilator(codegen=True)
+
+checker_text = """
+    name : str/lenlim(1, 10)
+    age : int/lim(18, 99)
+    height : float/lim(0, 3)/optional
+    team : str/accept(['red', 'blue'])/optional
+"""
+
+
+@app.route("/json", methods=["POST"])
+@invigilator.check("POST", checker_text, source="json")
+def json_view():
+    body = request.get_json()
+    return f"{body['name']} is {body['age']}"
+
+
+@app.route("/json_codegen", methods=["POST"])
+@codegen_invigilator.check("POST", checker_text, source="json")
+def json_codegen_view():
+    body = request.get_json()
+    return f"{body['name']} is {body['age']}"
+
+
+def test_json():
+    for url in ["/json", "/json_codegen"]:
+        with app.test_client() as client:
+            rv = client.post(url, json={"name": "bob", "age": 20, "height": 1.5})
+            assert rv.status_code == 200, rv.data
+            assert rv.data == b"bob is 20"
+
+
+def test_json_typed_values():
+    tests = [
+        ({"age": 20}, None),
+        ({"age": "20"}, None),
+        ({"age": 20.0}, None),
+        ({"age": 20.5}, "value 20.5 cannot be parsed into an int"),
+        ({"age": True}, "value True cannot be parsed into an int"),
+        ({"age": [20]}, "value [20] cannot be parsed into an int"),
+        ({"age": 17}, "value must be between 18.0 and 99.0"),
+        ({"height": 2}, None),
+        ({"height": 3.5}, "value must be between 0.0 and 3.0"),
+        ({"height": "tall"}, "value tall cannot be parsed into an float"),
+        ({"name": 12}, "value must be a string"),
+        ({"team": ["red"]}, "value must be a string"),
+    ]
+
+    for modification, exp_output in tests:
+        body = {"name": "bob", "age": 20}
+        body.update(modification)
+        field = list(modification)[0]
+
+        for url in ["/json", "/json_codegen"]:
+            with app.test_client() as client:
+                rv = client.post(url, json=body)
+                if exp_output is None:
+                    assert rv.status_code == 200, (rv.data, body)
+                else:
+                    assert rv.status_code == 400, (rv.data, body)
+                    assert rv.json["error"]["fields"] == {field: exp_output}
+
+
+def test_not_a_json_object():
+    for data in [b"[1, 2]", b"not json", b""]:
+        with app.test_client() as client:
+            rv = client.post("/json", data=data, content_type="application/json")
+            assert rv.status_code == 400
+            assert set(rv.json["error"]["fields"]) == {"name", "age"}
+
+
+def test_unknown_source():
+    with pytest.raises(ValueError):
+        invigilator.check("POST", checker_text, source="xml")
@@ -0,0 +1,88 @@
+from flask import Flask
+from helper import Invigilator, ValueChecker, FlaskValueCheckerSyntaxError
+
+import threading
+import pytest
+
+checker_text = """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)/optional
+"""
+
+
+def make_app(invigilator, text=checker_text):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+
+    @app.route("/hi", methods=["POST"])
+    @invigilator.check("POST", text)
+    def hi():
+        return "hi"
+
+    return app
+
+
+def test_lazy():
+    invigilator = Invigilator(lazy=True)
+    app = make_app(invigilator)
+
+    (lazy_checker,) = invigilator.checkers
+    assert not lazy_checker.compiled
+
+    with app.test_client() as client:
+        rv = client.post("/hi", data={"name": "popopo"})
+        assert rv.status_code == 400
+        assert lazy_checker.compiled
+
+        checker = lazy_checker.get()
+        assert isinstance(checker, ValueChecker)
+
+        rv = client.post("/hi", data={"name": "popo"})
+        assert rv.status_code == 200
+        assert lazy_checker.get() is checker
+
+
+def test_lazy_syntax_errors():
+    invigilator = Invigilator(lazy=True)
+    # not compiled yet, so no error
+    make_app(invigilator, "name : str/lenlim(")
+
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        invigilator.warmup()
+
+
+def test_warmup():
+    invigilator = Invigilator(lazy=True)
+    make_app(invigilator)
+    make_app(invigilator, "other : str")
+
+    assert invigilator.warmup() == 2
+    assert all(checker.compiled for checker in invigilator.checkers)
+    assert invigilator.warmup() == 0
+
+    eager = Invigilator()
+    make_app(eager)
+    assert isinstance(eager.checkers[0], ValueChecker)
+    assert eager.warmup() == 0
+
+
+def test_compiled_once():
+    invigilator = Invigilator(lazy=True)
+    make_app(invigilator, checker_text + "unique : str/optional")
+    (lazy_checker,) = invigilator.checkers
+
+    results = []
+    barrier = threading.Barrier(8)
+
+    def get():
+        barrier.wait()
+        results.append(lazy_checker.get())
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,201 @@
+from flask import Flask, request
+from helper import (
+    Invigilator,
+    ValueChecker,
+    FlaskValueCheckerSyntaxError,
+    FlaskValueCheckerValueError,
+)
+from flask_value_checker.multipart import MultipartStreamValidator
+from werkzeug.datastructures import MultiDict
+
+import io
+import pickle
+import pytest
+
+checker_text = """
+    tags : list of str/lenlim(1, 5)/count(1, 3)
+    scores : list of int/lim(0, 10)/optional
+"""
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator()
+
+
+@app.route("/search")
+@invigilator.check("GET", checker_text)
+def search():
+    return ",".join(request.args.getlist("tags"))
+
+
+@app.route("/json", methods=["POST"])
+@invigilator.check("POST", checker_text, source="json")
+def json_view():
+    return ",".join(request.get_json()["tags"])
+
+
+@app.route("/upload", methods=["POST"])
+@invigilator.check("POST", checker_text, source="multipart")
+def upload():
+    return ",".join(request.form.getlist("tags"))
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_repeated_parameters(codegen):
+    checker = ValueChecker(checker_text, codegen=codegen)
+    tests = [
+        (MultiDict([("tags", "a"), ("tags", "bb")]), None),
+        (MultiDict([("tags", "a"), ("scores", "1"), ("scores", "10")]), None),
+        (MultiDict(), {"tags": "value is required"}),
+        (
+            MultiDict([("tags", "a"), ("tags", "toolong")]),
+            {"tags": "item 1: string length must be between 1 and 5"},
+        ),
+        (
+            MultiDict([("tags", "a")] * 4),
+            {"tags": "the number of values must be between 1 and 3"},
+        ),
+        (
+            MultiDict([("tags", "a"), ("scores", "5"), ("scores", "x")]),
+            {"scores": "item 1: value x cannot be parsed into an int"},
+        ),
+    ]
+
+    for values, exp_output in tests:
+        assert checker.check_for(values) == exp_output, values
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_json_lists(codegen):
+    checker = ValueChecker(checker_text, codegen=codegen)
+    tests = [
+        ({"tags": ["a", "bb"], "scores": [1, 10]}, None),
+        ({"tags": ["a"], "scores": []}, None),
+        ({"tags": "a"}, {"tags": "value must be a list"}),
+        ({"tags": []}, {"tags": "the number of values must be between 1 and 3"}),
+        ({"tags": ["a", None]}, {"tags": "item 1: value is required"}),
+        ({"tags": ["a", 5]}, {"tags": "item 1: value must be a string"}),
+        (
+            {"tags": ["a"], "scores": [1, 11]},
+            {"scores": "item 1: value must be between 0.0 and 10.0"},
+        ),
+    ]
+
+    for values, exp_output in tests:
+        assert checker.check_for(values) == exp_output, values
+
+
+def test_item_error_details():
+    checker = ValueChecker(checker_text)
+    message = checker.check_for({"tags": ["a", "toolong"]})["tags"]
+    assert message.code == "INVALID_ITEM"
+    assert message.params == {"index": 1, "item_code": "LENGTH_OUT_OF_RANGE"}
+
+
+def test_count_is_checked_before_items():
+    checked = []
+    checker = ValueChecker("tags : list of str/count(0, 3)", use_cache=False)
+
+    class Spy(list):
+        def __iter__(self):
+            checked.append(True)
+            return super().__iter__()
+
+    errors = checker.check_for({"tags": Spy(["a"] * 1000)})
+    assert errors == {"tags": "the number of values must be between 0 and 3"}
+    assert not checked
+
+
+def test_syntax():
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        ValueChecker("tags : list", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        ValueChecker("tags : list str", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("tags : list of blob", use_cache=False)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("tags : list of file", use_cache=False)
+
+    # an attribute of neither the list nor the items
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("tags : list of int/lenlim(1, 2)", use_cache=False)
+
+
+def test_pickle():
+    restriction = ValueChecker(checker_text, use_cache=False).checkers["scores"]
+    unpickled = pickle.loads(pickle.dumps(restriction))
+    assert type(unpickled) is type(restriction)
+    assert unpickled.optional
+    assert unpickled.check_for({"scores": [1, 11]})[0] is False
+
+
+def test_check_many_multidicts():
+    checker = ValueChecker(checker_text)
+    records = [
+        MultiDict([("tags", "a"), ("tags", "bb"), ("scores", "3")]),
+        MultiDict([("tags", "a"), ("tags", "toolong")]),
+        MultiDict([("scores", "1")]),
+        {"tags": ["a"], "scores": [1, 11]},
+    ]
+    expected = [checker.check_for(record) for record in records]
+
+    assert expected[0] is None
+    assert checker.check_many(records) == expected
+
+
+def test_flask():
+    with app.test_client() as client:
+        rv = client.get("/search?tags=a&tags=bb")
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"a,bb"
+
+        rv = client.get("/search?tags=a&tags=b&tags=c&tags=d")
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {
+            "tags": "the number of values must be between 1 and 3"
+        }
+
+        rv = client.post("/json", json={"tags": ["a", "bb"]})
+        assert rv.status_code == 200, rv.data
+
+        rv = client.post("/json", json={"tags": "a"})
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {"tags": "value must be a list"}
+
+
+def test_multipart():
+    with app.test_client() as client:
+        rv = client.post("/upload", data={"tags": ["a", "bb"], "scores": "3"})
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"a,bb"
+
+        rv = client.post("/upload", data={"tags": ["a", "b", "c", "d"]})
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {
+            "tags": "the number of values must be between 1 and 3"
+        }
+
+        rv = client.post("/upload", data={"tags": ["a", "toolong"]})
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {
+            "tags": "item 1: string length must be between 1 and 5"
+        }
+
+
+def test_multipart_rejects_items_while_reading():
+    checker = ValueChecker(checker_text)
+    with app.test_request_context(
+        "/upload",
+        method="POST",
+        data={
+            "tags": ["a", "b", "c", "d"],
+            "big": (io.BytesIO(b"x" * 1024 * 1024), "big.txt"),
+        },
+    ):
+        errors = MultipartStreamValidator(checker, allow_undeclared=True).validate()
+        assert errors == {"tags": "the number of values must be between 1 and 3"}
+        assert request.environ["wsgi.input"].tell() < 1024 * 1024
@@ -0,0 +1,151 @@
+from flask import Flask
+from helper import Invigilator
+from flask_value_checker import InMemoryMetrics, MetricsSink
+
+import pytest
+
+checker_text = """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)/optional
+"""
+
+
+def make_app(metrics):
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    invigilator = Invigilator(metrics=metrics)
+
+    @app.route("/hi", methods=["GET", "POST"])
+    @invigilator.check("POST", checker_text)
+    def hi():
+        return "hi"
+
+    @app.route("/json", methods=["POST"])
+    @invigilator.check("POST", checker_text, fail_fast=True, source="json")
+    def json_view():
+        return "hi"
+
+    return app
+
+
+def test_metrics():
+    metrics = InMemoryMetrics()
+    app = make_app(metrics)
+
+    with app.test_client() as client:
+        assert client.post("/hi", data={"name": "popo"}).status_code == 200
+        assert client.post("/hi", data={"name": "popopo", "age": "x"}).status_code == 400
+        assert client.post("/hi", data={"age": "5"}).status_code == 400
+        # not checked, not recorded
+        assert client.get("/hi").status_code == 200
+
+    assert metrics.route_results == {("hi", "passed"): 1, ("hi", "failed"): 2}
+    assert metrics.route_durations["hi"].count == 3
+    assert metrics.field_errors == {
+        ("hi", "name", "LENGTH_OUT_OF_RANGE"): 1,
+        ("hi", "name", "VALUE_REQUIRED"): 1,
+        ("hi", "age", "NOT_A_NUMBER"): 1,
+        ("hi", "age", "OUT_OF_RANGE"): 1,
+    }
+    assert metrics.field_durations == {}
+
+    metrics.reset()
+    assert metrics.route_results == {}
+
+
+def test_field_timings():
+    metrics = InMemoryMetrics(field_timings=True)
+    app = make_app(metrics)
+
+    with app.test_client() as client:
+        assert client.post("/hi", data={"name": "popopo"}).status_code == 400
+        assert client.post("/hi", data={"name": "popo"}).status_code == 200
+        # fail fast checkers aren't timed by field
+        rv = client.post("/json", json={"name": "popopo"})
+        assert rv.json["error"]["fields"] == {
+            "name": "string length must be between 1 and 5"
+        }
+
+    assert set(metrics.field_durations) == {("hi", "name"), ("hi", "age")}
+    assert metrics.field_durations[("hi", "name")].count == 2
+    assert metrics.route_results[("json_view", "failed")] == 1
+
+
+def test_render_prometheus():
+    metrics = InMemoryMetrics(field_timings=True, buckets=(0.5, 0.001))
+    metrics.record("hi", 0.0001, {"name": 'a "bad"\nname'}, {"name": 0.002})
+    metrics.record("hi", 0.7, None, {"name": 0.0001})
+
+    text = metrics.render_prometheus()
+    lines = text.splitlines()
+
+    assert "# TYPE flask_value_checker_request_duration_seconds histogram" in lines
+    assert (
+        'flask_value_checker_request_duration_seconds_bucket{route="hi",le="0.001"} 1'
+        in lines
+    )
+    assert (
+        'flask_value_checker_request_duration_seconds_bucket{route="hi",le="+Inf"} 2'
+        in lines
+    )
+    assert 'flask_value_checker_request_duration_seconds_count{route="hi"} 2' in lines
+    assert 'flask_value_checker_requests_total{route="hi",result="failed"} 1' in lines
+    assert (
+        'flask_value_checker_field_duration_seconds_bucket{route="hi",field="name",le="0.5"} 2'
+        in lines
+    )
+    assert (
+        'flask_value_checker_field_errors_total{route="hi",field="name",code="a \\"bad\\"\\nname"} 1'
+        in lines
+    )
+    assert text.endswith("\n")
+
+
+def test_custom_sink():
+    class ListSink(MetricsSink):
+        def __init__(self):
+            self.records = []
+
+        def record(self, route, duration, errors, field_durations=None):
+            self.records.append((route, errors, field_durations))
+
+    sink = ListSink()
+    app = make_app(sink)
+    with app.test_client() as client:
+        client.post("/hi", data={"name": "popo"})
+
+    assert sink.records == [("hi", None, None)]
+
+    with pytest.raises(NotImplementedError):
+        MetricsSink().record("hi", 0.1, None)
+
+
+def test_no_metrics():
+    invigilator = Invigilator()
+
+    def view():
+        return "hi"
+
+    wrapper = invigilator.check("POST", checker_text)(view)
+    assert "perf_counter" not in wrapper.__code__.co_names
+
+
+def test_undeclared_fields():
+    metrics = InMemoryMetrics()
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+
+    @app.route("/upload", methods=["POST"])
+    @Invigilator(metrics=metrics).check("POST", checker_text, source="multipart")
+    def upload():
+        return "hi"
+
+    with app.test_client() as client:
+        for i in range(5):
+            data = {"name": "popo", f"random_{i}": "x"}
+            rv = client.post("/upload", data=data, content_type="multipart/form-data")
+            assert rv.status_code == 400
+
+    assert metrics.field_errors == {
+        ("upload", "<undeclared>", "UNDECLARED_PARAMETER"): 5
+    }
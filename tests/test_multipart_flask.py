@@ -0,0 +1,287 @@
+from flask import Flask, request
+from helper import Invigilator, ValueChecker, FlaskValueCheckerValueError
+from flask_value_checker.multipart import MultipartStreamValidator
+from flask_value_checker.restrictions.rtypes.file import sniff_mimetype, SNIFF_SIZE
+
+import io
+import pytest
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator()
+
+checker_text = """
+    name : str/lenlim(1, 5)
+    age : int/lim(18, 99)/optional
+    needed_file : file
+    optional_file : file/optional
+"""
+
+
+@app.route("/upload", methods=["POST"])
+@invigilator.check("POST", checker_text, source="multipart")
+def upload():
+    file_text = request.files["needed_file"].read().decode()
+    return f"hi {request.form['name']}, needed_file contains {file_text}"
+
+
+def test_valid_upload():
+    with app.test_client() as client:
+        rv = client.post(
+            "/upload",
+            data={
+                "name": "popo",
+                "age": "20",
+                "needed_file": (io.BytesIO(b"something"), "sample.txt"),
+            },
+        )
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"hi popo, needed_file contains something"
+
+
+def test_invalid_upload():
+    tests = [
+        ({"name": "popopopo"}, {"name": "string length must be between 1 and 5"}),
+        ({"age": "old"}, {"age": "value old cannot be parsed into an int"}),
+        ({"needed_file": None}, {"needed_file": "file 'needed_file' is missing !"}),
+        ({"name": None}, {"name": "value is required"}),
+        ({"other": "thing"}, {"other": "undeclared parameter"}),
+    ]
+
+    for modification, exp_output in tests:
+        data = {
+            "name": "popo",
+            "needed_file": (io.BytesIO(b"something"), "sample.txt"),
+        }
+        data.update(modification)
+        data = {key: value for key, value in data.items() if value is not None}
+
+        with app.test_client() as client:
+            rv = client.post("/upload", data=data)
+            assert rv.status_code == 400, (rv.data, modification)
+            assert rv.json["error"]["fields"] == exp_output
+
+
+def test_rejects_before_reading_the_whole_body():
+    checker = ValueChecker(checker_text)
+    big_file = b"x" * (10 * 1024 * 1024)
+
+    with app.test_request_context(
+        "/upload",
+        method="POST",
+        data={
+            "name": "popopopo",
+            "needed_file": (io.BytesIO(big_file), "big.txt"),
+        },
+    ):
+        errors = MultipartStreamValidator(checker).validate()
+        assert errors == {"name": "string length must be between 1 and 5"}
+
+        body = request.environ["wsgi.input"]
+        assert body.tell() < len(big_file)
+
+
+def test_field_too_large():
+    checker = ValueChecker(checker_text)
+
+    with app.test_request_context(
+        "/upload",
+        method="POST",
+        content_type="multipart/form-data",
+        data={"name": "x" * 2048},
+    ):
+        validator = MultipartStreamValidator(checker, max_field_size=1024)
+        assert validator.validate() == {"name": "value is too large"}
+
+
+limited_checker_text = """
+    image : file/maxsize(1024)/types(['image/png', 'image/gif'])/number(2)
+"""
+
+png_header = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8
+
+
+@app.route("/limited", methods=["POST"])
+@invigilator.check("POST", limited_checker_text)
+def limited():
+    return "ok"
+
+
+@app.route("/limited_stream", methods=["POST"])
+@invigilator.check("POST", limited_checker_text, source="multipart")
+def limited_stream():
+    return "ok"
+
+
+def test_file_limits():
+    tests = [
+        ([png_header], None),
+        ([png_header, b"GIF89a" + b"\x00" * 10], None),
+        ([png_header + b"\x00" * 2048], "file 'image' must be at most 1024 bytes"),
+        (
+            [b"just some text, not an image"],
+            "file 'image' must be one of the types ['image/png', 'image/gif']",
+        ),
+        ([b"GIF"], "file 'image' must be one of the types ['image/png', 'image/gif']"),
+        (
+            [png_header, png_header, png_header],
+            "at most 2 file(s) can be uploaded for 'image'",
+        ),
+    ]
+
+    for files, exp_output in tests:
+        for url in ["/limited", "/limited_stream"]:
+            data = {
+                "image": [(io.BytesIO(file), f"image_{i}") for i, file in enumerate(files)]
+            }
+
+            with app.test_client() as client:
+                rv = client.post(url, data=data)
+                if exp_output is None:
+                    assert rv.status_code == 200, (rv.data, url)
+                else:
+                    assert rv.status_code == 400, (rv.data, url)
+                    assert rv.json["error"]["fields"] == {"image": exp_output}, url
+
+
+@pytest.mark.parametrize(
+    "head, mimetype",
+    [
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", "audio/wav"),
+        (b"BM" + b"\x00" * 12 + b"\x28\x00\x00\x00", "image/bmp"),
+        (b"BM" + b"\x00" * 12 + b"\x7c\x00\x00\x00", "image/bmp"),
+        (b"BMW is a car maker, not an image", None),
+        (b"12345678WEBP and some text", None),
+        (b"12345678WAVE and some text", None),
+    ],
+)
+def test_sniff_mimetype(head, mimetype):
+    assert sniff_mimetype(head + b"\x00" * SNIFF_SIZE) == mimetype
+
+
+def test_unknown_file_type():
+    with pytest.raises(FlaskValueCheckerValueError):
+        ValueChecker("image : file/types(['image/unknown'])")
+
+
+def test_oversized_file_rejected_while_streaming():
+    checker = ValueChecker(limited_checker_text)
+    big_file = png_header + b"x" * (10 * 1024 * 1024)
+
+    with app.test_request_context(
+        "/limited_stream",
+        method="POST",
+        data={"image": (io.BytesIO(big_file), "big.png")},
+    ):
+        errors = MultipartStreamValidator(checker).validate()
+        assert errors == {"image": "file 'image' must be at most 1024 bytes"}
+
+        body = request.environ["wsgi.input"]
+        assert body.tell() < len(big_file)
+
+
+def test_unknown_charset():
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="name"\r\n'
+        b"Content-Type: text/plain; charset=bogus-xyz\r\n\r\n"
+        b"popo\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="needed_file"; filename="a.txt"\r\n'
+        b"Content-Type: text/plain\r\n\r\n"
+        b"something\r\n"
+        b"--boundary--\r\n"
+    )
+    with app.test_client() as client:
+        rv = client.post(
+            "/upload",
+            data=body,
+            content_type="multipart/form-data; boundary=boundary",
+        )
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"hi popo, needed_file contains something"
+
+
+def test_rejected_files_are_closed(monkeypatch):
+    from flask_value_checker import multipart
+
+    opened = []
+
+    def stream_factory(**kwargs):
+        container = io.BytesIO()
+        opened.append(container)
+        return container
+
+    monkeypatch.setattr(multipart, "default_stream_factory", stream_factory)
+    checker = ValueChecker(limited_checker_text)
+
+    with app.test_request_context(
+        "/limited_stream",
+        method="POST",
+        data={
+            "image": [
+                (io.BytesIO(png_header), "small.png"),
+                (io.BytesIO(png_header + b"x" * 2048), "big.png"),
+            ]
+        },
+    ):
+        errors = MultipartStreamValidator(checker).validate()
+        assert errors == {"image": "file 'image' must be at most 1024 bytes"}
+
+    assert len(opened) == 2
+    assert all(container.closed for container in opened)
+
+
+def test_too_many_parts():
+    app = Flask(__name__)
+    invigilator = Invigilator()
+
+    @app.route("/tags", methods=["POST"])
+    @invigilator.check("POST", "tag : list of str", source="multipart")
+    def tags():
+        return "hi"
+
+    @app.route("/few", methods=["POST"])
+    @invigilator.check(
+        "POST", "tag : list of str", source="multipart", multipart={"max_parts": 3}
+    )
+    def few():
+        return "hi"
+
+    with app.test_client() as client:
+        data = {"tag": ["x"] * 5000}
+        rv = client.post("/tags", data=data, content_type="multipart/form-data")
+        assert rv.status_code == 413
+
+        data = {"tag": ["x"] * 3}
+        rv = client.post("/few", data=data, content_type="multipart/form-data")
+        assert rv.status_code == 200
+        data = {"tag": ["x"] * 4}
+        rv = client.post("/few", data=data, content_type="multipart/form-data")
+        assert rv.status_code == 413
+
+
+def test_multipart_options():
+    app = Flask(__name__)
+    invigilator = Invigilator()
+
+    @app.route("/open", methods=["POST"])
+    @invigilator.check(
+        "POST",
+        "name : str",
+        source="multipart",
+        multipart={"allow_undeclared": True, "max_field_size": 5},
+    )
+    def open_view():
+        return request.form["other"]
+
+    with app.test_client() as client:
+        data = {"name": "popo", "other": "thing"}
+        rv = client.post("/open", data=data, content_type="multipart/form-data")
+        assert rv.data == b"thing"
+
+        data = {"name": "popopo"}
+        rv = client.post("/open", data=data, content_type="multipart/form-data")
+        assert rv.json["error"]["fields"] == {"name": "value is too large"}
@@ -0,0 +1,103 @@
+from flask import Flask, request
+from helper import Invigilator, ValueChecker, FlaskValueCheckerSyntaxError
+from flask_value_checker.paths import make_path_tree, resolve_paths
+from werkzeug.datastructures import MultiDict
+
+import pytest
+
+checker_text = """
+    name : str/lenlim(1, 10)
+    address.city : str/lenlim(1, 20)
+    address.geo.lat : float/lim(-90, 90)
+    address.geo.lng : float/lim(-180, 180)/optional
+    address.tags : list of str/count(0, 2)/optional
+"""
+
+valid = {
+    "name": "bob",
+    "address": {"city": "paris", "geo": {"lat": 48.8, "lng": 2.3}, "tags": ["a"]},
+}
+
+app = Flask(__name__)
+app.config["TESTING"] = True
+
+invigilator = Invigilator()
+
+
+@app.route("/json", methods=["POST"])
+@invigilator.check("POST", checker_text, source="json")
+def json_view():
+    return request.get_json()["address"]["city"]
+
+
+def test_path_tree():
+    assert make_path_tree(["a", "b"]) is None
+
+    tree = make_path_tree(["a.b", "a.c.d", "a.c", "e"])
+    assert tree == (
+        ("a", None, (("b", "a.b", ()), ("c", "a.c", (("d", "a.c.d", ()),)))),
+    )
+
+    resolved = resolve_paths({"a": {"b": 1, "c": {"d": 2}}, "e": 3}, tree)
+    assert resolved["a.b"] == 1
+    assert resolved["a.c"] == {"d": 2}
+    assert resolved["a.c.d"] == 2
+    assert resolved["e"] == 3
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_nested_json(codegen, fail_fast):
+    checker = ValueChecker(checker_text, codegen=codegen, fail_fast=fail_fast)
+    assert checker.check_for(valid) is None
+
+    def with_address(**changes):
+        return dict(valid, address=dict(valid["address"], **changes))
+
+    tests = [
+        (with_address(city=""), "address.city", "string length"),
+        (with_address(geo={"lat": 100}), "address.geo.lat", "between"),
+        (with_address(geo=None), "address.geo.lat", "value is required"),
+        (dict(valid, address="paris"), "address.city", "value is required"),
+        (with_address(tags=["a", "b", "c"]), "address.tags", "number of values"),
+    ]
+    for values, key, message_part in tests:
+        errors = checker.check_for(values)
+        assert key in errors, (values, errors)
+        assert message_part in errors[key]
+
+
+def test_dotted_keys_win():
+    checker = ValueChecker("address.city : str/lenlim(1, 5)")
+    assert checker.check_for({"address.city": "paris", "address": {"city": ""}}) is None
+
+
+def test_form_names_are_plain():
+    checker = ValueChecker("address.city : str/lenlim(1, 5)")
+    assert checker.check_for(MultiDict({"address.city": "paris"})) is None
+    assert checker.check_for(MultiDict({"address": "paris"})) == {
+        "address.city": "value is required"
+    }
+
+
+def test_check_many():
+    checker = ValueChecker(checker_text)
+    results = checker.check_many([valid, {"name": "bob", "address": {"city": "x"}}])
+    assert results[0] is None
+    assert list(results[1]) == ["address.geo.lat"]
+
+
+def test_syntax():
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        ValueChecker("address. : str", use_cache=False)
+
+
+def test_flask():
+    with app.test_client() as client:
+        rv = client.post("/json", json=valid)
+        assert rv.status_code == 200, rv.data
+        assert rv.data == b"paris"
+
+        rv = client.post("/json", json={"name": "bob", "address": {"city": "paris"}})
+        assert rv.status_code == 400
+        assert rv.json["error"]["fields"] == {"address.geo.lat": "value is required"}
@@ -0,0 +1,76 @@
+from helper import (
+    validate_csv,
+    validate_ndjson,
+    ValueChecker,
+    FlaskValueCheckerValueError,
+)
+
+import io
+import json
+import pytest
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    lastName : str/optional
+    age : int/lim(18, 99)
+"""
+
+csv_text = """\
+firstName,lastName,age
+Garyashver,Bob,76
+Gary,,76
+Garyashver,Bob
+Garyashver,Bob,"1,000"
+"""
+
+
+def test_csv():
+    errors = list(validate_csv(test_restriction_code, io.StringIO(csv_text)))
+    assert [row_number for row_number, _ in errors] == [3, 4, 5]
+    assert errors[0][1] == {"firstName": "string length must be between 5 and 15"}
+    assert errors[1][1] == {"age": "value is required"}
+    assert list(errors[2][1]) == ["age"]
+
+
+def test_csv_binary_file_chunks():
+    checker = ValueChecker(test_restriction_code)
+    file = io.BytesIO(csv_text.encode("utf-8"))
+
+    for chunk_size in [1, 2, 1000]:
+        file.seek(0)
+        errors = validate_csv(checker, file, chunk_size=chunk_size)
+        assert [row_number for row_number, _ in errors] == [3, 4, 5]
+
+    # the file passed in is left open
+    assert not file.closed
+
+
+def test_csv_path(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text(csv_text.replace(",", ";"))
+
+    errors = list(validate_csv(test_restriction_code, path, delimiter=";"))
+    assert [row_number for row_number, _ in errors] == [3, 4, 5]
+
+
+def test_ndjson():
+    lines = [
+        json.dumps({"firstName": "Garyashver", "age": 76}),
+        json.dumps({"firstName": "Garyashver", "age": 7.5}),
+        "",
+        "not json",
+        json.dumps(["a", "list"]),
+        json.dumps({"firstName": "Garyashver", "age": "20", "lastName": 5}),
+    ]
+    file = io.StringIO("\n".join(lines) + "\n")
+
+    errors = dict(validate_ndjson(test_restriction_code, file, chunk_size=2))
+    assert list(errors) == [2, 4, 5, 6]
+    assert errors[2]["age"].code == "NOT_A_NUMBER"
+    assert errors[4] == {"__row__": "row is not a json object"}
+    assert errors[6] == {"lastName": "value must be a string"}
+
+
+def test_file_fields():
+    with pytest.raises(FlaskValueCheckerValueError):
+        next(validate_csv("avatar : file", io.StringIO("avatar\n")))
@@ -0,0 +1,92 @@
+from helper import ValueChecker, validate_ndjson
+from flask_value_checker import fragments, parallel, register_fragment
+
+import functools
+import io
+import json
+import multiprocessing
+import pickle
+import random
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    lastName : str/optional
+    age : int/lim(18, 99)
+    team : str/accept(["red", "blue", "yellow"])
+"""
+
+
+def make_records(n_records):
+    rng = random.Random(0)
+    values = [None, "Garyashver", "Gary", "red", "pink", "17", "18", "50", "x"]
+    keys = ["firstName", "lastName", "age", "team"]
+    return [{key: rng.choice(values) for key in keys} for _ in range(n_records)]
+
+
+def test_pickle():
+    for codegen in [False, True]:
+        checker = ValueChecker(test_restriction_code, codegen=codegen, fail_fast=True)
+        unpickled = pickle.loads(pickle.dumps(checker))
+
+        assert unpickled.text == checker.text
+        assert unpickled.fail_fast
+        assert (unpickled.generated_check_for is not None) == codegen
+        assert unpickled.check_for({}) == checker.check_for({})
+
+
+def test_pickle_restriction():
+    restriction = ValueChecker(test_restriction_code).checkers["team"]
+    unpickled = pickle.loads(pickle.dumps(restriction))
+
+    assert unpickled.accept_set == restriction.accept_set
+    assert unpickled.check_for({"team": "pink"}) == restriction.check_for(
+        {"team": "pink"}
+    )
+
+
+def test_check_many_processes():
+    checker = ValueChecker(test_restriction_code)
+    records = make_records(1000)
+    expected = checker.check_many(records)
+
+    assert checker.check_many(records, processes=2, chunk_size=64) == expected
+
+    columns = {key: [record[key] for record in records] for key in records[0]}
+    assert checker.check_many(columns, processes=2, chunk_size=100) == expected
+
+
+def test_validate_ndjson_processes():
+    records = make_records(500)
+    file = io.StringIO("".join(json.dumps(record) + "\n" for record in records))
+
+    serial = list(validate_ndjson(test_restriction_code, file, chunk_size=50))
+    file.seek(0)
+    parallel = validate_ndjson(test_restriction_code, file, 50, processes=2)
+
+    assert list(parallel) == serial
+
+
+def test_check_many_spawn(monkeypatch):
+    register_fragment("person", "age : int/lim(18, 99)\nlastName : str/optional")
+    checker = ValueChecker(
+        """
+        firstName : str/lenlim(5, 15)
+        include person
+        team : str/accept(["red", "blue", "yellow"])
+        tags : list of str/lenlim(1, 5)/optional
+        """
+    )
+    records = make_records(200)
+    expected = checker.check_many(records)
+
+    # the workers don't have the fragment registered
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        parallel,
+        "ProcessPoolExecutor",
+        functools.partial(parallel.ProcessPoolExecutor, mp_context=spawn),
+    )
+    try:
+        assert checker.check_many(records, processes=2, chunk_size=64) == expected
+    finally:
+        fragments.registered_fragments.pop("person")
@@ -0,0 +1,119 @@
+"""
+the parser should behave exactly like the original
+(character by character) parser
+"""
+from helper import FlaskValueCheckerSyntaxError
+from flask_value_checker.restrictions.parsing import RestrictionParser
+from legacy_parsing import LegacyRestrictionParser
+
+import random
+import pytest
+
+test_lines = [
+    "",
+    "    ",
+    "    # a comment",
+    "    firstName : str/lenlim(5, 15) # a random comment",
+    "    middleName : str/lenlim(5, inf)/optional",
+    "    someNegativeFloat : float/optional/lim(-inf, 0)",
+    "    team : str/accept([\"red\", 'blue', 'it\\'s \\\\ \"yellow\"'])",
+    "    numbers : str/accept([1, -2, inf])",
+    "    spaced : str / optional  /  lenlim (1, 2)  ",
+    "    firstName : str/lenlim(5, 15",
+    "    firstName : str/lenlim(5 , 15)",
+    "    firstName : str/accept([,])",
+    "    firstName : str/accept([abc)",
+    "    firstName : str/accept([\"abc'])",
+    "    firstName : str/accept(['a\\b'])",
+    "    firstName : str/accept(['a' 'b'])",
+    "    firstName : str/Optional",
+    "    firstName : str/opt ional",
+    "    firstName str",
+    "    123 : str",
+    "    inf : str",
+]
+
+
+STRING_PARAMETER_ERRORS = (
+    "invalid value for parameter to start with `'`",
+    'invalid value for parameter to start with `"`',
+)
+
+
+def parse(Parser, line):
+    try:
+        parser = Parser(line)
+    except FlaskValueCheckerSyntaxError as e:
+        return str(e)
+
+    return (
+        parser.field_name,
+        parser.attrs,
+        parser.is_comment_line,
+        parser.is_empty_line,
+    )
+
+
+@pytest.mark.parametrize("line", test_lines)
+def test_same_as_legacy_parser(line):
+    assert parse(RestrictionParser, line) == parse(LegacyRestrictionParser, line)
+
+
+def test_same_as_legacy_parser_random_lines():
+    rand = random.Random(0)
+    pieces = list(" ab_-019:/()[],'\"\\#$inf") + [
+        "str",
+        "lenlim",
+        "accept",
+        "inf",
+        "'x'",
+        " : ",
+    ]
+
+    for _ in range(5000):
+        line = "".join(rand.choice(pieces) for _ in range(rand.randint(0, 15)))
+        line = "    field : str/" + line
+
+        try:
+            expected = parse(LegacyRestrictionParser, line)
+        except TypeError:
+            # the legacy parser crashes on some lines ending early,
+            # the parser raises a proper syntax error instead
+            with pytest.raises(FlaskValueCheckerSyntaxError):
+                RestrictionParser(line)
+            continue
+
+        if isinstance(expected, str) and expected.startswith(STRING_PARAMETER_ERRORS):
+            # quoted string parameters (i.e. `default('x')`) are new,
+            # the legacy parser rejects them
+            continue
+
+        assert parse(RestrictionParser, line) == expected, line
+
+
+def test_string_parameters():
+    parser = RestrictionParser("    name : str/default('it\\'s me')")
+    assert parser.attrs == [("str", []), ("default", ("it's me",))]
+
+
+def test_decimal_parameters():
+    # decimals are new, the legacy parser rejects them
+    parser = RestrictionParser("    x : float/lim(-0.5, 1.25)/default(1.)")
+    assert parser.attrs == [("float", []), ("lim", (-0.5, 1.25)), ("default", (1.0,))]
+
+    parser = RestrictionParser("    x : str/accept([1.5, 2])")
+    assert parser.attrs == [("str", []), ("accept", ([1.5, 2.0],))]
+
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        RestrictionParser("    x : float/lim(1.5.5, 2)")
+
+    with pytest.raises(FlaskValueCheckerSyntaxError):
+        RestrictionParser("    x : float/lim(1.x, 2)")
+
+
+def test_caret_position():
+    with pytest.raises(FlaskValueCheckerSyntaxError) as e:
+        RestrictionParser("    firstName : str/lenlim(5, 15")
+
+    assert "error character position : 32" in str(e.value)
+    assert "\n" + " " * 32 + "^\n" in str(e.value)
@@ -0,0 +1,144 @@
+from helper import (
+    restrictions,
+    ValueChecker,
+    FlaskValueCheckerValueError,
+)
+from flask_value_checker import register_restriction_type, GenericRestriction
+
+import uuid
+import pytest
+
+
+class UUIDRestriction(GenericRestriction):
+    type_keyword = "uuid"
+    attributes = {"optional": {}}
+
+    def __init_restriction__(self):
+        self.optional = False
+
+    def compile_restriction(self, name, vals):
+        if name == "optional":
+            self.optional = True
+
+    def check_for(self, checking_part):
+        value = checking_part.get(self.parameter, None)
+        if value is None:
+            return self.optional, None if self.optional else "value is required"
+
+        try:
+            uuid.UUID(value)
+        except ValueError:
+            return False, "value must be a uuid"
+        return True, None
+
+
+@pytest.fixture
+def registered_uuid():
+    register_restriction_type(UUIDRestriction)
+    yield
+    del restrictions.restriction_types["uuid"]
+
+
+def test_builtin_types():
+    assert restrictions.get_restriction_type("str") is restrictions.StringRestriction
+    assert restrictions.get_restriction_type("nope") is None
+    assert [c.type_keyword for c in restrictions.get_restriction_classes()][:4] == [
+        "str",
+        "float",
+        "int",
+        "file",
+    ]
+
+
+def test_register(registered_uuid):
+    checker = ValueChecker("id : uuid\nname : str", use_cache=False)
+    assert isinstance(checker.checkers["id"], UUIDRestriction)
+
+    assert checker.check_for({"id": str(uuid.uuid4()), "name": "a"}) is None
+    assert checker.check_for({"id": "nope", "name": "a"}) == {
+        "id": "value must be a uuid"
+    }
+    assert ValueChecker("id : uuid/optional", use_cache=False).check_for({}) is None
+
+
+def test_register_errors(registered_uuid):
+    class OtherUUIDRestriction(UUIDRestriction):
+        pass
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        register_restriction_type(OtherUUIDRestriction)
+
+    # registering the same class again is fine
+    register_restriction_type(UUIDRestriction)
+
+    register_restriction_type(OtherUUIDRestriction, replace=True)
+    assert restrictions.get_restriction_type("uuid") is OtherUUIDRestriction
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        register_restriction_type(object)
+
+    with pytest.raises(FlaskValueCheckerValueError):
+        register_restriction_type(GenericRestriction)
+
+
+def test_unknown_type():
+    with pytest.raises(FlaskValueCheckerValueError, match="unknown value type"):
+        ValueChecker("id : nope", use_cache=False)
+
+
+class FakeEntryPoint:
+    def __init__(self, restriction_class):
+        self.restriction_class = restriction_class
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return self.restriction_class
+
+
+def test_entry_points(monkeypatch):
+    entry_point = FakeEntryPoint(UUIDRestriction)
+    monkeypatch.setattr(restrictions.restrictions, "_entry_points_loaded", False)
+    monkeypatch.setattr(
+        restrictions.restrictions, "iter_entry_points", lambda: [entry_point]
+    )
+
+    try:
+        # known types don't load the entry points
+        ValueChecker("name : str", use_cache=False)
+        assert entry_point.loaded == 0
+
+        checker = ValueChecker("id : uuid", use_cache=False)
+        assert isinstance(checker.checkers["id"], UUIDRestriction)
+        assert entry_point.loaded == 1
+
+        ValueChecker("other_id : uuid", use_cache=False)
+        assert entry_point.loaded == 1
+    finally:
+        restrictions.restriction_types.pop("uuid", None)
+
+
+class BrokenEntryPoint:
+    def load(self):
+        raise ImportError("broken plugin")
+
+
+def test_broken_entry_point(monkeypatch):
+    entry_point = FakeEntryPoint(UUIDRestriction)
+    monkeypatch.setattr(restrictions.restrictions, "_entry_points_loaded", False)
+    monkeypatch.setattr(
+        restrictions.restrictions,
+        "iter_entry_points",
+        lambda: [BrokenEntryPoint(), FakeEntryPoint(int), entry_point],
+    )
+
+    try:
+        with pytest.warns(RuntimeWarning) as warned:
+            checker = ValueChecker("id : uuid", use_cache=False)
+        assert len(warned) == 2
+        assert "broken plugin" in str(warned[0].message)
+        assert isinstance(checker.checkers["id"], UUIDRestriction)
+        assert entry_point.loaded == 1
+        assert restrictions.restrictions._entry_points_loaded
+    finally:
+        restrictions.restriction_types.pop("uuid", None)
@@ -0,0 +1,74 @@
+from helper import ValueChecker, SchemaCache, schema_cache, FlaskValueCheckerSyntaxError
+
+import pytest
+
+test_restriction_code = """
+    firstName : str/lenlim(5, 15)
+    age : int/lim(18, 99)
+"""
+
+
+def test_same_text_shares_checkers():
+    schema_cache.clear()
+    checker_1 = ValueChecker(test_restriction_code)
+    checker_2 = ValueChecker(test_restriction_code)
+
+    assert checker_1.checkers is checker_2.checkers
+    stats = schema_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_normalized_text_shares_checkers():
+    schema_cache.clear()
+    checker_1 = ValueChecker(test_restriction_code)
+    checker_2 = ValueChecker(
+        """
+        # only the indentation and comments differ here
+        firstName : str/lenlim(5, 15)
+
+        age : int/lim(18, 99)
+        """
+    )
+
+    assert checker_1.checkers is checker_2.checkers
+
+
+def test_unindented_text():
+    checker = ValueChecker("firstName : str/lenlim(5, 15)", use_cache=False)
+    assert list(checker.checkers) == ["firstName"]
+
+
+def test_checkers_are_read_only():
+    checker = ValueChecker(test_restriction_code)
+    with pytest.raises(TypeError):
+        checker.checkers["lastName"] = None
+
+
+def test_eviction():
+    cache = SchemaCache(maxsize=2)
+    first = cache.get("a : str")
+    cache.get("b : str")
+    # touch "a", so "b" is the least recently used
+    cache.get("a : str")
+    cache.get("c : str")
+
+    stats = cache.stats()
+    assert stats == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "disk_hits": 0,
+        "size": 2,
+        "maxsize": 2,
+    }
+    assert cache.get("a : str") is first
+
+
+def test_errors_are_not_cached():
+    cache = SchemaCache()
+    for _ in range(2):
+        with pytest.raises(FlaskValueCheckerSyntaxError):
+            cache.get("a : str/lenlim(5, 15")
+
+    assert len(cache) == 0
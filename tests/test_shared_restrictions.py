@@ -0,0 +1,73 @@
+from helper import ValueChecker, restrictions
+
+import gc
+import pickle
+
+
+def test_slots():
+    checker = ValueChecker(
+        """
+        name : str/accept(['a'])
+        age : int/lim(1, 5)
+        height : float
+        avatar : file/optional
+        """,
+        use_cache=False,
+    )
+    for restriction in checker.checkers.values():
+        assert not hasattr(restriction, "__dict__")
+
+    assert checker.checkers["age"].raw_restrictions == [("lim", (1.0, 5.0))]
+
+
+def test_shared_between_schemas():
+    first = ValueChecker("name : str/lenlim(1, 5)\nage : int/lim(1, 10)")
+    second = ValueChecker("name : str/lenlim(1, 5)\nage : int/lim(1, 99)")
+
+    assert first.checkers["name"] is second.checkers["name"]
+    assert first.checkers["age"] is not second.checkers["age"]
+
+    # different lines, same field
+    third = ValueChecker("name :   str/lenlim(1,5) # a comment")
+    assert third.checkers["name"] is first.checkers["name"]
+
+    unshared = ValueChecker("name : str/lenlim(1, 5)", use_cache=False)
+    assert unshared.checkers["name"] is not first.checkers["name"]
+
+
+def test_shared_restrictions_are_freed():
+    shared_restrictions = restrictions.restrictions._shared_restrictions
+    # restrictions only kept alive by garbage from earlier tests
+    gc.collect()
+    size = len(shared_restrictions)
+
+    text = "only_here : str/lenlim(1, 12345)"
+    restriction = restrictions.make_restrictions(text)["only_here"]
+    assert len(shared_restrictions) == size + 1
+
+    del restriction
+    gc.collect()
+    assert len(shared_restrictions) == size
+
+
+def test_pickle_shared():
+    restriction = ValueChecker("name : str/lenlim(1, 5)").checkers["name"]
+    assert pickle.loads(pickle.dumps(restriction)) is restriction
+
+
+def test_acceptfile_not_shared(tmp_path):
+    path = tmp_path / "colors.txt"
+    path.write_text("red\nblue\n")
+    text = f"color : str/acceptfile(['{path}'])"
+    first = ValueChecker(text)
+
+    # another schema, with the same field
+    path.write_text("green\n")
+    second = ValueChecker(text + "\nname : str/optional")
+    lists = ValueChecker(f"colors : list of str/acceptfile(['{path}'])")
+
+    assert second.checkers["color"] is not first.checkers["color"]
+    assert first.check_for({"color": "red"}) is None
+    assert second.check_for({"color": "red"}) is not None
+    assert second.check_for({"color": "green"}) is None
+    assert lists.check_for({"colors": ["green"]}) is None